@@ -0,0 +1,58 @@
+"""add position search index
+
+Revision ID: 4c7e2b91d3a6
+Revises: remove_pay_type_column
+Create Date: 2025-08-04 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "4c7e2b91d3a6"
+down_revision = "remove_pay_type_column"
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(role_description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(required_qualifications, '') || ' ' || "
+    "coalesce(desired_qualifications, '')), 'C')"
+)
+
+# Substring filters in CRUDBase.get_filtered_positions compile to lower(col) LIKE '%x%'
+TRIGRAM_COLUMNS = ["title", "city", "state", "country"]
+
+
+def upgrade() -> None:
+    op.add_column(
+        "positions",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_positions_search_vector", "positions", ["search_vector"], postgresql_using="gin"
+    )
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in TRIGRAM_COLUMNS:
+        op.create_index(
+            f"ix_positions_{column}_trgm",
+            "positions",
+            [sa.text(f"lower({column}) gin_trgm_ops")],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    for column in TRIGRAM_COLUMNS:
+        op.drop_index(f"ix_positions_{column}_trgm", table_name="positions")
+    op.drop_index("ix_positions_search_vector", table_name="positions")
+    op.drop_column("positions", "search_vector")
@@ -0,0 +1,74 @@
+"""add indexes for listing, join and lookup queries
+
+Revision ID: 7d2f5a8c1e93
+Revises: 4c7e2b91d3a6
+Create Date: 2025-08-06 09:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7d2f5a8c1e93"
+down_revision = "4c7e2b91d3a6"
+branch_labels = None
+depends_on = None
+
+# (name, table, expressions, extra create_index kwargs)
+INDEXES = [
+    # Careerforge listing order and keyset seek
+    ("ix_positions_created_at_id", "positions", ["created_at DESC", "id DESC"], {}),
+    # Talenthub listing: WHERE organization_id = ? ORDER BY created_at DESC
+    (
+        "ix_positions_organization_id_created_at",
+        "positions",
+        ["organization_id", "created_at DESC", "id DESC"],
+        {},
+    ),
+    # lower(col) IN (...) filters
+    ("ix_positions_lower_job_category", "positions", ["lower(job_category)"], {}),
+    ("ix_positions_lower_position_type", "positions", ["lower(position_type)"], {}),
+    ("ix_positions_lower_level_of_experience", "positions", ["lower(level_of_experience)"], {}),
+    # Organization name filter: lower(name) LIKE '%x%'
+    (
+        "ix_organizations_name_trgm",
+        "organizations",
+        ["lower(name) gin_trgm_ops"],
+        {"postgresql_using": "gin"},
+    ),
+    # Sector counts only group organizations that have a sector
+    (
+        "ix_organizations_sector_focus",
+        "organizations",
+        ["sector_focus"],
+        {"postgresql_where": sa.text("sector_focus IS NOT NULL")},
+    ),
+    # Stage lookups: WHERE user_id = ? AND job_id IN (...)
+    ("ix_tracked_jobs_user_id_job_id", "tracked_jobs", ["user_id", "job_id"], {}),
+    # Milestones: WHERE user_id = ? ORDER BY created_at
+    ("ix_milestones_user_id_created_at", "milestones", ["user_id", "created_at"], {}),
+    ("ix_experiences_user_id", "experiences", ["user_id"], {}),
+    ("ix_user_files_user_id_file_name", "user_files", ["user_id", "file_name"], {}),
+    ("ix_base_users_provider_id", "base_users", ["provider_id"], {}),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction, but it keeps writes flowing on live tables
+    with op.get_context().autocommit_block():
+        for name, table, expressions, kwargs in INDEXES:
+            op.create_index(
+                name,
+                table,
+                [sa.text(expression) for expression in expressions],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **kwargs,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -5,13 +5,19 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 from app.db.crud import CRUDBase
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.models.user import UserCareerforge, UserFiles, UserTalenthub
-from app.schemas.file_uploads import GetFilesResponse, S3DownloadPayload, S3UploadPayload
-from app.services.s3_services import s3_services
-from app.services.user import get_active_user
-from app.utils.exceptions import S3Exception
+from app.schemas.file_uploads import (
+    GetFilesResponse,
+    S3BatchDownloadPayload,
+    S3DownloadPayload,
+    S3UploadPayload,
+)
+from app.services.s3_services import async_s3_services
+from app.services.user import get_active_read_user, get_active_user
+from app.utils.exceptions import S3Exception, ServiceUnavailableException
 from app.utils.image_utils import crop_image_smart_dlib
+from app.utils.responses import ORJSONResponse
 from core.config import settings
 from core.constants import constants, error_messages
 from core.logger import logger
@@ -42,7 +48,7 @@ async def upload_profile_picture(
         image_extension = "png"  # We're converting all images to png
         object_key = f"{current_user.id}{constants.PROFILE_IMAGE_NAME}.{image_extension}"
 
-        s3_services.upload_file_content(
+        await async_s3_services.upload_file_content(
             bucket_name=settings.AWS_S3_BUCKET,
             object_key=object_key,
             file_content=processed_image,
@@ -65,7 +71,7 @@ async def upload_profile_picture(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str("Invalid image file, Face not detected"),
         )
-    except S3Exception as e:
+    except (S3Exception, ServiceUnavailableException) as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         logger.error(f"Error uploading profile picture: {str(e)}")
@@ -74,7 +80,9 @@ async def upload_profile_picture(
 
 @file_router.get("/generate-download-url/user/profile", tags=["s3"])
 async def generate_profile_download_url(
-    current_user_info: tuple[Union[UserCareerforge, UserTalenthub], str] = Depends(get_active_user),
+    current_user_info: tuple[Union[UserCareerforge, UserTalenthub], str] = Depends(
+        get_active_read_user
+    ),
 ):
     try:
         current_user, _ = current_user_info
@@ -84,7 +92,7 @@ async def generate_profile_download_url(
             )
 
         image_extension = "png"  # We assume all profile pictures are PNG
-        download_url = s3_services.generate_presigned_url(
+        download_url = await async_s3_services.generate_presigned_url(
             bucket_name=settings.AWS_S3_BUCKET,
             object_key=current_user.profile_picture_url,
             content_type="image/" + image_extension,
@@ -129,7 +137,7 @@ async def generate_file_upload_url(
 
         logger.info(f"Existing file found: {existing_file is not None}")
 
-        upload_url = s3_services.generate_presigned_url(
+        upload_url = await async_s3_services.generate_presigned_url(
             bucket_name=settings.AWS_S3_BUCKET,
             object_key=file_url,
             content_type=payload.content_type,
@@ -172,7 +180,9 @@ async def generate_file_upload_url(
 @file_router.post("/generate-download-url/user/files", tags=["s3"])
 async def generate_file_download_url(
     payload: S3DownloadPayload,
-    current_user_info: tuple[Union[UserCareerforge, UserTalenthub], str] = Depends(get_active_user),
+    current_user_info: tuple[Union[UserCareerforge, UserTalenthub], str] = Depends(
+        get_active_read_user
+    ),
 ):
     try:
         current_user, _ = current_user_info
@@ -183,7 +193,7 @@ async def generate_file_download_url(
                 detail="File download not supported for Talenthub users",
             )
 
-        download_url = s3_services.generate_presigned_url(
+        download_url = await async_s3_services.generate_presigned_url(
             bucket_name=settings.AWS_S3_BUCKET,
             object_key=payload.object_key,
             content_type=payload.content_type,
@@ -203,8 +213,10 @@ async def generate_file_download_url(
 
 @file_router.get("/user/files", tags=["s3"], response_model=List[GetFilesResponse])
 async def get_user_files(
-    current_user_info: tuple[Union[UserCareerforge, UserTalenthub], str] = Depends(get_active_user),
-    db=Depends(get_db),
+    current_user_info: tuple[Union[UserCareerforge, UserTalenthub], str] = Depends(
+        get_active_read_user
+    ),
+    db=Depends(get_read_db),
 ):
     try:
         current_user, _ = current_user_info
@@ -241,7 +253,7 @@ async def generate_organization_logo_upload_url(
     payload: S3UploadPayload, user=Depends(get_active_user), db=Depends(get_db)
 ):
     try:
-        upload_url = s3_services.generate_presigned_url(
+        upload_url = await async_s3_services.generate_presigned_url(
             operation="put_object",
             object_key=payload.filename,
             content_type=payload.content_type,
@@ -262,7 +274,7 @@ async def generate_organization_logo_upload_url(
 @file_router.post("/generate-download-url/organization", tags=["s3"])
 async def generate_organization_logo_download_url(payload: S3DownloadPayload):
     try:
-        download_url = s3_services.generate_presigned_url(
+        download_url = await async_s3_services.generate_presigned_url(
             operation="get_object",
             object_key=payload.filename,
             content_type=payload.content_type,
@@ -278,3 +290,32 @@ async def generate_organization_logo_download_url(payload: S3DownloadPayload):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=error_messages.INTERNAL_SERVER_ERROR,
         )
+
+
+@file_router.post("/generate-download-url/batch", tags=["s3"])
+async def generate_batch_download_urls(
+    payload: S3BatchDownloadPayload, user=Depends(get_active_read_user)
+):
+    try:
+        download_urls = await async_s3_services.generate_presigned_urls(
+            bucket_name=settings.AWS_S3_BUCKET,
+            object_keys=payload.object_keys,
+            expiration=constants.PRESIGNED_URL_EXPIRATION,
+        )
+        failed_keys = [
+            object_key
+            for object_key in dict.fromkeys(payload.object_keys)
+            if object_key and object_key not in download_urls
+        ]
+        return ORJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={"download_urls": download_urls, "failed_keys": failed_keys},
+        )
+    except S3Exception as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        logger.error(f"Failed to generate batch download URLs: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=error_messages.INTERNAL_SERVER_ERROR,
+        )
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Response, status
+
+from app.db.pool_metrics import pool_stats
+from app.utils.cache_utils import position_cache
+from app.utils.metrics import render_metrics
+from app.utils.responses import ORJSONResponse
+from app.utils.security import verify_internal_token
+
+# Served at the root, where Prometheus scrapes by default
+metrics_router = APIRouter(include_in_schema=False, dependencies=[Depends(verify_internal_token)])
+internal_router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(verify_internal_token)],
+)
+
+
+@internal_router.get("/metrics")
+def get_metrics():
+    """Connection pool and cache metrics of the worker that serves the request"""
+    return ORJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={"db_pools": pool_stats(), "position_cache": position_cache.stats()},
+    )
+
+
+@metrics_router.get("/metrics")
+def get_prometheus_metrics():
+    content, media_type = render_metrics()
+    return Response(content=content, media_type=media_type)
@@ -1,15 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from pydantic import UUID4
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.models.user import UserCareerforge
 from app.schemas.milestones import MilestoneCreate, MilestoneResponse, MilestoneUpdate
 from app.services.milestones import MilestonesService
-from app.services.user import get_active_user
+from app.services.user import get_active_read_user, get_active_user
 from app.utils.exceptions import DatabaseException, ResourceNotFound
+from app.utils.responses import ORJSONResponse
 from core.constants import error_messages
 from core.logger import logger
 
@@ -28,9 +27,9 @@ def create_milestone(
         milestone = milestones_service.create_milestone(
             db=db, user_id=current_user.id, milestone_in=milestone_in
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_201_CREATED,
-            content=jsonable_encoder(MilestoneResponse.model_validate(milestone)),
+            content=MilestoneResponse.model_validate(milestone),
         )
     except DatabaseException as e:
         logger.error(f"Failed to create milestone: {e.message}")
@@ -45,15 +44,15 @@ def create_milestone(
 
 @milestone_router.get("/milestones", response_model=list[MilestoneResponse])
 def get_user_milestones(
-    db: Session = Depends(get_db),
-    current_user_info: tuple[UserCareerforge, str] = Depends(get_active_user),
+    db: Session = Depends(get_read_db),
+    current_user_info: tuple[UserCareerforge, str] = Depends(get_active_read_user),
 ):
     current_user, _ = current_user_info
     try:
         milestones = milestones_service.get_user_milestones(db=db, user_id=current_user.id)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
-            content=jsonable_encoder([MilestoneResponse.model_validate(m) for m in milestones]),
+            content=[MilestoneResponse.model_validate(m) for m in milestones],
         )
     except DatabaseException as e:
         logger.error(f"Failed to get milestones: {e.message}")
@@ -69,8 +68,8 @@ def get_user_milestones(
 @milestone_router.get("/milestones/{id}", response_model=MilestoneResponse)
 def get_milestone(
     id: UUID4,
-    db: Session = Depends(get_db),
-    current_user_info: tuple[UserCareerforge, str] = Depends(get_active_user),
+    db: Session = Depends(get_read_db),
+    current_user_info: tuple[UserCareerforge, str] = Depends(get_active_read_user),
 ):
     current_user, _ = current_user_info
     try:
@@ -80,9 +79,9 @@ def get_milestone(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to access this milestone",
             )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
-            content=jsonable_encoder(MilestoneResponse.model_validate(milestone)),
+            content=MilestoneResponse.model_validate(milestone),
         )
     except ResourceNotFound as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
@@ -112,9 +111,9 @@ def update_milestone(
         updated_milestone = milestones_service.update_milestone(
             db=db, id=id, milestone_in=milestone_in
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
-            content=jsonable_encoder(MilestoneResponse.model_validate(updated_milestone)),
+            content=MilestoneResponse.model_validate(updated_milestone),
         )
     except ResourceNotFound as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
@@ -141,9 +140,9 @@ def mark_milestone_completed(
                 detail="Not authorized to update this milestone",
             )
         updated_milestone = milestones_service.mark_milestone_completed(db=db, id=id)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
-            content=jsonable_encoder(MilestoneResponse.model_validate(updated_milestone)),
+            content=MilestoneResponse.model_validate(updated_milestone),
         )
     except ResourceNotFound as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
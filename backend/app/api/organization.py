@@ -1,20 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from pydantic import UUID4
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.models.user import UserTalenthub
 from app.schemas.organization import OrganizationCreate, OrganizationResponse, OrganizationUpdate
 from app.services.organization import organization_service
-from app.services.user import get_active_user
+from app.services.user import get_active_read_user, get_active_user
 from app.utils.exceptions import (
     ConflictException,
     DatabaseException,
     PermissionDeniedException,
     ResourceNotFound,
 )
+from app.utils.responses import ORJSONResponse
 from core.constants import error_messages
 from core.logger import logger
 
@@ -34,12 +34,10 @@ def create_organization(
         organization_data = organization_service.create_organization(
             db=db, organization=organization, user=current_user
         )
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "message": "organization created successfully",
-                "organization": jsonable_encoder(
-                    OrganizationResponse(**jsonable_encoder(organization_data))
-                ),
+                "organization": OrganizationResponse(**jsonable_encoder(organization_data)),
             },
             status_code=status.HTTP_201_CREATED,
         )
@@ -61,14 +59,14 @@ def create_organization(
     "/organization", response_model=OrganizationResponse, tags=["organizations"]
 )
 def get_organization(
-    db: Session = Depends(get_db),
-    current_user_info: tuple[UserTalenthub, str] = Depends(get_active_user),
+    db: Session = Depends(get_read_db),
+    current_user_info: tuple[UserTalenthub, str] = Depends(get_active_read_user),
 ):
     try:
         current_user, _ = current_user_info
         organization_data = organization_service.get_organization(db=db, user=current_user)
-        return JSONResponse(
-            content=jsonable_encoder(OrganizationResponse(**jsonable_encoder(organization_data))),
+        return ORJSONResponse(
+            content=OrganizationResponse(**jsonable_encoder(organization_data)),
             status_code=status.HTTP_200_OK,
         )
     except (ResourceNotFound, DatabaseException, PermissionDeniedException) as e:
@@ -96,10 +94,8 @@ def update_organization(
         updated_organization = organization_service.update_organization(
             db=db, organization_id=id, organization_update=organization_update, user=current_user
         )
-        return JSONResponse(
-            content=jsonable_encoder(
-                OrganizationResponse(**jsonable_encoder(updated_organization))
-            ),
+        return ORJSONResponse(
+            content=OrganizationResponse(**jsonable_encoder(updated_organization)),
             status_code=status.HTTP_200_OK,
         )
     except (ResourceNotFound, DatabaseException, PermissionDeniedException) as e:
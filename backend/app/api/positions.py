@@ -1,10 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.db.session import get_async_read_db, get_db, get_read_db
 from app.models.user import UserCareerforge, UserTalenthub
 from app.schemas.common import PaginationParams
 from app.schemas.positions import (
@@ -16,14 +16,34 @@ from app.schemas.positions import (
 )
 from app.schemas.user import Platform
 from app.services.positions import position_service
-from app.services.user import get_active_user, get_platform
-from app.utils.exceptions import DatabaseException, PermissionDeniedException, ResourceNotFound
+from app.services.user import (
+    get_active_read_user,
+    get_active_user,
+    get_active_user_async,
+    get_platform,
+)
+from app.utils.exceptions import (
+    DatabaseException,
+    PermissionDeniedException,
+    ResourceNotFound,
+    S3Exception,
+    ValidationException,
+)
+from app.utils.pagination import NEXT_CURSOR_HEADER, next_cursor
+from app.utils.responses import ORJSONResponse
 from core.constants import error_messages
 from core.logger import logger
 
 router = APIRouter()
 
 
+def cursor_headers(pagination: PaginationParams, rows: list) -> dict:
+    if not pagination.keyset:
+        return {}
+    cursor = next_cursor(rows, pagination.limit)
+    return {NEXT_CURSOR_HEADER: cursor} if cursor else {}
+
+
 @router.post("/positions", response_model=PositionResponse, tags=["positions"])
 def create_position(
     position_in: PositionCreate,
@@ -37,8 +57,8 @@ def create_position(
             db=db, position_in=position_in, user=current_user, platform=platform
         )
         response_data = position_service.format_position_response(position=position, db=db)
-        return JSONResponse(
-            content=jsonable_encoder(response_data),
+        return ORJSONResponse(
+            content=response_data,
             status_code=status.HTTP_201_CREATED,
         )
     except (ResourceNotFound, DatabaseException) as e:
@@ -66,8 +86,8 @@ def update_position(
             db=db, position_id=id, position_in=position_in, user=current_user, platform=platform
         )
         response_data = position_service.format_position_response(position=position, db=db)
-        return JSONResponse(
-            content=jsonable_encoder(response_data),
+        return ORJSONResponse(
+            content=response_data,
             status_code=status.HTTP_200_OK,
         )
     except (ResourceNotFound, DatabaseException, PermissionDeniedException) as e:
@@ -84,13 +104,35 @@ def update_position(
 @router.post("/positions/careerforge", response_model=list[PositionResponse], tags=["positions"])
 def get_positions_for_careerforge(
     filters: PositionFilters,
-    db: Session = Depends(get_db),
-    current_user_info: tuple[UserCareerforge, str] = Depends(get_active_user),
+    db: Session = Depends(get_read_db),
+    current_user_info: tuple[UserCareerforge, str] = Depends(get_active_read_user),
     platform: Platform = Depends(get_platform),
     pagination: PaginationParams = Depends(),
+    sign_urls: bool = Query(
+        default=False, description="Replace logo and avatar object keys with download URLs"
+    ),
+    stream: bool = Query(
+        default=False, description="Stream the page from a server-side cursor, bypassing the cache"
+    ),
 ):
     try:
         current_user, _ = current_user_info
+        if stream:
+            if pagination.keyset or sign_urls:
+                raise ValidationException(
+                    message="stream cannot be combined with cursor pagination or sign_urls"
+                )
+            return StreamingResponse(
+                position_service.stream_positions_for_careerforge(
+                    db=db,
+                    user=current_user,
+                    filters=filters.model_dump(exclude_none=True, exclude_unset=True),
+                    page=pagination.page,
+                    limit=pagination.limit,
+                ),
+                media_type="application/json",
+            )
+
         positions = position_service.get_positions_for_careerforge(
             db=db,
             user=current_user,
@@ -98,25 +140,23 @@ def get_positions_for_careerforge(
             filters=filters.model_dump(exclude_none=True, exclude_unset=True),
             page=pagination.page,
             limit=pagination.limit,
+            keyset=pagination.keyset,
+            cursor=pagination.cursor,
         )
-        # If positions are already formatted (from cache), use them directly
-        if positions and isinstance(positions[0], dict):
-            return JSONResponse(
-                content=jsonable_encoder(positions),
-                status_code=status.HTTP_200_OK,
-            )
-        # Otherwise, format the SQLAlchemy objects
-        response_data = [
-            position_service.format_position_response(
-                position=position, db=db, include_stage=True, user_id=current_user.id
-            )
-            for position in positions
-        ]
-        return JSONResponse(
-            content=jsonable_encoder(response_data),
+        if sign_urls:
+            positions = position_service.sign_media_urls(positions)
+        return ORJSONResponse(
+            content=positions,
             status_code=status.HTTP_200_OK,
-        )
-    except (ResourceNotFound, DatabaseException) as e:
+            headers=cursor_headers(pagination, positions),
+        )
+    except (
+        ResourceNotFound,
+        DatabaseException,
+        ValidationException,
+        S3Exception,
+        PermissionDeniedException,
+    ) as e:
         logger.error(f"{e.__class__.__name__}: {e.message}")
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
@@ -128,30 +168,30 @@ def get_positions_for_careerforge(
 
 
 @router.get("/positions/talenthub", response_model=list[PositionResponse], tags=["positions"])
-def get_positions_for_talenthub(
-    db: Session = Depends(get_db),
-    current_user_info: tuple[UserTalenthub, str] = Depends(get_active_user),
-    platform: Platform = Depends(get_platform),
+async def get_positions_for_talenthub(
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user_info: tuple[UserTalenthub, str] = Depends(get_active_user_async),
     pagination: PaginationParams = Depends(),
 ):
     try:
         current_user, _ = current_user_info
-        positions = position_service.get_positions_for_talenthub(
+        positions = await position_service.get_positions_for_talenthub_async(
             db=db,
             user=current_user,
-            platform=platform,
             page=pagination.page,
             limit=pagination.limit,
+            keyset=pagination.keyset,
+            cursor=pagination.cursor,
         )
-        response_data = [
-            position_service.format_position_response(position=position, db=db)
-            for position in positions
-        ]
-        return JSONResponse(
-            content=jsonable_encoder(response_data),
+        response_data = await position_service.format_positions_response_async(
+            positions=positions, db=db
+        )
+        return ORJSONResponse(
+            content=response_data,
             status_code=status.HTTP_200_OK,
+            headers=cursor_headers(pagination, positions),
         )
-    except (ResourceNotFound, DatabaseException) as e:
+    except (ResourceNotFound, DatabaseException, ValidationException) as e:
         logger.error(f"{e.__class__.__name__}: {e.message}")
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
@@ -163,17 +203,17 @@ def get_positions_for_talenthub(
 
 
 @router.get("/positions/public/{id}", response_model=PositionResponse, tags=["positions"])
-def get_single_position(
+async def get_single_position(
     id: UUID4,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     try:
-        position = position_service.get_single_position(db=db, position_id=id)
-        response_data = position_service.format_position_response(
-            position=position, db=db, include_stage=False
+        position = await position_service.get_single_position_async(db=db, position_id=id)
+        response_data = await position_service.format_positions_response_async(
+            positions=[position], db=db
         )
-        return JSONResponse(
-            content=jsonable_encoder(response_data),
+        return ORJSONResponse(
+            content=response_data[0],
             status_code=status.HTTP_200_OK,
         )
     except ResourceNotFound as e:
@@ -188,15 +228,14 @@ def get_single_position(
 
 @router.get("/positions/careerforge/count", response_model=SectorCountResponse, tags=["job-roles"])
 def get_sector_job_counts(
-    db: Session = Depends(get_db),
-    current_user_info: tuple[UserCareerforge, str] = Depends(get_active_user),
-    platform: Platform = Depends(get_platform),
+    db: Session = Depends(get_read_db),
+    current_user_info: tuple[UserCareerforge, str] = Depends(get_active_read_user),
 ):
     try:
         current_user, _ = current_user_info
-        counts = position_service.get_sector_job_counts(db=db, user=current_user, platform=platform)
-        return JSONResponse(
-            content=jsonable_encoder(counts),
+        counts = position_service.get_sector_job_counts(db=db, user=current_user)
+        return ORJSONResponse(
+            content=counts,
             status_code=status.HTTP_200_OK,
         )
     except DatabaseException as e:
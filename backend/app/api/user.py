@@ -1,12 +1,12 @@
 from typing import Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from pydantic import UUID4
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.db.session import get_async_read_db, get_db
 from app.models.user import UserCareerforge, UserTalenthub
 from app.schemas.user import (
     CreateExp,
@@ -23,7 +23,12 @@ from app.schemas.user import (
     UserUpdateRequest,
 )
 from app.services.google_auth import google_auth_service
-from app.services.user import get_active_user, get_platform, user_service
+from app.services.user import (
+    get_active_user,
+    get_active_user_async,
+    get_platform,
+    user_service,
+)
 from app.utils.exceptions import (
     ConflictException,
     DatabaseException,
@@ -31,7 +36,8 @@ from app.utils.exceptions import (
     InvalidUserException,
     ResourceNotFound,
 )
-from app.utils.security import create_access_token
+from app.utils.responses import ORJSONResponse
+from app.utils.security import create_access_token, revoke_token
 from core.constants import error_messages
 from core.logger import logger
 
@@ -46,7 +52,7 @@ def login(request: LoginRequest, db: Session = Depends(get_db)):
         ):
             platform = Platform(request.platform)  # Convert string to Platform enum
             access_token = create_access_token(subject=request.email, platform=platform)
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"message": "Successfully Logged In", "access_token": access_token},
                 status_code=status.HTTP_200_OK,
             )
@@ -62,11 +68,16 @@ def login(request: LoginRequest, db: Session = Depends(get_db)):
 
 
 @user_router.post("/auth/logout", tags=["auth"])
-def logout():
+def logout(request: Request):
     try:
-        return JSONResponse(
+        auth_header = request.headers.get("Authorization", "")
+        if auth_header.startswith("Bearer "):
+            revoke_token(auth_header.split(" ")[1])
+        return ORJSONResponse(
             content={"message": "Successfully logged out"}, status_code=status.HTTP_200_OK
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Logout failed: {e}")
         raise HTTPException(
@@ -88,10 +99,10 @@ def create_user(user_data: UserCreateRequest, db: Session = Depends(get_db)):
 
         access_token = create_access_token(subject=user.email, platform=user_data.platform)
 
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "message": "User created successfully",
-                "user": jsonable_encoder(UserResponse(**response_data)),
+                "user": UserResponse(**response_data),
                 "access_token": access_token,
             },
             status_code=status.HTTP_201_CREATED,
@@ -103,9 +114,11 @@ def create_user(user_data: UserCreateRequest, db: Session = Depends(get_db)):
 
 
 @user_router.get("/user/me", response_model=UserResponse, tags=["users"])
-def get_current_user(
+async def get_current_user(
     platform: Platform = Depends(get_platform),
-    current_user_info: tuple[Union[UserCareerforge, UserTalenthub], str] = Depends(get_active_user),
+    current_user_info: tuple[Union[UserCareerforge, UserTalenthub], str] = Depends(
+        get_active_user_async
+    ),
 ):
     try:
         current_user, provider = current_user_info
@@ -114,8 +127,8 @@ def get_current_user(
             "platform": platform,
             "provider": provider,
         }
-        return JSONResponse(
-            content=jsonable_encoder(UserResponse(**response_data)),
+        return ORJSONResponse(
+            content=UserResponse(**response_data),
             status_code=status.HTTP_200_OK,
         )
     except Exception as e:
@@ -144,8 +157,8 @@ def update_user(
             "platform": updated_user.base_user.platform,
         }
 
-        return JSONResponse(
-            content=jsonable_encoder(UserResponse(**response_data)),
+        return ORJSONResponse(
+            content=UserResponse(**response_data),
             status_code=status.HTTP_200_OK,
         )
     except DatabaseException as e:
@@ -203,7 +216,7 @@ def login_google(request_data: GoogleLoginRequest, db: Session = Depends(get_db)
             access_token = create_access_token(
                 subject=user_info["email"], platform=request_data.platform
             )
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"message": "Successfully Logged In", "access_token": access_token},
                 status_code=status.HTTP_200_OK,
             )
@@ -225,7 +238,7 @@ def create_user_google(user_data: GoogleUserCreate, db: Session = Depends(get_db
             user_data = user_service.create_user_in_db_google(db=db, user=user_data)
             access_token = create_access_token(subject=user_data.email)
 
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"message": "User created successfully", "access_token": access_token},
                 status_code=status.HTTP_201_CREATED,
             )
@@ -246,7 +259,7 @@ def create_user_google(user_data: GoogleUserCreate, db: Session = Depends(get_db
 def password_reset_request(request: PasswordResetRequest, db: Session = Depends(get_db)):
     try:
         user_service.password_reset_request(db=db, email=request.email)
-        return JSONResponse(
+        return ORJSONResponse(
             content={"message": "Password reset email sent"}, status_code=status.HTTP_200_OK
         )
     except InvalidUserException as e:
@@ -270,8 +283,8 @@ def update_password(
         updated_user = user_service.update_password(
             db=db, email=request.email, new_password=request.password, platform=platform
         )
-        return JSONResponse(
-            content=jsonable_encoder(UserResponse(**jsonable_encoder(updated_user))),
+        return ORJSONResponse(
+            content=UserResponse(**jsonable_encoder(updated_user)),
             status_code=status.HTTP_200_OK,
         )
     except InvalidUserException as e:
@@ -294,7 +307,7 @@ def add_experience(
     current_user, _ = current_user_info
     try:
         user_service.add_experience(db=db, user=current_user, job_exp=job_exp)
-        return JSONResponse(
+        return ORJSONResponse(
             content={"message": "Experience added successfully"},
             status_code=status.HTTP_201_CREATED,
         )
@@ -310,17 +323,15 @@ def add_experience(
 
 
 @user_router.get("/user/experience", tags=["users"], response_model=list[ExpResponse])
-def get_experiences(
-    db: Session = Depends(get_db),
-    current_user_info: tuple[UserCareerforge, str] = Depends(get_active_user),
+async def get_experiences(
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user_info: tuple[UserCareerforge, str] = Depends(get_active_user_async),
 ):
     try:
         current_user, _ = current_user_info
-        job_exps = user_service.get_experiences(db=db, user=current_user)
-        response = [
-            jsonable_encoder(ExpResponse(**jsonable_encoder(job_exp))) for job_exp in job_exps
-        ]
-        return JSONResponse(content=response, status_code=status.HTTP_200_OK)
+        job_exps = await user_service.get_experiences_async(db=db, user=current_user)
+        response = [ExpResponse(**jsonable_encoder(job_exp)) for job_exp in job_exps]
+        return ORJSONResponse(content=response, status_code=status.HTTP_200_OK)
     except DatabaseException as e:
         logger.error(f"Failed to fetch experiences: {e.message}")
         raise HTTPException(status_code=e.status_code, detail=e.message)
@@ -336,7 +347,7 @@ def get_experiences(
 def delete_experience(exp_id: UUID4, db: Session = Depends(get_db)):
     try:
         user_service.delete_experience(db=db, exp_id=exp_id)
-        return JSONResponse(
+        return ORJSONResponse(
             content={"message": "Experience deleted successfully"},
             status_code=status.HTTP_200_OK,
         )
@@ -358,8 +369,8 @@ def delete_experience(exp_id: UUID4, db: Session = Depends(get_db)):
 def update_experience(exp_id: UUID4, request: UpdateExp, db: Session = Depends(get_db)):
     try:
         updated_exp = user_service.update_experience(db=db, exp_id=exp_id, update_data=request)
-        return JSONResponse(
-            content=jsonable_encoder(ExpResponse(**jsonable_encoder(updated_exp))),
+        return ORJSONResponse(
+            content=ExpResponse(**jsonable_encoder(updated_exp)),
             status_code=status.HTTP_200_OK,
         )
     except ResourceNotFound as e:
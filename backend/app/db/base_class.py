@@ -1,5 +1,5 @@
 from typing import Any
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import DDL, Column, DateTime, Index, event, func
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.ext.declarative import declared_attr
 
@@ -16,3 +16,23 @@ class Base(DeclarativeBase):
 class Timestamp():
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+
+CREATE_PG_TRGM = DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+def trigram_index(name: str, column: Column) -> Index:
+    """GIN trigram index on lower(column), which serves lower(column) LIKE '%x%' filters.
+
+    Migrations create pg_trgm before these indexes; the listener does the same for
+    metadata.create_all.
+    """
+    if not event.contains(column.table, "before_create", CREATE_PG_TRGM):
+        event.listen(column.table, "before_create", CREATE_PG_TRGM)
+    label = f"lower_{column.key}"
+    return Index(
+        name,
+        func.lower(column).label(label),
+        postgresql_using="gin",
+        postgresql_ops={label: "gin_trgm_ops"},
+    )
@@ -1,10 +1,11 @@
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, Iterable, List, Optional, Type, TypeVar, Union
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy import and_, asc, desc, func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, asc, desc, func, literal, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
 
 from app.db.base_class import Base
 from app.utils.exceptions import CustomException, ResourceNotFound
@@ -39,6 +40,14 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def get_multi_by_field(self, db: Session, field: str, value: Any) -> Optional[ModelType]:
         return db.query(self.model).filter(getattr(self.model, field) == value).all()
 
+    def get_multi_by_field_values(
+        self, db: Session, field: str, values: Iterable[Any]
+    ) -> List[ModelType]:
+        values = list(values)
+        if not values:
+            return []
+        return db.query(self.model).filter(getattr(self.model, field).in_(values)).all()
+
     def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[ModelType]:
         return db.query(self.model).offset(skip).limit(limit).all()
 
@@ -71,17 +80,40 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         offset: int = 0,
         sort_field: str = "created_at",
         sort_order: str = "desc",
+        keyset: bool = False,
+        after: Optional[tuple] = None,
     ) -> list[ModelType]:
+        query = db.query(self.model).filter(getattr(self.model, field) == value)
+        if keyset:
+            return self._seek(query, sort_field, sort_order, after).limit(limit).all()
+
         sort_func = desc if sort_order == "desc" else asc
         return (
-            db.query(self.model)
-            .filter(getattr(self.model, field) == value)
-            .order_by(sort_func(getattr(self.model, sort_field)))
+            query.order_by(sort_func(getattr(self.model, sort_field)))
             .limit(limit)
             .offset(offset)
             .all()
         )
 
+    def _seek(
+        self, query: Query, sort_field: str, sort_order: str, after: Optional[tuple] = None
+    ) -> Query:
+        """
+        Keyset pagination: order by (sort_field, id) and start strictly after the
+        `after` row instead of skipping `offset` rows.
+        """
+        sort_column = getattr(self.model, sort_field)
+        descending = sort_order.lower() == "desc"
+        if after is not None:
+            position = tuple_(sort_column, self.model.id)
+            bound = tuple_(
+                literal(after[0], sort_column.type), literal(after[1], self.model.id.type)
+            )
+            query = query.filter(position < bound if descending else position > bound)
+        if descending:
+            return query.order_by(sort_column.desc(), self.model.id.desc())
+        return query.order_by(sort_column.asc(), self.model.id.asc())
+
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         obj_in_data = jsonable_encoder(obj_in)
         db_obj = self.model(**obj_in_data)  # type: ignore
@@ -117,7 +149,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.commit()
         return obj
 
-    def get_filtered_positions(
+    def get_filtered_positions(self, db: Session, **kwargs) -> List[ModelType]:
+        return self.filtered_positions_query(db, **kwargs).all()
+
+    def filtered_positions_query(
         self,
         db: Session,
         filters: dict = {},
@@ -129,9 +164,18 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         offset: int = 0,
         sort_field: str = "created_at",
         sort_order: str = "desc",
-    ) -> List[ModelType]:
+        keyset: bool = False,
+        after: Optional[tuple] = None,
+        search: Optional[str] = None,
+    ) -> Query:
         query = db.query(self.model)
 
+        # Full-text search against the generated search_vector column (GIN indexed)
+        ts_query = None
+        if search and search.strip():
+            ts_query = func.websearch_to_tsquery("english", search)
+            query = query.filter(self.model.search_vector.op("@@")(ts_query))
+
         # Join with organizations if model is provided
         if organization_model:
             query = query.join(
@@ -198,28 +242,87 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 )
             )
 
+        # Keyset pages are ordered by recency only; search results are filtered, not ranked
+        if keyset:
+            return self._seek(query, sort_field, sort_order, after).limit(limit)
+
+        # Rank search results first, then fall back to the requested sort
+        if ts_query is not None:
+            query = query.order_by(func.ts_rank_cd(self.model.search_vector, ts_query).desc())
+
         # Add sorting
         sort_column = getattr(self.model, sort_field)
         if sort_order.lower() == "desc":
             sort_column = sort_column.desc()
         query = query.order_by(sort_column)
 
-        return query.offset(offset).limit(limit).all()
+        return query.offset(offset).limit(limit)
 
     def get_sector_counts(
         self,
         db: Session,
-        platform: str,
         organization_model: Type[ModelType],
         position_model: Type[ModelType],
     ) -> Dict[str, int]:
         counts = (
             db.query(organization_model.sector_focus, func.count(position_model.id).label("count"))
             .join(position_model, organization_model.id == position_model.organization_id)
-            .filter(
-                organization_model.sector_focus.isnot(None), position_model.platform == platform
-            )
+            .filter(organization_model.sector_focus.isnot(None))
             .group_by(organization_model.sector_focus)
             .all()
         )
         return dict(counts)
+
+
+class AsyncCRUDBase(Generic[ModelType]):
+    """Read methods of CRUDBase for an AsyncSession; writes stay on the sync CRUDBase"""
+
+    def __init__(self, *, model: Type[ModelType]):
+        self.model = model
+
+    # Builds on select() as well as on Query, it only uses filter() and order_by()
+    _seek = CRUDBase._seek
+
+    async def get(self, db: AsyncSession, id: str) -> Optional[ModelType]:
+        return await db.get(self.model, id)
+
+    async def get_by_field(self, db: AsyncSession, field: str, value: Any) -> Optional[ModelType]:
+        statement = select(self.model).filter(getattr(self.model, field) == value).limit(1)
+        return (await db.scalars(statement)).first()
+
+    async def get_multi_by_field(self, db: AsyncSession, field: str, value: Any) -> List[ModelType]:
+        statement = select(self.model).filter(getattr(self.model, field) == value)
+        return (await db.scalars(statement)).all()
+
+    async def get_multi_by_field_values(
+        self, db: AsyncSession, field: str, values: Iterable[Any]
+    ) -> List[ModelType]:
+        values = list(values)
+        if not values:
+            return []
+        statement = select(self.model).filter(getattr(self.model, field).in_(values))
+        return (await db.scalars(statement)).all()
+
+    async def get_multi_by_field_sorted(
+        self,
+        db: AsyncSession,
+        field: str,
+        value: Any,
+        limit: int = 5,
+        offset: int = 0,
+        sort_field: str = "created_at",
+        sort_order: str = "desc",
+        keyset: bool = False,
+        after: Optional[tuple] = None,
+    ) -> list[ModelType]:
+        statement = select(self.model).filter(getattr(self.model, field) == value)
+        if keyset:
+            statement = self._seek(statement, sort_field, sort_order, after).limit(limit)
+        else:
+            sort_func = desc if sort_order == "desc" else asc
+            statement = (
+                statement.order_by(sort_func(getattr(self.model, sort_field)))
+                .limit(limit)
+                .offset(offset)
+            )
+        return (await db.scalars(statement)).all()
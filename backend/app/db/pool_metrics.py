@@ -0,0 +1,147 @@
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Recent checkout waits kept per pool for the percentiles
+CHECKOUT_WAIT_SAMPLES = 10000
+
+
+class PoolMetrics:
+    """Checkout latency, churn and pre-ping failures of one engine's connection pool.
+
+    Counters are cumulative since process start. The in-use/idle/overflow gauges are read
+    from the engine's current pool when a snapshot is taken, so they survive
+    ``engine.dispose()`` replacing the pool.
+    """
+
+    def __init__(self, name: str, engine: Engine):
+        self.name = name
+        self.engine = engine
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=CHECKOUT_WAIT_SAMPLES)
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.invalidations = 0
+        self.pre_ping_failures = 0
+
+    def record_checkout(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            self._waits.append(seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.checkout_timeouts += 1
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def _on_close(self, dbapi_connection, connection_record=None) -> None:
+        with self._lock:
+            self.connections_closed += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+            # A failed pre-ping invalidates the connection with a DisconnectionError
+            # before it is handed out; errors raised by queries arrive as DBAPI errors
+            if isinstance(exception, exc.DisconnectionError):
+                self.pre_ping_failures += 1
+
+    def listen(self) -> None:
+        event.listen(self.engine, "connect", self._on_connect)
+        event.listen(self.engine, "close", self._on_close)
+        event.listen(self.engine, "close_detached", self._on_close)
+        event.listen(self.engine, "invalidate", self._on_invalidate)
+
+    def _wait_percentile(self, waits: list, percent: float) -> float:
+        if not waits:
+            return 0.0
+        return waits[min(len(waits) - 1, int(len(waits) * percent / 100))]
+
+    def snapshot(self) -> dict:
+        pool = self.engine.pool
+        with self._lock:
+            waits = sorted(self._waits)
+            average = self.wait_seconds_total / self.checkouts if self.checkouts else 0.0
+            return {
+                "size": pool.size(),
+                "in_use": pool.checkedout(),
+                "idle": pool.checkedin(),
+                # Negative until the pool has opened pool_size connections
+                "overflow": max(pool.overflow(), 0),
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "checkout_wait_ms": {
+                    "avg": average * 1000,
+                    "p50": self._wait_percentile(waits, 50) * 1000,
+                    "p99": self._wait_percentile(waits, 99) * 1000,
+                    "max": self.wait_seconds_max * 1000,
+                },
+                "connections_opened": self.connections_opened,
+                "connections_closed": self.connections_closed,
+                "invalidations": self.invalidations,
+                "pre_ping_failures": self.pre_ping_failures,
+            }
+
+
+class _TimedCheckout:
+    """Times ``Pool.connect()``: the queue wait, any new connection and the pre-ping"""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def connect(self):
+        if self.metrics is None:
+            return super().connect()
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_checkout(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+pool_metrics: dict[str, PoolMetrics] = {}
+
+
+def instrument_engine(name: str, engine: Engine) -> PoolMetrics:
+    """Record metrics for an engine created with one of the instrumented pool classes.
+
+    Pass ``async_engine.sync_engine`` for an AsyncEngine.
+    """
+    metrics = PoolMetrics(name, engine)
+    metrics.listen()
+    engine.pool.metrics = metrics
+    pool_metrics[name] = metrics
+    return metrics
+
+
+def pool_stats() -> dict[str, dict]:
+    return {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
@@ -0,0 +1,67 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils.metrics import DB_STATEMENT_DURATION, DB_STATEMENT_ERRORS, sql_operation
+
+START_TIMES_KEY = "query_stats_start_times"
+
+
+class QueryStats:
+    """SQL statements executed and time spent in the database while tracking was active"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0  # seconds
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Attribute the statements run in this context to a fresh QueryStats.
+
+    Threads started through anyio/starlette (sync routes and dependencies) run with a copy
+    of the context, so their statements are counted too.
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+    conn.info.setdefault(START_TIMES_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get(START_TIMES_KEY)
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+    DB_STATEMENT_DURATION.labels(sql_operation(statement)).observe(elapsed)
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.duration += elapsed
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    DB_STATEMENT_ERRORS.labels(sql_operation(exception_context.statement or "")).inc()
+    # A failed statement never reaches after_cursor_execute
+    conn = exception_context.connection
+    start_times = conn.info.get(START_TIMES_KEY) if conn is not None else None
+    if start_times:
+        start_times.pop()
@@ -1,14 +1,182 @@
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy import create_engine
+import asyncio
+import random
+from typing import AsyncIterator, Optional, Sequence
 
+from anyio import to_thread
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.dml import UpdateBase
+
+import app.db.query_stats  # noqa: F401  (registers the statement timing listeners)
+from app.db.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, instrument_engine
+from app.utils.redis_utils import redis_client
 from core.config import settings
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, pool_size=32, max_overflow=20, pool_pre_ping=True)
-session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+POOL_OPTIONS = {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+}
+
+
+class RoutingSession(Session):
+    """Sends reads to one of ``replicas`` and writes to ``primary``.
+
+    The replica is picked once per session so its reads see one consistent snapshot. Once
+    the session flushes or executes an INSERT/UPDATE/DELETE it stays on the primary, so it
+    reads its own writes. Writes issued as raw ``text()`` cannot be told apart from reads
+    and must not be run through a session with replicas. Without replicas every statement
+    goes to the primary, which keeps ``wrote`` available on primary-only sessions.
+    """
+
+    def __init__(self, primary: Engine, replicas: Sequence[Engine] = (), **kw):
+        super().__init__(**kw)
+        self.primary = primary
+        self.replica = random.choice(replicas) if replicas else None
+        self.wrote = False
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.wrote = True
+        if self.wrote or self.replica is None:
+            return self.primary
+        return self.replica
+
+
+engine = create_engine(
+    settings.SQLALCHEMY_DATABASE_URI, poolclass=InstrumentedQueuePool, **POOL_OPTIONS
+)
+instrument_engine("primary", engine)
+replica_engines = [
+    create_engine(uri, poolclass=InstrumentedQueuePool, **POOL_OPTIONS)
+    for uri in settings.SQLALCHEMY_REPLICA_URIS
+]
+for index, replica_engine in enumerate(replica_engines):
+    instrument_engine(f"replica_{index}", replica_engine)
+
+session_local = sessionmaker(
+    class_=RoutingSession, primary=engine, autocommit=False, autoflush=False
+)
+read_session_local = sessionmaker(
+    class_=RoutingSession, primary=engine, replicas=replica_engines, autoflush=False
+)
+
+
+def async_database_uri(uri: str) -> str:
+    """The same database addressed through the asyncpg driver"""
+    url = make_url(uri)
+    return url.set(drivername=f"{url.get_backend_name()}+asyncpg").render_as_string(
+        hide_password=False
+    )
+
+
+# Async routes await their queries on the event loop instead of holding one of the
+# anyio worker threads for the whole request
+async_engine = create_async_engine(
+    async_database_uri(settings.SQLALCHEMY_DATABASE_URI),
+    poolclass=InstrumentedAsyncQueuePool,
+    **POOL_OPTIONS,
+)
+instrument_engine("primary_async", async_engine.sync_engine)
+async_replica_engines = [
+    create_async_engine(
+        async_database_uri(uri), poolclass=InstrumentedAsyncQueuePool, **POOL_OPTIONS
+    )
+    for uri in settings.SQLALCHEMY_REPLICA_URIS
+]
+for index, replica_engine in enumerate(async_replica_engines):
+    instrument_engine(f"replica_{index}_async", replica_engine.sync_engine)
+
+async_session_local = async_sessionmaker(
+    sync_session_class=RoutingSession,
+    primary=async_engine.sync_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+async_read_session_local = async_sessionmaker(
+    sync_session_class=RoutingSession,
+    primary=async_engine.sync_engine,
+    replicas=[replica.sync_engine for replica in async_replica_engines],
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+READ_YOUR_WRITES_KEY = "read_your_writes_key"
+
+
+def _read_your_writes_key(request: Request) -> Optional[str]:
+    user = getattr(request.state, "user", None)
+    if not replica_engines or not user:
+        return None
+    return f"read_your_writes:{getattr(request.state, 'platform', None)}:{user}"
+
+
+def pin_to_primary(key: str) -> None:
+    """Serve this user's reads from the primary until replicas have caught up on a write"""
+    redis_client.set_with_expiry(key, True, settings.READ_YOUR_WRITES_WINDOW)
 
-def get_db() -> Session:
-    db = session_local()
+
+def pinned_to_primary(request: Request) -> bool:
+    key = _read_your_writes_key(request)
+    return bool(key and redis_client.get(key))
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _pin_after_commit(session: RoutingSession) -> None:
+    # Pinning on commit rather than in the dependency teardown, which FastAPI runs after the
+    # response is sent, means the user's next request already sees the pin
+    key = session.info.get(READ_YOUR_WRITES_KEY)
+    if not (key and session.wrote):
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        pin_to_primary(key)
+    else:
+        # AsyncSession commits run on the event loop, keep the Redis round trip off it
+        loop.run_in_executor(None, pin_to_primary, key)
+
+
+def _routed_session(session_factory, request: Request):
+    db = session_factory()
+    db.info[READ_YOUR_WRITES_KEY] = _read_your_writes_key(request)
+    return db
+
+
+def get_db(request: Request) -> Session:
+    db = _routed_session(session_local, request)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_db(request: Request) -> Session:
+    """get_db for read-only routes: served by a replica unless the user just wrote"""
+    session_factory = read_session_local
+    if pinned_to_primary(request):
+        session_factory = session_local
+    db = _routed_session(session_factory, request)
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with async_session_local() as db:
+        yield db
+
+
+async def get_async_read_db(request: Request) -> AsyncIterator[AsyncSession]:
+    session_factory = async_read_session_local
+    if await to_thread.run_sync(pinned_to_primary, request):
+        session_factory = async_session_local
+    async with _routed_session(session_factory, request) as db:
+        yield db
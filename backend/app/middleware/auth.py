@@ -1,4 +1,5 @@
 import re
+from collections import defaultdict
 
 from fastapi import HTTPException, Request, status
 from fastapi.responses import JSONResponse
@@ -16,6 +17,13 @@ class ValidationMiddleware:
         "url": r"[a-zA-Z0-9\-._~:/?#\[\]@!$&\'()*+,;=]+",
         "email": r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
     }
+    PLACEHOLDER_PATTERN = re.compile(r"\\\{(\w+):(\w+)\\\}")
+
+    def __init__(self):
+        # Compiled once; requests only do a set lookup and at most one regex match per method
+        self.public_routes = self.compile_routes(
+            constants.PUBLIC_API_PATHS + constants.OPENAPI_PATHS
+        )
 
     async def __call__(self, request: Request, call_next):
         try:
@@ -30,8 +38,8 @@ class ValidationMiddleware:
                 if auth_header and auth_header.startswith("Bearer "):
                     token = auth_header.split(" ")[1]
                     email, platform = verify_token(token)
-                    request.app.state.user = email
-                    request.app.state.platform = platform
+                    request.state.user = email
+                    request.state.platform = platform
                 else:
                     return JSONResponse(
                         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -49,34 +57,41 @@ class ValidationMiddleware:
             )
 
     def check_api_accessibility(self, request):
-        api_path = request.url.path
-        method = request.method
-
-        if self._match_path_pattern(method, api_path, constants.PUBLIC_API_PATHS):
-            return False
-        if self._match_path_pattern(method, api_path, constants.OPENAPI_PATHS):
-            return False
-
-        return True
-
-    def _match_path_pattern(self, method, api_path, paths_to_check):
+        return not self._match_path_pattern(request.method, request.url.path, self.public_routes)
+
+    def _match_path_pattern(self, method, api_path, compiled_routes):
+        static_paths, pattern = compiled_routes.get(method, (frozenset(), None))
+        if api_path in static_paths:
+            return True
+        return bool(pattern and pattern.match(api_path))
+
+    @classmethod
+    def compile_routes(cls, paths_to_check):
+        """Group (method, path) entries per method into a set of static paths and one regex.
+
+        Placeholders of the form ``{name:type}`` are replaced with ``PARAM_PATTERNS[type]``.
+        """
+        static_paths = defaultdict(set)
+        dynamic_paths = defaultdict(list)
         for path_method, path_pattern in paths_to_check:
-            if method != path_method:
+            if "{" not in path_pattern:
+                static_paths[path_method].add(path_pattern)
                 continue
 
-            # First escape the entire pattern except for our placeholder
-            regex_pattern = re.escape(path_pattern)
-
-            # Replace the escaped version of our placeholder with UUID pattern
-            regex_pattern = regex_pattern.replace(r"\{id:uuid\}", self.PARAM_PATTERNS["uuid"])
-
-            # Add start and end anchors
-            regex_pattern = f"^{regex_pattern}$"
-
-            try:
-                if re.match(regex_pattern, api_path):
-                    return True
-            except re.error:
-                continue
-
-        return False
+            # First escape the entire pattern, then swap the escaped placeholders back in
+            regex_pattern = cls.PLACEHOLDER_PATTERN.sub(
+                lambda match: cls.PARAM_PATTERNS[match.group(2)], re.escape(path_pattern)
+            )
+            dynamic_paths[path_method].append(regex_pattern)
+
+        return {
+            method: (
+                frozenset(static_paths[method]),
+                (
+                    re.compile(f"^(?:{'|'.join(dynamic_paths[method])})$")
+                    if dynamic_paths[method]
+                    else None
+                ),
+            )
+            for method in static_paths.keys() | dynamic_paths.keys()
+        }
@@ -0,0 +1,28 @@
+import time
+
+from fastapi import Request
+
+from app.utils.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """Records latency and status per route template (not per path, to bound cardinality).
+
+    Requests rejected before routing, e.g. by ValidationMiddleware, have no route and are
+    recorded as ``unmatched``. A StreamingResponse is timed until its headers are sent.
+    """
+
+    async def __call__(self, request: Request, call_next):
+        start = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            route = request.scope.get("route")
+            path = route.path if route is not None else UNMATCHED_ROUTE
+            HTTP_REQUEST_DURATION.labels(request.method, path).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(request.method, path, str(status_code)).inc()
@@ -0,0 +1,21 @@
+from fastapi import Request
+
+from app.db.query_stats import track_queries
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time-Ms"
+
+
+class QueryStatsMiddleware:
+    """Reports the SQL statements a request issued and their total time as response headers.
+
+    Only statements run before the response starts are counted, so the rows a
+    StreamingResponse fetches while streaming its body are not included.
+    """
+
+    async def __call__(self, request: Request, call_next):
+        with track_queries() as stats:
+            response = await call_next(request)
+        response.headers[QUERY_COUNT_HEADER] = str(stats.count)
+        response.headers[QUERY_TIME_HEADER] = f"{stats.duration * 1000:.2f}"
+        return response
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import INTEGER, Boolean, Column, ForeignKey, String
+from sqlalchemy import INTEGER, Boolean, Column, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.db.base_class import Base, Timestamp
@@ -21,3 +21,6 @@ class Experiences(Base, Timestamp):
     end_month = Column(INTEGER, nullable=True)
     end_year = Column(INTEGER, nullable=True)
     logo_url = Column(String(512), nullable=True)
+
+
+Index("ix_experiences_user_id", Experiences.user_id)
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import JSON, Boolean, Column, ForeignKey, String
+from sqlalchemy import JSON, Boolean, Column, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.db.base_class import Base, Timestamp
@@ -17,3 +17,6 @@ class Milestones(Base, Timestamp):
     description = Column(String(2048), nullable=True)
     tasks = Column(JSON, nullable=True)
     is_completed = Column(Boolean, default=False, server_default="false")
+
+
+Index("ix_milestones_user_id_created_at", Milestones.user_id, Milestones.created_at)
@@ -1,9 +1,9 @@
 import uuid
 
-from sqlalchemy import ARRAY, INTEGER, Column, Enum, ForeignKey, String
+from sqlalchemy import ARRAY, INTEGER, Column, Enum, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 
-from app.db.base_class import Base, Timestamp
+from app.db.base_class import Base, Timestamp, trigram_index
 from app.schemas.organization import Sector
 
 
@@ -27,3 +27,13 @@ class Organizations(Base, Timestamp):
     benefits = Column(ARRAY(String), nullable=True)
     sector_focus = Column(Enum(Sector), nullable=True)
     logo_url = Column(String(512), nullable=True)
+
+
+# Sector counts only ever look at organizations with a sector
+Index(
+    "ix_organizations_sector_focus",
+    Organizations.sector_focus,
+    postgresql_where=Organizations.sector_focus.isnot(None),
+)
+# Organization name filter: lower(name) LIKE '%x%'
+trigram_index("ix_organizations_name_trgm", Organizations.name)
@@ -1,9 +1,18 @@
 import uuid
 
-from sqlalchemy import ARRAY, Boolean, Column, Float, ForeignKey, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import ARRAY, Boolean, Column, Computed, Float, ForeignKey, Index, String, func
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred
 
-from app.db.base_class import Base, Timestamp
+from app.db.base_class import Base, Timestamp, trigram_index
+
+# Weighted so title matches rank above description and qualification matches
+POSITION_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(role_description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(required_qualifications, '') || ' ' || "
+    "coalesce(desired_qualifications, '')), 'C')"
+)
 
 
 class Positions(Base, Timestamp):
@@ -36,3 +45,27 @@ class Positions(Base, Timestamp):
     desired_qualifications = Column(String(4096), nullable=True)
     compensation_benefits = Column(String(4096), nullable=True)
     show_recruiter = Column(Boolean, default=False, server_default="false")
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(POSITION_SEARCH_VECTOR, persisted=True), nullable=True)
+    )
+
+
+Index("ix_positions_search_vector", Positions.search_vector, postgresql_using="gin")
+# Substring filters on title and location: lower(col) LIKE '%x%'
+trigram_index("ix_positions_title_trgm", Positions.title)
+trigram_index("ix_positions_city_trgm", Positions.city)
+trigram_index("ix_positions_state_trgm", Positions.state)
+trigram_index("ix_positions_country_trgm", Positions.country)
+# Listing order and keyset seek: ORDER BY created_at DESC, id DESC
+Index("ix_positions_created_at_id", Positions.created_at.desc(), Positions.id.desc())
+# Talenthub listing: WHERE organization_id = ? ORDER BY created_at DESC
+Index(
+    "ix_positions_organization_id_created_at",
+    Positions.organization_id,
+    Positions.created_at.desc(),
+    Positions.id.desc(),
+)
+# Case-insensitive IN filters from CRUDBase.get_filtered_positions
+Index("ix_positions_lower_job_category", func.lower(Positions.job_category))
+Index("ix_positions_lower_position_type", func.lower(Positions.position_type))
+Index("ix_positions_lower_level_of_experience", func.lower(Positions.level_of_experience))
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import JSON, Boolean, Column, ForeignKey, String
+from sqlalchemy import JSON, Boolean, Column, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.db.base_class import Base, Timestamp
@@ -18,3 +18,6 @@ class TrackedJobs(Base, Timestamp):
     notes = Column(String(4096), nullable=True)
     stage = Column(JSON, nullable=True)
     is_favourite = Column(Boolean, nullable=False, server_default="false")
+
+
+Index("ix_tracked_jobs_user_id_job_id", TrackedJobs.user_id, TrackedJobs.job_id)
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import ARRAY, Column, ForeignKey, String
+from sqlalchemy import ARRAY, Column, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import backref, relationship
 
@@ -91,3 +91,8 @@ class UserFiles(Base, Timestamp):
     file_type = Column(String(32), nullable=False)
 
     user = relationship("UserCareerforge", backref="files")
+
+
+# Password reset falls back to looking users up by provider_id
+Index("ix_base_users_provider_id", BaseUser.provider_id)
+Index("ix_user_files_user_id_file_name", UserFiles.user_id, UserFiles.file_name)
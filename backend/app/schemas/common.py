@@ -1,6 +1,19 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
 class PaginationParams(BaseModel):
     page: int = Field(default=0, ge=0, description="Page number, starting from 0")
     limit: int = Field(default=20, ge=1, le=5000, description="Number of items per page")
+    use_cursor: bool = Field(
+        default=False,
+        description="Use keyset pagination; the next cursor is returned in the X-Next-Cursor header",
+    )
+    cursor: Optional[str] = Field(
+        default=None, description="Opaque cursor from a previous X-Next-Cursor header"
+    )
+
+    @property
+    def keyset(self) -> bool:
+        return self.use_cursor or self.cursor is not None
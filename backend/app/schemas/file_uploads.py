@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class S3UploadPayload(BaseModel):
@@ -12,6 +12,9 @@ class S3DownloadPayload(BaseModel):
     content_type: Optional[str] = None
     filename: Optional[str] = None
 
+class S3BatchDownloadPayload(BaseModel):
+    object_keys: list[str] = Field(..., max_length=500)
+
 class GetFilesResponse(BaseModel):
     file_url: str
     file_name: str
@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional
 
-from pydantic import UUID4, BaseModel
+from pydantic import UUID4, BaseModel, Field
 
 from app.schemas.organization import Sector
 
@@ -105,6 +105,11 @@ class PositionUpdate(BaseModel):
 
 
 class PositionFilters(BaseModel):
+    q: Optional[str] = Field(
+        default=None,
+        max_length=256,
+        description="Full-text search over title, description and qualifications, ranked",
+    )
     title: Optional[str] = None
     job_category: Optional[List[Category]] = None
     position_type: Optional[List[PositionType]] = None
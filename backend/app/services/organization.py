@@ -6,6 +6,7 @@ from app.db.crud import CRUDBase
 from app.models.organization import Organizations
 from app.models.user import UserTalenthub
 from app.schemas.organization import OrganizationCreate, OrganizationUpdate
+from app.services.sector_counts import sector_count_service
 from app.utils.exceptions import (
     ConflictException,
     DatabaseException,
@@ -102,12 +103,16 @@ class OrganizationService:
                 "logo_url",
             ]
 
+            previous_sector = organization.sector_focus
             for attr in attributes:
                 value = getattr(organization_update, attr, None)
                 if value is not None:
                     setattr(organization, attr, value)
 
             updated_organization = self.organization_crud.update(db=db, obj_in=organization)
+            if updated_organization.sector_focus != previous_sector:
+                # Every position of the organization moves sector; rebuild on the next read
+                sector_count_service.invalidate()
             return updated_organization
         except (ResourceNotFound, PermissionDeniedException) as e:
             raise e
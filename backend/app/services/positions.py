@@ -1,27 +1,37 @@
+import uuid
 from datetime import datetime
+from typing import Iterator, Optional
 
 from pydantic import UUID4
 from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
 
-from app.db.crud import CRUDBase
+from app.db.crud import AsyncCRUDBase, CRUDBase
 from app.models.organization import Organizations
 from app.models.positions import Positions
 from app.models.tracked_jobs import TrackedJobs
 from app.models.user import UserCareerforge, UserTalenthub
 from app.schemas.positions import PositionCreate, PositionUpdate, SectorCountResponse
 from app.schemas.user import Platform
+from app.services.s3_services import s3_services
+from app.services.sector_counts import sector_count_service
+from app.utils.cache_utils import position_cache
 from app.utils.exceptions import (
     DatabaseException,
     PermissionDeniedException,
     ResourceNotFound,
     ValidationException,
 )
-from app.utils.redis_utils import redis_client
-from core.constants import error_messages
+from app.utils.pagination import decode_cursor
+from app.utils.responses import dumps
+from core.config import settings
+from core.constants import constants, error_messages
 from core.logger import logger
 
+STREAM_CHUNK_SIZE = 500
+
 
 class PositionService:
     def __init__(self):
@@ -29,15 +39,27 @@ class PositionService:
         self.organization_crud = CRUDBase(model=Organizations)
         self.careerforge_user_crud = CRUDBase(model=UserCareerforge)
         self.talent_user_crud = CRUDBase(model=UserTalenthub)
+        self.async_positions_crud = AsyncCRUDBase(model=Positions)
+        self.async_organization_crud = AsyncCRUDBase(model=Organizations)
+        self.async_talent_user_crud = AsyncCRUDBase(model=UserTalenthub)
+
+    def _cache_namespace(self, platform: str) -> str:
+        return f"positions:{platform}"
 
     def _invalidate_position_cache(self, platform: Platform) -> None:
-        """Invalidate all position-related cache entries for a platform"""
-        try:
-            pattern = f"positions:{platform.value}:*"
-            redis_client.delete_pattern(pattern)
-            logger.info(f"Invalidated position cache for platform {platform.value}")
-        except Exception as e:
-            logger.error(f"Failed to invalidate position cache: {e}")
+        """Invalidate all position-related cache entries for a platform
+
+        Bumping the generation makes every existing key unreachable; the old
+        entries are left to age out via their TTL. The new generation is published
+        so every worker also drops its in-process copies.
+        """
+        generation = position_cache.invalidate(self._cache_namespace(platform.value))
+        if generation is None:
+            logger.error(f"Failed to invalidate position cache for platform {platform.value}")
+            return
+        logger.info(
+            f"Invalidated position cache for platform {platform.value} (generation {generation})"
+        )
 
     def create_position(
         self, db: Session, position_in: PositionCreate, user: UserTalenthub, platform: Platform
@@ -88,8 +110,9 @@ class PositionService:
             )
             position = self.positions_crud.create(db=db, obj_in=position_data)
 
-            # Invalidate cache after creating new position
-            self._invalidate_position_cache(platform)
+            # Listings are cached for Careerforge readers, not the Talenthub writer
+            self._invalidate_position_cache(Platform.careerforge)
+            sector_count_service.increment(organization.sector_focus)
 
             return position
         except ResourceNotFound:
@@ -162,8 +185,8 @@ class PositionService:
 
             updated_position = self.positions_crud.update(db=db, obj_in=position)
 
-            # Invalidate cache after updating position
-            self._invalidate_position_cache(platform)
+            # Listings are cached for Careerforge readers, not the Talenthub writer
+            self._invalidate_position_cache(Platform.careerforge)
 
             return updated_position
         except (ResourceNotFound, PermissionDeniedException) as e:
@@ -173,11 +196,27 @@ class PositionService:
             db.rollback()
             raise DatabaseException(message=error_messages.INTERNAL_SERVER_ERROR)
 
-    def _generate_cache_key(self, platform: str, filters: dict, page: int, limit: int) -> str:
-        """Generate a unique cache key based on filters and pagination"""
+    def _generate_cache_key(
+        self,
+        platform: str,
+        filters: dict,
+        page: int,
+        limit: int,
+        keyset: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Optional[str]:
+        """Generate a unique cache key based on filters and pagination
+
+        Returns None when the cache generation cannot be read, so nothing is cached.
+        """
         # Sort filters to ensure consistent cache keys
         sorted_filters = dict(sorted(filters.items()))
-        cache_key = f"positions:{platform}:page_{page}:limit_{limit}"
+        namespace = self._cache_namespace(platform)
+        generation = position_cache.get_generation(namespace)
+        if generation is None:
+            return None
+        page_part = f"cursor_{cursor or 'start'}" if keyset else f"page_{page}"
+        cache_key = f"{namespace}:v{generation}:{page_part}:limit_{limit}"
 
         # Add each filter to the cache key
         for key, value in sorted_filters.items():
@@ -216,102 +255,230 @@ class PositionService:
         filters: dict,
         page: int,
         limit: int = 5000,
+        keyset: bool = False,
+        cursor: Optional[str] = None,
     ) -> list[dict]:
         if not isinstance(user, UserCareerforge):
             raise PermissionDeniedException(
                 message="Only Careerforge users can access this endpoint"
             )
+        after = decode_cursor(cursor) if keyset else None
 
         try:
-            # Generate cache key based on filters and pagination
-            cache_key = self._generate_cache_key(platform.value, filters, page, limit)
-
-            # Try to get cached data
-            cached_data = redis_client.get(cache_key)
-            if cached_data:
-                logger.info(f"Cache hit for key: {cache_key}")
-                return cached_data
+            # The cached page is shared by all users, so it never carries stages
+            cache_key = self._generate_cache_key(
+                platform.value, filters, page, limit, keyset=keyset, cursor=cursor
+            )
 
-            # If not in cache, proceed with database query
-            offset = page * limit
-            filter_copy = filters.copy()
-
-            # Handle organization name filter separately
-            organization_name = filter_copy.pop("organization_name", None)
-
-            # Get organizations matching name filter
-            organization_ids = []
-            if organization_name:
-                # Case-insensitive partial match for organization name
-                organizations = (
-                    db.query(Organizations)
-                    .filter(func.lower(Organizations.name).like(f"%{organization_name.lower()}%"))
-                    .all()
+            def load_page() -> list[dict]:
+                return self._load_position_page(
+                    db=db, filters=filters, page=page, limit=limit, keyset=keyset, after=after
                 )
-                if not organizations:
-                    logger.info("No organizations match the name filter, returning empty result.")
-                    return []
-                organization_ids = [org.id for org in organizations]
-
-            # Handle list type filters
-            list_filters = [
-                "job_category",
-                "position_type",
-                "level_of_experience",
-                "workplace_type",
-                "pay_frequency",
-                "sector_focus",
-            ]
-            for key in list_filters:
-                if key in filter_copy and not isinstance(filter_copy[key], list):
-                    filter_copy[key] = [filter_copy[key]]
 
-            # Handle sector focus filter
-            sector_focus = filter_copy.pop("sector_focus", None)
-
-            # Handle salary range filters
-            min_pays = filter_copy.pop("minimum_pay", None)
-            max_pays = filter_copy.pop("maximum_pay", None)
-
-            # Add organization filter if organization name was provided
-            if organization_ids:
-                filter_copy["organization_id"] = organization_ids
-
-            # Get positions with all filters applied
-            positions = self.positions_crud.get_filtered_positions(
-                db=db,
-                filters=filter_copy,
-                organization_model=Organizations,
-                sector_focus=sector_focus,
-                min_pays=min_pays,
-                max_pays=max_pays,
-                limit=limit,
-                offset=offset,
-                sort_field="created_at",
-                sort_order="desc",
+            # Concurrent misses for the same key, in this worker or any other, wait for a
+            # single load instead of each running it
+            formatted_positions = (
+                position_cache.get_or_compute(cache_key, load_page) if cache_key else load_page()
             )
 
-            # Convert positions to serializable format and cache
-            if positions:
-                # Format each position into a serializable dictionary
-                formatted_positions = [
-                    self.format_position_response(
-                        position=position, db=db, include_stage=True, user_id=user.id
-                    )
-                    for position in positions
-                ]
+            return self.apply_stage_overlay(db=db, positions=formatted_positions, user_id=user.id)
 
-                # Cache the formatted results
-                redis_client.set_with_expiry(cache_key, formatted_positions)
-                logger.info(f"Cached positions with key: {cache_key}")
-                return formatted_positions
+        except Exception as e:
+            logger.error(f"Failed to get positions for careerforge: {e}")
+            raise DatabaseException(message=error_messages.INTERNAL_SERVER_ERROR)
 
-            return positions
+    def stream_positions_for_careerforge(
+        self,
+        db: Session,
+        user: UserCareerforge,
+        filters: dict,
+        page: int,
+        limit: int = 5000,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Return an iterator of JSON bytes for one page, read through a server-side cursor.
 
+        Only ``chunk_size`` rows are formatted and held at a time, so memory does not grow
+        with the page size. The page cache is bypassed because caching needs the full page.
+        """
+        if not isinstance(user, UserCareerforge):
+            raise PermissionDeniedException(
+                message="Only Careerforge users can access this endpoint"
+            )
+        try:
+            query = self._position_page_query(db=db, filters=filters, page=page, limit=limit)
         except Exception as e:
-            logger.error(f"Failed to get positions for careerforge: {e}")
+            logger.error(f"Failed to build positions stream for careerforge: {e}")
             raise DatabaseException(message=error_messages.INTERNAL_SERVER_ERROR)
 
+        return self._stream_positions(db=db, query=query, user_id=user.id, chunk_size=chunk_size)
+
+    def _stream_positions(
+        self, db: Session, query: Optional[Query], user_id: UUID4, chunk_size: int
+    ) -> Iterator[bytes]:
+        yield b"["
+        if query is not None:
+            separator = b""
+            try:
+                rows = db.scalars(query.statement, execution_options={"yield_per": chunk_size})
+                for chunk in rows.partitions():
+                    positions = self.apply_stage_overlay(
+                        db=db,
+                        positions=self.format_positions_response(
+                            positions=chunk, db=db, include_stage=False
+                        ),
+                        user_id=user_id,
+                    )
+                    yield separator + b",".join(dumps(position) for position in positions)
+                    separator = b","
+            except Exception as e:
+                # Headers are already sent; the client sees a truncated body
+                logger.error(f"Failed to stream positions for careerforge: {e}")
+                raise
+        yield b"]"
+
+    def _load_position_page(
+        self,
+        db: Session,
+        filters: dict,
+        page: int,
+        limit: int,
+        keyset: bool = False,
+        after: Optional[tuple] = None,
+    ) -> list[dict]:
+        """Query and format one user-agnostic page of positions"""
+        query = self._position_page_query(
+            db=db, filters=filters, page=page, limit=limit, keyset=keyset, after=after
+        )
+        if query is None:
+            return []
+        return self.format_positions_response(positions=query.all(), db=db, include_stage=False)
+
+    def _position_page_query(
+        self,
+        db: Session,
+        filters: dict,
+        page: int,
+        limit: int,
+        keyset: bool = False,
+        after: Optional[tuple] = None,
+    ) -> Optional[Query]:
+        """Build the query for one user-agnostic page of positions, None when nothing can match"""
+        offset = page * limit
+        filter_copy = filters.copy()
+
+        # Handle organization name filter separately
+        organization_name = filter_copy.pop("organization_name", None)
+
+        # Ranked full-text query over title, description and qualifications
+        search = filter_copy.pop("q", None)
+
+        # Get organizations matching name filter
+        organization_ids = []
+        if organization_name:
+            # Case-insensitive partial match for organization name
+            organizations = (
+                db.query(Organizations)
+                .filter(func.lower(Organizations.name).like(f"%{organization_name.lower()}%"))
+                .all()
+            )
+            if not organizations:
+                logger.info("No organizations match the name filter, returning empty result.")
+                return None
+            organization_ids = [org.id for org in organizations]
+
+        # Handle list type filters
+        list_filters = [
+            "job_category",
+            "position_type",
+            "level_of_experience",
+            "workplace_type",
+            "pay_frequency",
+            "sector_focus",
+        ]
+        for key in list_filters:
+            if key in filter_copy and not isinstance(filter_copy[key], list):
+                filter_copy[key] = [filter_copy[key]]
+
+        # Handle sector focus filter
+        sector_focus = filter_copy.pop("sector_focus", None)
+
+        # Handle salary range filters
+        min_pays = filter_copy.pop("minimum_pay", None)
+        max_pays = filter_copy.pop("maximum_pay", None)
+
+        # Add organization filter if organization name was provided
+        if organization_ids:
+            filter_copy["organization_id"] = organization_ids
+
+        # Positions with all filters applied
+        return self.positions_crud.filtered_positions_query(
+            db=db,
+            filters=filter_copy,
+            organization_model=Organizations,
+            sector_focus=sector_focus,
+            min_pays=min_pays,
+            max_pays=max_pays,
+            limit=limit,
+            offset=offset,
+            sort_field="created_at",
+            sort_order="desc",
+            keyset=keyset,
+            after=after,
+            search=search,
+        )
+
+    def get_stage_map(self, db: Session, user_id: UUID4, job_ids: list) -> dict:
+        """Map job id (as a string) to the user's tracked stage with a single IN query"""
+        if not job_ids:
+            return {}
+        tracked_jobs = (
+            db.query(TrackedJobs.job_id, TrackedJobs.stage)
+            .filter(
+                TrackedJobs.user_id == user_id,
+                TrackedJobs.job_id.in_([uuid.UUID(str(job_id)) for job_id in job_ids]),
+            )
+            .all()
+        )
+        return {str(job_id): stage for job_id, stage in tracked_jobs}
+
+    def apply_stage_overlay(self, db: Session, positions: list[dict], user_id: UUID4) -> list[dict]:
+        """Return copies of shared position payloads carrying the user's stages"""
+        stages = self.get_stage_map(
+            db=db, user_id=user_id, job_ids=[position["id"] for position in positions]
+        )
+        return [
+            {
+                **position,
+                "stage": (
+                    stages[str(position["id"])]
+                    if str(position["id"]) in stages
+                    else dict(constants.BASE_JOB_STAGES)
+                ),
+            }
+            for position in positions
+        ]
+
+    def sign_media_urls(self, positions: list[dict]) -> list[dict]:
+        """Return copies of position payloads with logo and avatar keys replaced by download URLs"""
+        media_fields = ("organization_logo_url", "recruiter_profile_picture_url")
+        download_urls = s3_services.generate_presigned_urls(
+            bucket_name=settings.AWS_S3_BUCKET,
+            object_keys=[position.get(field) for position in positions for field in media_fields],
+            expiration=constants.PRESIGNED_URL_EXPIRATION,
+        )
+        return [
+            {
+                **position,
+                **{
+                    field: download_urls[position[field]]
+                    for field in media_fields
+                    if position.get(field) in download_urls
+                },
+            }
+            for position in positions
+        ]
+
     def get_positions_for_talenthub(
         self,
         db: Session,
@@ -319,9 +486,12 @@ class PositionService:
         platform: Platform,
         page: int,
         limit: int,
+        keyset: bool = False,
+        cursor: Optional[str] = None,
     ) -> list[Positions]:
         if not isinstance(user, UserTalenthub):
             raise PermissionDeniedException(message="Only Talenthub users can access this endpoint")
+        after = decode_cursor(cursor) if keyset else None
         try:
             offset = page * limit
             organization = self.organization_crud.get_by_field(
@@ -339,6 +509,43 @@ class PositionService:
                 offset=offset,
                 sort_field="created_at",
                 sort_order="desc",
+                keyset=keyset,
+                after=after,
+            )
+        except Exception as e:
+            logger.error(f"Failed to get positions for candid: {e}")
+            raise DatabaseException(message=error_messages.INTERNAL_SERVER_ERROR)
+
+    async def get_positions_for_talenthub_async(
+        self,
+        db: AsyncSession,
+        user: UserTalenthub,
+        page: int,
+        limit: int,
+        keyset: bool = False,
+        cursor: Optional[str] = None,
+    ) -> list[Positions]:
+        if not isinstance(user, UserTalenthub):
+            raise PermissionDeniedException(message="Only Talenthub users can access this endpoint")
+        after = decode_cursor(cursor) if keyset else None
+        try:
+            organization = await self.async_organization_crud.get_by_field(
+                db, field="created_by", value=user.id
+            )
+            if not organization:
+                logger.error("organization does not exist. Create organization first.")
+                raise ResourceNotFound(message=error_messages.RESOURCE_NOT_FOUND)
+
+            return await self.async_positions_crud.get_multi_by_field_sorted(
+                db=db,
+                field="organization_id",
+                value=organization.id,
+                limit=limit,
+                offset=page * limit,
+                sort_field="created_at",
+                sort_order="desc",
+                keyset=keyset,
+                after=after,
             )
         except Exception as e:
             logger.error(f"Failed to get positions for candid: {e}")
@@ -351,10 +558,100 @@ class PositionService:
             raise ResourceNotFound(message=error_messages.RESOURCE_NOT_FOUND)
         return position
 
+    async def get_single_position_async(self, db: AsyncSession, position_id: str) -> Positions:
+        position = await self.async_positions_crud.get(db=db, id=position_id)
+        if not position:
+            logger.error(f"position with ID {position_id} not found.")
+            raise ResourceNotFound(message=error_messages.RESOURCE_NOT_FOUND)
+        return position
+
     def format_position_response(
         self, position: Positions, db: Session, include_stage: bool = True, user_id: UUID4 = None
     ) -> dict:
-        organization = self.organization_crud.get(db=db, id=position.organization_id)
+        return self.format_positions_response(
+            positions=[position], db=db, include_stage=include_stage, user_id=user_id
+        )[0]
+
+    def format_positions_response(
+        self,
+        positions: list[Positions],
+        db: Session,
+        include_stage: bool = True,
+        user_id: UUID4 = None,
+    ) -> list[dict]:
+        """Format a page of positions with one keyed query per related table"""
+        if not positions:
+            return []
+
+        organizations = {
+            organization.id: organization
+            for organization in self.organization_crud.get_multi_by_field_values(
+                db=db, field="id", values={position.organization_id for position in positions}
+            )
+        }
+
+        recruiter_ids = {position.user_id for position in positions if position.show_recruiter}
+        recruiters = {
+            recruiter.id: recruiter
+            for recruiter in self.talent_user_crud.get_multi_by_field_values(
+                db=db, field="id", values=recruiter_ids
+            )
+        }
+
+        stages = None
+        if include_stage and user_id:
+            stages = self.get_stage_map(
+                db=db, user_id=user_id, job_ids=[position.id for position in positions]
+            )
+
+        return [
+            self._build_position_response(
+                position=position,
+                organization=organizations[position.organization_id],
+                recruiter=recruiters.get(position.user_id) if position.show_recruiter else None,
+                stages=stages,
+            )
+            for position in positions
+        ]
+
+    async def format_positions_response_async(
+        self, positions: list[Positions], db: AsyncSession
+    ) -> list[dict]:
+        """format_positions_response (without stages) for an AsyncSession"""
+        if not positions:
+            return []
+
+        organizations = {
+            organization.id: organization
+            for organization in await self.async_organization_crud.get_multi_by_field_values(
+                db=db, field="id", values={position.organization_id for position in positions}
+            )
+        }
+        recruiters = {
+            recruiter.id: recruiter
+            for recruiter in await self.async_talent_user_crud.get_multi_by_field_values(
+                db=db,
+                field="id",
+                values={position.user_id for position in positions if position.show_recruiter},
+            )
+        }
+
+        return [
+            self._build_position_response(
+                position=position,
+                organization=organizations[position.organization_id],
+                recruiter=recruiters.get(position.user_id) if position.show_recruiter else None,
+            )
+            for position in positions
+        ]
+
+    def _build_position_response(
+        self,
+        position: Positions,
+        organization: Organizations,
+        recruiter: UserTalenthub = None,
+        stages: dict = None,
+    ) -> dict:
         response_data = {
             "id": position.id,
             "organization_name": organization.name,
@@ -385,8 +682,7 @@ class PositionService:
             "created_at": position.created_at,
         }
 
-        if position.show_recruiter:
-            recruiter = self.talent_user_crud.get(db=db, id=position.user_id)
+        if recruiter:
             response_data.update(
                 {
                     "recruiter_name": f"{recruiter.first_name} {recruiter.last_name}",
@@ -396,44 +692,23 @@ class PositionService:
                 }
             )
 
-        # Add stage information if requested and user_id is provided
-        if include_stage and user_id:
-            applied_job = (
-                db.query(TrackedJobs)
-                .filter(TrackedJobs.job_id == position.id, TrackedJobs.user_id == user_id)
-                .first()
-            )
-
+        # Add stage information when the caller's tracked jobs were loaded
+        if stages is not None:
             response_data["stage"] = (
-                applied_job.stage
-                if applied_job
-                else {
-                    "saved": False,
-                    "applied": False,
-                    "interview-1": False,
-                    "offer": False,
-                    "hired": False,
-                    "past-roles": False,
-                    "ineligible": False,
-                }
+                stages[str(position.id)]
+                if str(position.id) in stages
+                else dict(constants.BASE_JOB_STAGES)
             )
 
         return response_data
 
-    def get_sector_job_counts(
-        self, db: Session, user: UserCareerforge, platform: Platform
-    ) -> SectorCountResponse:
+    def get_sector_job_counts(self, db: Session, user: UserCareerforge) -> SectorCountResponse:
         if not isinstance(user, UserCareerforge):
             raise PermissionDeniedException(
                 message="Only Careerforge users can access sector job counts"
             )
         try:
-            sector_counts = self.positions_crud.get_sector_counts(
-                db=db,
-                platform=platform.value.lower(),
-                organization_model=Organizations,
-                position_model=Positions,
-            )
+            sector_counts = sector_count_service.get_counts(db=db)
             return SectorCountResponse(sectors_count=sector_counts)
         except Exception as e:
             logger.error(f"Failed to get sector job counts: {e}")
@@ -1,14 +1,96 @@
+import functools
+import threading
+import time
+
 import boto3
+from anyio import CapacityLimiter, to_thread
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError, PartialCredentialsError
+from cachetools import LRUCache
 
 from app.utils.exceptions import S3Exception
+from app.utils.metrics import S3_ERRORS, S3_REQUEST_DURATION
+from core.config import settings
 from core.constants import error_messages
 from core.logger import logger
 
 
+def create_s3_client():
+    return boto3.client(
+        "s3",
+        endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+        config=Config(max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS),
+    )
+
+
+def _start_s3_call(model, context, **kwargs):
+    context["metrics_operation"] = model.name
+    context["metrics_start"] = time.perf_counter()
+
+
+def _finish_s3_call(context, failed: bool) -> None:
+    start = context.pop("metrics_start", None)
+    if start is None:
+        return
+    operation = context["metrics_operation"]
+    S3_REQUEST_DURATION.labels(operation).observe(time.perf_counter() - start)
+    if failed:
+        S3_ERRORS.labels(operation).inc()
+
+
+def _s3_call_succeeded(http_response, context, **kwargs):
+    _finish_s3_call(context, failed=http_response.status_code >= 300)
+
+
+def _s3_call_failed(context, **kwargs):
+    _finish_s3_call(context, failed=True)
+
+
+def instrument_s3_client(s3_client) -> None:
+    """Time every API call the client makes, including each part of a multipart upload.
+
+    Presigning is local and makes no call, so presigned URLs are not measured.
+    """
+    events = s3_client.meta.events
+    events.register("before-call.s3", _start_s3_call)
+    events.register("after-call.s3", _s3_call_succeeded)
+    events.register("after-call-error.s3", _s3_call_failed)
+
+
 class S3Services:
-    def __init__(self):
-        self.s3_client = boto3.client("s3")
+    def __init__(self, s3_client=None):
+        self.s3_client = s3_client or create_s3_client()
+        instrument_s3_client(self.s3_client)
+        # (bucket, object_key) -> {expiration: (url, reusable_until)}
+        self._presigned_urls = LRUCache(maxsize=settings.PRESIGNED_URL_CACHE_MAX_SIZE)
+        self._presigned_urls_lock = threading.Lock()
+
+    def _get_cached_presigned_url(self, bucket_name: str, object_key: str, expiration: int):
+        with self._presigned_urls_lock:
+            entries = self._presigned_urls.get((bucket_name, object_key))
+            entry = entries.get(expiration) if entries else None
+        if entry and entry[1] > time.time():
+            return entry[0]
+        return None
+
+    def _cache_presigned_url(self, bucket_name: str, object_key: str, expiration: int, url: str):
+        # Reused for at most PRESIGNED_URL_CACHE_TTL, and never once less than the margin of
+        # the URL's life is left
+        reusable_for = min(
+            expiration - settings.PRESIGNED_URL_CACHE_MARGIN, settings.PRESIGNED_URL_CACHE_TTL
+        )
+        if reusable_for <= 0:
+            return
+        with self._presigned_urls_lock:
+            entries = self._presigned_urls.setdefault((bucket_name, object_key), {})
+            entries[expiration] = (url, time.time() + reusable_for)
+
+    def invalidate_presigned_url(self, bucket_name: str, object_key: str):
+        """Drop this worker's cached download URLs for an object, so its next URL differs from
+        any the browser has cached. Other workers pick up a new URL within
+        PRESIGNED_URL_CACHE_TTL."""
+        with self._presigned_urls_lock:
+            self._presigned_urls.pop((bucket_name, object_key), None)
 
     def generate_presigned_url(
         self,
@@ -20,12 +102,18 @@ class S3Services:
     ):
         try:
             if operation == "get_object":
-                presigned_url = self.s3_client.generate_presigned_url(
-                    ClientMethod=operation,
-                    Params={"Bucket": bucket_name, "Key": object_key},
-                    ExpiresIn=expiration,
-                )
+                presigned_url = self._get_cached_presigned_url(bucket_name, object_key, expiration)
+                if presigned_url is None:
+                    presigned_url = self.s3_client.generate_presigned_url(
+                        ClientMethod=operation,
+                        Params={"Bucket": bucket_name, "Key": object_key},
+                        ExpiresIn=expiration,
+                    )
+                    self._cache_presigned_url(bucket_name, object_key, expiration, presigned_url)
             else:
+                # The client uploads later, straight to S3; URLs cached in between are only
+                # reused until PRESIGNED_URL_CACHE_TTL runs out
+                self.invalidate_presigned_url(bucket_name, object_key)
                 presigned_url = self.s3_client.generate_presigned_post(
                     Bucket=bucket_name,
                     Key=object_key,
@@ -42,9 +130,29 @@ class S3Services:
             logger.error(f"An error occurred: {e}")
             raise S3Exception(error_messages.S3_EXCEPTION["UNKNOWN_ERROR"])
 
+    def generate_presigned_urls(
+        self, bucket_name: str, object_keys: list[str], expiration=3600
+    ) -> dict[str, str]:
+        """Sign download URLs for many objects at once; duplicate and empty keys are skipped.
+
+        A key that fails to sign is logged and left out rather than failing the whole batch.
+        """
+        download_urls = {}
+        for object_key in dict.fromkeys(object_keys):
+            if not object_key:
+                continue
+            try:
+                download_urls[object_key] = self.generate_presigned_url(
+                    bucket_name=bucket_name, object_key=object_key, expiration=expiration
+                )
+            except S3Exception:
+                continue
+        return download_urls
+
     def upload_file(self, bucket_name, file_name: str, object_key: str):
         try:
             self.s3_client.upload_file(file_name, bucket_name, object_key)
+            self.invalidate_presigned_url(bucket_name, object_key)
             logger.info(f"File {file_name} uploaded to {bucket_name}/{object_key}")
         except (NoCredentialsError, PartialCredentialsError):
             logger.error(error_messages.S3_EXCEPTION["AWS_CREDENTIALS_MISSING"])
@@ -63,6 +171,7 @@ class S3Services:
             self.s3_client.put_object(
                 Bucket=bucket_name, Key=object_key, Body=file_content, ContentType=content_type
             )
+            self.invalidate_presigned_url(bucket_name, object_key)
             logger.info(f"File content uploaded to {bucket_name}/{object_key}")
         except (NoCredentialsError, PartialCredentialsError):
             logger.error(error_messages.S3_EXCEPTION["AWS_CREDENTIALS_MISSING"])
@@ -91,6 +200,7 @@ class S3Services:
     def delete_object(self, bucket_name, object_key: str):
         try:
             self.s3_client.delete_object(Bucket=bucket_name, Key=object_key)
+            self.invalidate_presigned_url(bucket_name, object_key)
             logger.info(f"Object {object_key} deleted from {bucket_name}")
         except (NoCredentialsError, PartialCredentialsError):
             logger.error(error_messages.S3_EXCEPTION["AWS_CREDENTIALS_MISSING"])
@@ -103,4 +213,44 @@ class S3Services:
             raise S3Exception(error_messages.S3_EXCEPTION["UNKNOWN_ERROR"])
 
 
+class AsyncS3Services:
+    """Awaitable counterpart of S3Services for async routes.
+
+    Every call runs the blocking boto3 method in a worker thread. Concurrency is capped at the
+    client's connection pool size so threads never queue inside botocore for a connection.
+    """
+
+    def __init__(self, services: S3Services, max_concurrency: int):
+        self.services = services
+        self.max_concurrency = max_concurrency
+        self._limiter = None
+
+    async def _run(self, method, *args, **kwargs):
+        # Created lazily: the limiter binds to the running event loop
+        if self._limiter is None:
+            self._limiter = CapacityLimiter(self.max_concurrency)
+        return await to_thread.run_sync(
+            functools.partial(method, *args, **kwargs), limiter=self._limiter
+        )
+
+    async def generate_presigned_url(self, *args, **kwargs):
+        return await self._run(self.services.generate_presigned_url, *args, **kwargs)
+
+    async def generate_presigned_urls(self, *args, **kwargs):
+        return await self._run(self.services.generate_presigned_urls, *args, **kwargs)
+
+    async def upload_file(self, *args, **kwargs):
+        return await self._run(self.services.upload_file, *args, **kwargs)
+
+    async def upload_file_content(self, *args, **kwargs):
+        return await self._run(self.services.upload_file_content, *args, **kwargs)
+
+    async def download_file(self, *args, **kwargs):
+        return await self._run(self.services.download_file, *args, **kwargs)
+
+    async def delete_object(self, *args, **kwargs):
+        return await self._run(self.services.delete_object, *args, **kwargs)
+
+
 s3_services = S3Services()
+async_s3_services = AsyncS3Services(s3_services, max_concurrency=settings.S3_MAX_POOL_CONNECTIONS)
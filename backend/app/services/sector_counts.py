@@ -0,0 +1,124 @@
+import threading
+import uuid
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.db.crud import CRUDBase
+from app.db.session import session_local
+from app.models.organization import Organizations
+from app.models.positions import Positions
+from app.schemas.organization import Sector
+from app.utils.redis_utils import RedisClient, redis_client
+from core.config import settings
+from core.logger import logger
+
+SECTOR_COUNTS_KEY = "positions:sector_counts"
+RECONCILE_LOCK_KEY = "lock:positions:sector_counts:reconcile"
+# Marks a built hash, so "no positions yet" is not mistaken for a missing hash
+BUILT_FIELD = "_built"
+
+
+def sector_label(sector) -> str:
+    """The response label of a sector given as a Sector, its name or its value"""
+    if isinstance(sector, Sector):
+        return sector.value
+    return Sector[sector].value if sector in Sector.__members__ else Sector(sector).value
+
+
+class SectorCountService:
+    """Job counts per organization sector kept in a Redis hash, so reads are O(sectors).
+
+    Writers adjust a sector with HINCRBY after their commit, but only while the hash
+    exists; a missing hash is rebuilt from the database by the next read. The reconciler
+    rebuilds it from scratch every ``reconcile_interval`` seconds (once across all
+    workers), and the hash expires after two intervals, so an increment lost to a crash or
+    to a concurrent rebuild only skews the counts until the next rebuild.
+    """
+
+    def __init__(self, redis: RedisClient, reconcile_interval: int):
+        self.redis = redis
+        self.reconcile_interval = reconcile_interval
+        self.positions_crud = CRUDBase(model=Positions)
+        self._stopping = threading.Event()
+        self._reconciler: Optional[threading.Thread] = None
+
+    def get_counts(self, db: Session) -> dict[str, int]:
+        counts = self.redis.get_hash_counters(SECTOR_COUNTS_KEY)
+        if counts is None:
+            return self.rebuild(db)
+        return {
+            sector: count for sector, count in counts.items() if sector != BUILT_FIELD and count > 0
+        }
+
+    def rebuild(self, db: Session) -> dict[str, int]:
+        counts = {
+            sector_label(sector): count
+            for sector, count in self.positions_crud.get_sector_counts(
+                db=db, organization_model=Organizations, position_model=Positions
+            ).items()
+        }
+        self.redis.replace_hash_counters(
+            SECTOR_COUNTS_KEY, {**counts, BUILT_FIELD: 1}, self.reconcile_interval * 2
+        )
+        return counts
+
+    def increment(self, sector, amount: int = 1) -> None:
+        if sector is None:
+            return
+        self.redis.incr_hash_counter_if_exists(SECTOR_COUNTS_KEY, sector_label(sector), amount)
+
+    def invalidate(self) -> None:
+        """Drop the counts so the next read rebuilds them"""
+        self.redis.delete(SECTOR_COUNTS_KEY)
+
+    def reconcile(self, db: Session) -> dict[str, int]:
+        """Rebuild the counts from scratch, returning the correction applied per sector"""
+        cached = self.redis.get_hash_counters(SECTOR_COUNTS_KEY) or {}
+        cached.pop(BUILT_FIELD, None)
+        counts = self.rebuild(db)
+        drift = {
+            sector: counts.get(sector, 0) - cached.get(sector, 0)
+            for sector in set(counts) | set(cached)
+            if counts.get(sector, 0) != cached.get(sector, 0)
+        }
+        if cached and drift:
+            logger.warning(f"Corrected sector count drift: {drift}")
+        return drift
+
+    def _reconcile_periodically(self) -> None:
+        while not self._stopping.wait(self.reconcile_interval):
+            # Never released: the lock expiring is what lets the next interval run. Redis
+            # rejects a non-positive EX, which would make acquire_lock fail open
+            if not self.redis.acquire_lock(
+                RECONCILE_LOCK_KEY, uuid.uuid4().hex, max(1, self.reconcile_interval - 1)
+            ):
+                continue
+            # The primary: a lagging replica would overwrite increments for newer commits
+            db = session_local()
+            try:
+                self.reconcile(db)
+            except Exception as e:
+                logger.error(f"Failed to reconcile sector counts: {e}")
+            finally:
+                db.close()
+
+    def start_reconciler(self) -> None:
+        if self._reconciler is not None and self._reconciler.is_alive():
+            return
+        self._stopping.clear()
+        self._reconciler = threading.Thread(
+            target=self._reconcile_periodically, name="sector-count-reconciler", daemon=True
+        )
+        self._reconciler.start()
+
+    def stop_reconciler(self) -> None:
+        self._stopping.set()
+        if self._reconciler is not None:
+            self._reconciler.join(timeout=5)
+            self._reconciler = None
+
+
+sector_count_service = SectorCountService(
+    redis_client, reconcile_interval=settings.SECTOR_COUNTS_RECONCILE_INTERVAL
+)
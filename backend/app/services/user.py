@@ -2,10 +2,11 @@ from typing import Union
 
 from fastapi import Depends, Request
 from pydantic import UUID4
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.crud import CRUDBase
-from app.db.session import get_db
+from app.db.crud import AsyncCRUDBase, CRUDBase
+from app.db.session import get_async_read_db, get_db, get_read_db
 from app.models.experience import Experiences
 from app.models.user import BaseUser, UserCareerforge, UserTalenthub
 from app.schemas.user import (
@@ -23,6 +24,7 @@ from app.utils.exceptions import (
     ResourceNotFound,
 )
 from app.utils.security import get_password_hash, verify_password
+from app.utils.user_cache import user_cache
 from core.constants import error_messages
 from core.logger import logger
 
@@ -31,17 +33,39 @@ careerforge_user_crud = CRUDBase(model=UserCareerforge)
 talent_user_crud = CRUDBase(model=UserTalenthub)
 exp_crud = CRUDBase(model=Experiences)
 
+async_base_user_crud = AsyncCRUDBase(model=BaseUser)
+async_careerforge_user_crud = AsyncCRUDBase(model=UserCareerforge)
+async_talent_user_crud = AsyncCRUDBase(model=UserTalenthub)
+async_exp_crud = AsyncCRUDBase(model=Experiences)
+
 
 def get_platform(request: Request) -> Platform:
-    platform = request.app.state.platform
+    platform = request.state.platform
     return Platform(platform)
 
 
 def get_active_user(
     request: Request, db: Session = Depends(get_db)
 ) -> tuple[Union[UserCareerforge, UserTalenthub], str]:
-    email = request.app.state.user
-    platform = request.app.state.platform
+    return _resolve_active_user(request=request, db=db)
+
+
+def get_active_read_user(
+    request: Request, db: Session = Depends(get_read_db)
+) -> tuple[Union[UserCareerforge, UserTalenthub], str]:
+    """get_active_user for read routes, resolved on the route's get_read_db session"""
+    return _resolve_active_user(request=request, db=db)
+
+
+def _resolve_active_user(
+    request: Request, db: Session
+) -> tuple[Union[UserCareerforge, UserTalenthub], str]:
+    email = request.state.user
+    platform = request.state.platform
+
+    cached = user_cache.get(db=db, email=email, platform=platform)
+    if cached:
+        return cached
 
     if platform == Platform.careerforge:
         platform_user = careerforge_user_crud.get_by_field(db=db, field="email", value=email)
@@ -53,6 +77,38 @@ def get_active_user(
         logger.error(f"No user found with identifier {email}")
         raise ResourceNotFound(message=error_messages.RESOURCE_NOT_FOUND)
 
+    user_cache.set(email=email, platform=platform, user=platform_user, provider=base_user.provider)
+    return platform_user, base_user.provider
+
+
+async def get_active_user_async(
+    request: Request, db: AsyncSession = Depends(get_async_read_db)
+) -> tuple[Union[UserCareerforge, UserTalenthub], str]:
+    """get_active_user for async read routes, resolved on the route's AsyncSession"""
+    email = request.state.user
+    platform = request.state.platform
+
+    cached = await user_cache.get_async(db=db, email=email, platform=platform)
+    if cached:
+        return cached
+
+    if platform == Platform.careerforge:
+        platform_user = await async_careerforge_user_crud.get_by_field(
+            db=db, field="email", value=email
+        )
+    else:
+        platform_user = await async_talent_user_crud.get_by_field(db=db, field="email", value=email)
+
+    base_user = (
+        await async_base_user_crud.get(db=db, id=platform_user.base_user_id)
+        if platform_user
+        else None
+    )
+    if not base_user:
+        logger.error(f"No user found with identifier {email}")
+        raise ResourceNotFound(message=error_messages.RESOURCE_NOT_FOUND)
+
+    user_cache.set(email=email, platform=platform, user=platform_user, provider=base_user.provider)
     return platform_user, base_user.provider
 
 
@@ -263,6 +319,15 @@ class UserService:
             logger.error(f"Failed to retrieve job experiences: {e}")
             raise DatabaseException(message=error_messages.INTERNAL_SERVER_ERROR)
 
+    async def get_experiences_async(
+        self, db: AsyncSession, user: UserCareerforge
+    ) -> list[Experiences]:
+        try:
+            return await async_exp_crud.get_multi_by_field(db=db, field="user_id", value=user.id)
+        except Exception as e:
+            logger.error(f"Failed to retrieve job experiences: {e}")
+            raise DatabaseException(message=error_messages.INTERNAL_SERVER_ERROR)
+
     def delete_experience(self, db: Session, exp_id: UUID4) -> None:
         try:
             experience = exp_crud.get(db=db, id=exp_id)
@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock
+
+from app.services.s3_services import AsyncS3Services, S3Services
+from app.utils.image_utils import ImageProcessingPool
+from core.constants import constants
+
+API_VERSION = constants.API_VERSION
+
+
+def test_profile_picture_rejected_when_pool_is_full(authorized_client, monkeypatch):
+    pool = ImageProcessingPool(max_workers=1, max_pending=1)
+    pool._pending = pool.max_pending  # as if max_pending jobs were already in flight
+    monkeypatch.setattr("app.utils.image_utils.image_processing_pool", pool)
+
+    response = authorized_client.post(
+        f"{API_VERSION}/upload/profile-picture",
+        files={"file": ("profile.png", b"\x89PNG\r\n\x1a\n", "image/png")},
+    )
+
+    assert response.status_code == 503
+
+
+def mock_s3_services(monkeypatch, sign):
+    s3_client = MagicMock()
+    s3_client.generate_presigned_url.side_effect = sign
+    monkeypatch.setattr(
+        "app.api.file_uploads.async_s3_services",
+        AsyncS3Services(S3Services(s3_client=s3_client), max_concurrency=4),
+    )
+
+
+def test_batch_download_urls_report_keys_that_failed(authorized_client, monkeypatch):
+    def sign(**kwargs):
+        key = kwargs["Params"]["Key"]
+        if key == "logos/broken.png":
+            raise RuntimeError("signing failed")
+        return f"https://bucket.s3.amazonaws.com/{key}?sig=1"
+
+    mock_s3_services(monkeypatch, sign)
+
+    response = authorized_client.post(
+        f"{API_VERSION}/generate-download-url/batch",
+        json={"object_keys": ["logos/a.png", "logos/broken.png", "", "logos/a.png"]},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "download_urls": {"logos/a.png": "https://bucket.s3.amazonaws.com/logos/a.png?sig=1"},
+        "failed_keys": ["logos/broken.png"],
+    }
+
+
+def test_batch_download_urls_unexpected_error(authorized_client, monkeypatch):
+    mock_s3_services(monkeypatch, None)
+    monkeypatch.setattr(
+        S3Services, "generate_presigned_urls", MagicMock(side_effect=RuntimeError("boom"))
+    )
+
+    response = authorized_client.post(
+        f"{API_VERSION}/generate-download-url/batch", json={"object_keys": ["logos/a.png"]}
+    )
+
+    assert response.status_code == 500
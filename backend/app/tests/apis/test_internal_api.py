@@ -0,0 +1,97 @@
+import pytest
+from sqlalchemy import create_engine, exc
+
+from app.db.pool_metrics import InstrumentedQueuePool, instrument_engine, pool_metrics
+from app.tests.conftest import TEST_DATABASE_URL
+from core.config import settings
+from core.constants import constants
+
+API_VERSION = constants.API_VERSION
+TOKEN = "internal-test-token"
+
+
+@pytest.fixture
+def internal_token(monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_METRICS_TOKEN", TOKEN)
+    return TOKEN
+
+
+def test_metrics_disabled_without_token_setting(client, monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_METRICS_TOKEN", None)
+    response = client.get(f"{API_VERSION}/internal/metrics", headers={"X-Internal-Token": "x"})
+    assert response.status_code == 404
+
+
+def test_metrics_rejects_wrong_token(client, internal_token):
+    response = client.get(f"{API_VERSION}/internal/metrics", headers={"X-Internal-Token": "x"})
+    assert response.status_code == 403
+
+    response = client.get(f"{API_VERSION}/internal/metrics")
+    assert response.status_code == 403
+
+
+def test_metrics_report_pools_and_cache(client, internal_token):
+    response = client.get(
+        f"{API_VERSION}/internal/metrics", headers={"X-Internal-Token": internal_token}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data["db_pools"]) >= {"primary", "primary_async"}
+    primary = data["db_pools"]["primary"]
+    assert primary["size"] == settings.DB_POOL_SIZE
+    assert {"in_use", "idle", "overflow", "checkout_wait_ms", "pre_ping_failures"} <= set(primary)
+    assert "l1_hits" in data["position_cache"]
+
+
+def test_pool_metrics_record_checkouts_and_timeouts():
+    engine = create_engine(
+        TEST_DATABASE_URL,
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    metrics = instrument_engine("test", engine)
+    try:
+        with engine.connect():
+            assert metrics.snapshot()["in_use"] == 1
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        # Survives the pool being replaced
+        engine.dispose()
+        with engine.connect():
+            pass
+
+        stats = metrics.snapshot()
+        assert stats["checkouts"] == 2
+        assert stats["checkout_timeouts"] == 1
+        assert stats["in_use"] == 0
+        assert stats["connections_opened"] == 2
+        assert stats["connections_closed"] == 1
+        assert stats["checkout_wait_ms"]["max"] >= stats["checkout_wait_ms"]["p50"]
+    finally:
+        pool_metrics.pop("test")
+        engine.dispose()
+
+
+def test_prometheus_metrics_require_token(client, internal_token):
+    assert client.get("/metrics").status_code == 403
+    assert client.get("/metrics", headers={"Authorization": "Bearer x"}).status_code == 403
+
+
+def test_prometheus_metrics_label_routes_by_template(
+    authorized_client, internal_token, test_milestone
+):
+    authorized_client.get(f"{API_VERSION}/milestones/{test_milestone.id}")
+
+    response = authorized_client.get(
+        "/metrics", headers={"Authorization": f"Bearer {internal_token}"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert f'route="{API_VERSION}/milestones/{{id}}"' in body
+    assert str(test_milestone.id) not in body
+    assert "db_statement_duration_seconds_bucket" in body
+    assert "cache_events_total" in body
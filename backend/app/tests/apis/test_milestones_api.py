@@ -0,0 +1,24 @@
+import pytest
+
+from app.middleware.query_stats import QUERY_COUNT_HEADER, QUERY_TIME_HEADER
+from core.constants import constants
+
+API_VERSION = constants.API_VERSION
+
+
+@pytest.mark.query_budget(3)
+def test_get_milestones_query_budget(authorized_client, test_milestone):
+    # Platform user + base user lookup on a user cache miss, then the milestones
+    response = authorized_client.get(f"{API_VERSION}/milestones")
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    assert float(response.headers[QUERY_TIME_HEADER]) >= 0
+
+
+def test_get_milestone_reuses_cached_user(authorized_client, test_milestone, query_budget):
+    authorized_client.get(f"{API_VERSION}/milestones")
+
+    with query_budget(1) as responses:
+        response = authorized_client.get(f"{API_VERSION}/milestones/{test_milestone.id}")
+    assert response.status_code == 200
+    assert int(responses[0].headers[QUERY_COUNT_HEADER]) == 1
@@ -0,0 +1,71 @@
+import pytest
+
+from app.middleware.auth import ValidationMiddleware
+from app.schemas.user import Platform
+from app.tests.conftest import check_api_accessibility
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_cursor
+from app.utils.security import create_access_token
+from core.constants import constants
+
+API_VERSION = constants.API_VERSION
+CAREERFORGE_POSITIONS = f"{API_VERSION}/positions/careerforge"
+TALENTHUB_POSITIONS = f"{API_VERSION}/positions/talenthub"
+
+# Related rows are bulk loaded per page, so the statement count must not grow with the page
+PAGE_SIZES = [1, 3]
+
+
+@pytest.fixture(scope="function")
+def talenthub_client(client, talenthub_user, monkeypatch):
+    monkeypatch.setattr(ValidationMiddleware, "check_api_accessibility", check_api_accessibility)
+    token = create_access_token(subject=talenthub_user.email, platform=Platform.talenthub)
+    client.headers = {**client.headers, "Authorization": f"Bearer {token}"}
+    yield client
+
+
+def test_keyset_pages_follow_next_cursor(authorized_client, positions):
+    first = authorized_client.post(
+        CAREERFORGE_POSITIONS, params={"use_cursor": True, "limit": 2}, json={}
+    )
+    assert first.status_code == 200
+    cursor = first.headers[NEXT_CURSOR_HEADER]
+
+    last = authorized_client.post(
+        CAREERFORGE_POSITIONS, params={"cursor": cursor, "limit": 2}, json={}
+    )
+    assert last.status_code == 200
+    assert NEXT_CURSOR_HEADER not in last.headers
+
+    ids = [item["id"] for item in first.json() + last.json()]
+    assert ids == [str(position.id) for position in reversed(positions)]
+
+
+def test_offset_pages_carry_no_cursor(authorized_client, positions):
+    response = authorized_client.post(CAREERFORGE_POSITIONS, params={"limit": 2}, json={})
+    assert response.status_code == 200
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+def test_tampered_cursor_rejected(authorized_client, positions):
+    for cursor in ("garbage", encode_cursor("yesterday", positions[0].id)):
+        response = authorized_client.post(CAREERFORGE_POSITIONS, params={"cursor": cursor}, json={})
+        assert response.status_code == 422
+
+
+@pytest.mark.parametrize("limit", PAGE_SIZES)
+def test_careerforge_positions_query_budget(authorized_client, positions, query_budget, limit):
+    # Platform user + base user, then the page, its organizations, recruiters and stages
+    with query_budget(6):
+        response = authorized_client.post(CAREERFORGE_POSITIONS, params={"limit": limit}, json={})
+    assert response.status_code == 200
+    assert len(response.json()) == limit
+
+
+@pytest.mark.parametrize("limit", PAGE_SIZES)
+def test_talenthub_positions_query_budget(talenthub_client, positions, query_budget, limit):
+    # Platform user + base user, the recruiter's organization, then the page, its
+    # organizations and recruiters
+    with query_budget(6):
+        response = talenthub_client.get(TALENTHUB_POSITIONS, params={"limit": limit})
+    assert response.status_code == 200
+    assert len(response.json()) == limit
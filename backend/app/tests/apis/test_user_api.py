@@ -110,3 +110,13 @@ def test_get_experiences(authorized_client, test_user):
 def test_get_public_user_invalid_id(client):
     response = client.get(f"{API_VERSION}/user/public/invalid-uuid")
     assert response.status_code == 422
+
+
+def test_logout_revokes_token(authorized_client):
+    assert authorized_client.get(f"{API_VERSION}/user/me").status_code == 200
+
+    response = authorized_client.post(f"{API_VERSION}/auth/logout")
+    assert response.status_code == 200
+
+    response = authorized_client.get(f"{API_VERSION}/user/me")
+    assert response.status_code == 401
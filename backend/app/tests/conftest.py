@@ -1,21 +1,40 @@
 import json
 import os
+import threading
+from contextlib import contextmanager
 
+import orjson
 import pytest
 from dotenv import load_dotenv
-from fastapi import Request
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.db.base_class import Base
-from app.db.session import get_db
-from app.utils.security import create_access_token, get_password_hash
+from app.db.session import (
+    async_database_uri,
+    get_async_db,
+    get_async_read_db,
+    get_db,
+    get_read_db,
+)
+from app.middleware.auth import ValidationMiddleware
+from app.middleware.query_stats import QUERY_COUNT_HEADER
+from app.utils.cache_utils import position_cache
+from app.utils.responses import dumps
+from app.utils.security import create_access_token, get_password_hash, token_cache
+from app.utils.user_cache import user_cache
 from main import app
 
 load_dotenv(".env.example")
 
+check_api_accessibility = ValidationMiddleware.check_api_accessibility
+
 TEST_DATABASE_URL = os.getenv("SQLALCHEMY_DATABASE_URI")
+# A second, independent instance standing in for a read replica
+TEST_REPLICA_DATABASE_URL = os.getenv("TEST_REPLICA_DATABASE_URL")
 
 
 def save_to_db(db, obj):
@@ -25,6 +44,73 @@ def save_to_db(db, obj):
     return obj
 
 
+class FakeRedisClient:
+    """In-memory stand-in for RedisClient that records reads, expiries and announcements"""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+        self.reads = 0
+        self.published = []
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        self.reads += 1
+        return self.store.get(key)
+
+    def get_with_ttl(self, key):
+        self.reads += 1
+        return self.store.get(key), self.ttls.get(key)
+
+    def set_with_expiry(self, key, value, expiry_seconds=None):
+        # Round-trip like the real client so callers only ever see plain JSON data
+        self.store[key] = orjson.loads(dumps(value))
+        self.ttls[key] = expiry_seconds
+        return True
+
+    def acquire_lock(self, key, token, ttl_seconds):
+        with self._lock:
+            return self.store.setdefault(key, token) == token
+
+    def release_lock(self, key, token):
+        with self._lock:
+            if self.store.get(key) != token:
+                return False
+            del self.store[key]
+            return True
+
+    def get_counter(self, key):
+        self.reads += 1
+        return self.store.setdefault(key, 0)
+
+    def incr(self, key):
+        self.store[key] = self.store.get(key, 0) + 1
+        return self.store[key]
+
+    def publish(self, channel, message):
+        self.published.append(message)
+        return 1
+
+    def get_hash_counters(self, key):
+        return dict(self.store[key]) if key in self.store else None
+
+    def replace_hash_counters(self, key, counters, expiry_seconds):
+        self.store[key] = dict(counters)
+        self.ttls[key] = expiry_seconds
+        return True
+
+    def incr_hash_counter_if_exists(self, key, field, amount=1):
+        if key not in self.store:
+            return None
+        self.store[key][field] = self.store[key].get(field, 0) + amount
+        return self.store[key][field]
+
+
+@pytest.fixture(scope="function")
+def fake_redis_client():
+    return FakeRedisClient()
+
+
 @pytest.fixture(scope="function")
 def db_engine():
     engine = create_engine(TEST_DATABASE_URL)
@@ -34,6 +120,17 @@ def db_engine():
     engine.dispose()
 
 
+@pytest.fixture(scope="function")
+def replica_engine():
+    if not TEST_REPLICA_DATABASE_URL:
+        pytest.skip("TEST_REPLICA_DATABASE_URL is not set")
+    engine = create_engine(TEST_REPLICA_DATABASE_URL)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
 @pytest.fixture(scope="function")
 def db(db_engine):
     SessionLocal = sessionmaker(bind=db_engine)
@@ -54,6 +151,9 @@ def cleanup_database(db):
 def cleanup(db):
     yield
     cleanup_database(db)
+    user_cache.clear()
+    token_cache.clear()
+    position_cache.clear()
 
 
 @pytest.fixture(scope="session")
@@ -72,8 +172,6 @@ def mock_auth_middleware(monkeypatch):
     def mock_verify_token(*args, **kwargs):
         return "test@example.com"
 
-    from app.middleware.auth import ValidationMiddleware
-
     monkeypatch.setattr(
         ValidationMiddleware, "check_api_accessibility", mock_check_api_accessibility
     )
@@ -106,6 +204,65 @@ def test_user(db, mock_data):
     return user
 
 
+def create_user(db, model, email, platform):
+    from app.models.user import BaseUser
+
+    base_user = save_to_db(
+        db, BaseUser(provider="self", provider_id=email, platform=platform.value)
+    )
+    return save_to_db(
+        db,
+        model(
+            base_user_id=base_user.id,
+            email=email,
+            password_hash=get_password_hash("Test@123"),
+            first_name="Test",
+            last_name="User",
+        ),
+    )
+
+
+@pytest.fixture(scope="function")
+def talenthub_user(db):
+    from app.models.user import UserTalenthub
+    from app.schemas.user import Platform
+
+    return create_user(db, UserTalenthub, "recruiter@example.com", Platform.talenthub)
+
+
+@pytest.fixture(scope="function")
+def positions(db, talenthub_user, mock_data):
+    """Three positions of one organization, created oldest first"""
+    from app.models.organization import Organizations
+    from app.models.positions import Positions
+
+    organization_data = mock_data["organization_data"]["valid_organization"]
+    organization = save_to_db(
+        db,
+        Organizations(
+            created_by=talenthub_user.id,
+            name=organization_data["name"],
+            type=organization_data["type"],
+            size=organization_data["size"],
+            location=organization_data["location"],
+            sector_focus="clean_tech",
+            logo_url="logos/test.png",
+        ),
+    )
+    position_data = mock_data["position_data"]["valid_position"]
+    return [
+        save_to_db(
+            db,
+            Positions(
+                user_id=talenthub_user.id,
+                organization_id=organization.id,
+                **{**position_data, "title": f"{position_data['title']} {i}"},
+            ),
+        )
+        for i in range(3)
+    ]
+
+
 @pytest.fixture(scope="function")
 def test_organization(db, test_user, mock_data):
     from app.models.organization import organizations
@@ -181,39 +338,13 @@ def test_token(test_user):
 
 
 @pytest.fixture(scope="function")
-def mock_request(test_user):
-    from app.schemas.user import Platform
-
-    def override_request():
-        scope = {"type": "http", "headers": []}
-        request = Request(scope=scope)
-        if not hasattr(app.state, "user"):
-            app.state = type(
-                "State", (), {"user": test_user.email, "platform": Platform.careerforge}
-            )()
-        return request
-
-    return override_request
-
-
-@pytest.fixture(scope="function")
-def authorized_client(client, test_token, mock_request):
-    from app.schemas.user import Platform
-
-    original_state = getattr(app, "state", None)
-    app.state = type("State", (), {"user": "test@example.com", "platform": Platform.careerforge})()
-
-    app.dependency_overrides[Request] = mock_request
+def authorized_client(client, test_token, monkeypatch):
+    # Run the real accessibility check so the middleware resolves the token onto request.state
+    monkeypatch.setattr(ValidationMiddleware, "check_api_accessibility", check_api_accessibility)
     client.headers = {**client.headers, "Authorization": f"Bearer {test_token}"}
 
     yield client
 
-    app.dependency_overrides.clear()
-    if original_state:
-        app.state = original_state
-    else:
-        delattr(app, "state")
-
 
 @pytest.fixture(scope="function")
 def client(db, mock_auth_middleware):
@@ -223,6 +354,63 @@ def client(db, mock_auth_middleware):
         finally:
             db.close()
 
+    # Async routes read committed test data through their own asyncpg connections;
+    # NullPool keeps connections from outliving the TestClient's event loop
+    async_session = async_sessionmaker(
+        bind=create_async_engine(async_database_uri(TEST_DATABASE_URL), poolclass=NullPool),
+        expire_on_commit=False,
+    )
+
+    async def override_get_async_db():
+        async with async_session() as async_db:
+            yield async_db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_db
     yield TestClient(app)
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def query_budget(client):
+    """Fail the test when a request made in the block issues more than ``max_queries`` statements.
+
+        with query_budget(2):
+            authorized_client.get(...)
+
+    ``@pytest.mark.query_budget(n)`` applies the same check to every request of a test.
+    """
+
+    @contextmanager
+    def budget(max_queries: int):
+        responses = []
+
+        def record(response):
+            responses.append(response)
+
+        client.event_hooks["response"].append(record)
+        try:
+            yield responses
+        finally:
+            client.event_hooks["response"].remove(record)
+
+        for response in responses:
+            count = int(response.headers[QUERY_COUNT_HEADER])
+            assert count <= max_queries, (
+                f"{response.request.method} {response.request.url.path} issued {count} "
+                f"SQL statements, budget is {max_queries}"
+            )
+
+    return budget
+
+
+@pytest.fixture(autouse=True)
+def query_budget_marker(request):
+    marker = request.node.get_closest_marker("query_budget")
+    if marker is None:
+        yield
+        return
+    with request.getfixturevalue("query_budget")(marker.args[0]):
+        yield
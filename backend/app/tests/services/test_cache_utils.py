@@ -0,0 +1,133 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.utils.cache_utils import TwoTierCache
+from app.utils.responses import dumps
+
+NAMESPACE = "positions:careerforge"
+
+
+def make_cache(redis, subscribed=True):
+    cache = TwoTierCache(redis, maxsize=100, ttl=60, getsizeof=len)
+    if subscribed:
+        cache._set_subscribed(True)
+    return cache, redis
+
+
+def test_l1_hit_skips_redis(fake_redis_client):
+    cache, redis = make_cache(fake_redis_client)
+    key = f"{NAMESPACE}:v{cache.get_generation(NAMESPACE)}:page_0"
+    redis.store[key] = [{"id": "a"}]
+
+    first = cache.get(key)
+    second = cache.get(key)
+    cache.get_generation(NAMESPACE)
+
+    assert first == second == [{"id": "a"}]
+    # One generation read and one GET; the rest is served from worker memory
+    assert redis.reads == 2
+    assert cache.stats() == {
+        "l1_hits": 1,
+        "l1_misses": 1,
+        "l2_hits": 1,
+        "l2_misses": 0,
+        "computes": 0,
+        "coalesced": 0,
+        "lock_waits": 0,
+        "l1_size": 1,
+    }
+
+
+def test_announced_generation_drops_local_entries(fake_redis_client):
+    cache, redis = make_cache(fake_redis_client)
+    old_key = f"{NAMESPACE}:v{cache.get_generation(NAMESPACE)}:page_0"
+    cache.set(old_key, [{"id": "a"}])
+
+    # Another worker invalidates the namespace
+    generation = redis.incr(f"{NAMESPACE}:generation")
+    cache._handle_message(dumps({"namespace": NAMESPACE, "generation": generation}))
+    reads = redis.reads
+
+    assert cache.get_generation(NAMESPACE) == generation
+    assert redis.reads == reads
+    assert cache.stats()["l1_size"] == 0
+
+
+def test_generation_is_read_from_redis_without_subscription(fake_redis_client):
+    cache, redis = make_cache(fake_redis_client, subscribed=False)
+    cache.get_generation(NAMESPACE)
+
+    generation = cache.invalidate(NAMESPACE)
+
+    assert cache.get_generation(NAMESPACE) == generation
+    assert redis.reads == 2
+    assert redis.published == [dumps({"namespace": NAMESPACE, "generation": generation})]
+
+
+def test_concurrent_misses_compute_once(fake_redis_client):
+    # Two workers sharing one Redis, 500 requests missing the same key at once
+    workers = [make_cache(fake_redis_client)[0] for _ in range(2)]
+    computes = []
+    start = threading.Barrier(500)
+
+    def load_page():
+        computes.append(1)
+        time.sleep(0.2)
+        return [{"id": "a"}]
+
+    def request(i):
+        start.wait()
+        return workers[i % 2].get_or_compute(f"{NAMESPACE}:v0:page_0", load_page)
+
+    with ThreadPoolExecutor(max_workers=500) as pool:
+        results = list(pool.map(request, range(500)))
+
+    assert len(computes) == 1
+    assert all(result == [{"id": "a"}] for result in results)
+    assert sum(worker.stats()["computes"] for worker in workers) == 1
+
+
+def test_value_stored_before_lock_is_not_recomputed(monkeypatch, fake_redis_client):
+    key = f"{NAMESPACE}:v0:page_0"
+    cache, redis = make_cache(fake_redis_client)
+    other, _ = make_cache(fake_redis_client)
+    computes = []
+    acquire_lock = redis.acquire_lock
+
+    def load_page():
+        computes.append(1)
+        return [{"id": "a"}]
+
+    def acquire_after_other_worker(lock_key, token, ttl_seconds):
+        # The other worker computes, stores and releases between our miss and our acquire
+        monkeypatch.setattr(redis, "acquire_lock", acquire_lock)
+        other.get_or_compute(key, load_page)
+        return acquire_lock(lock_key, token, ttl_seconds)
+
+    monkeypatch.setattr(redis, "acquire_lock", acquire_after_other_worker)
+
+    assert cache.get_or_compute(key, load_page) == [{"id": "a"}]
+    assert len(computes) == 1
+    assert cache.stats()["computes"] == 0
+    assert f"lock:{key}" not in redis.store
+
+
+def test_hit_close_to_expiry_is_refreshed_early(monkeypatch, fake_redis_client):
+    cache, redis = make_cache(fake_redis_client)
+    key = f"{NAMESPACE}:v0:page_0"
+    cache.get_or_compute(key, lambda: [{"id": "old"}])
+    cache.clear()
+    monkeypatch.setattr("app.utils.cache_utils.random.random", lambda: 0.5)
+    cache._compute_times[key] = 2.0
+
+    # Plenty of time left: served as is
+    redis.ttls[key] = 60
+    assert cache.get_or_compute(key, lambda: [{"id": "new"}]) == [{"id": "old"}]
+
+    # Within delta * beta * -ln(0.5) of expiry: refreshed by this caller
+    cache.clear()
+    cache._compute_times[key] = 2.0
+    redis.ttls[key] = 1
+    assert cache.get_or_compute(key, lambda: [{"id": "new"}]) == [{"id": "new"}]
+    assert redis.store[key] == [{"id": "new"}]
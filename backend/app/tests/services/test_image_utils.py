@@ -0,0 +1,83 @@
+import asyncio
+import os
+import time
+
+import dlib
+import numpy as np
+import pytest
+
+from app.utils.exceptions import ServiceUnavailableException
+from app.utils.image_utils import ImageProcessingPool, detect_face
+
+
+class FakeDetector:
+    """Finds one face at fixed coordinates, but only in images whose longest side is ``side``"""
+
+    def __init__(self, side):
+        self.side = side
+        self.shapes = []
+
+    def __call__(self, gray):
+        self.shapes.append(gray.shape)
+        if max(gray.shape) != self.side:
+            return []
+        return [dlib.rectangle(100, 50, 200, 150)]
+
+
+@pytest.fixture
+def pool():
+    pool = ImageProcessingPool(max_workers=1, max_pending=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_full_pool_rejects_instead_of_queueing(pool):
+    async def scenario():
+        running = asyncio.ensure_future(pool.run(time.sleep, 0.5))
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceUnavailableException):
+            await pool.run(abs, -1)
+        await running
+
+    asyncio.run(scenario())
+    assert pool.pending == 0
+
+
+def test_worker_crash_is_surfaced_and_pool_recovers(pool):
+    async def scenario():
+        # The worker process exits mid-job, as if killed by the OOM killer
+        with pytest.raises(ServiceUnavailableException):
+            await asyncio.wait_for(pool.run(os._exit, 1), timeout=30)
+        return await asyncio.wait_for(pool.run(abs, -2), timeout=30)
+
+    assert asyncio.run(scenario()) == 2
+    assert pool.pending == 0
+
+
+def test_face_found_on_downscaled_copy_maps_to_full_resolution(monkeypatch):
+    detector = FakeDetector(side=800)
+    monkeypatch.setattr("app.utils.image_utils.detector", detector)
+    img = np.zeros((3000, 4000, 3), dtype=np.uint8)
+
+    # Detected at 1/5 scale
+    assert detect_face(img) == (500, 250, 1000, 750)
+    assert detector.shapes == [(600, 800)]
+
+
+def test_small_face_falls_back_to_larger_side(monkeypatch):
+    detector = FakeDetector(side=1600)
+    monkeypatch.setattr("app.utils.image_utils.detector", detector)
+    img = np.zeros((3000, 4000, 3), dtype=np.uint8)
+
+    # Missed at 800px, detected at 2/5 scale
+    assert detect_face(img) == (250, 125, 500, 375)
+    assert detector.shapes == [(600, 800), (1200, 1600)]
+
+
+def test_small_image_is_detected_once_at_full_size(monkeypatch):
+    detector = FakeDetector(side=None)
+    monkeypatch.setattr("app.utils.image_utils.detector", detector)
+    img = np.zeros((480, 640, 3), dtype=np.uint8)
+
+    assert detect_face(img) is None
+    assert detector.shapes == [(480, 640)]
@@ -0,0 +1,69 @@
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+from prometheus_client import REGISTRY
+
+from app.services.s3_services import S3Services
+from app.utils.exceptions import S3Exception
+from app.utils.metrics import sql_operation
+from app.utils.redis_utils import RedisClient
+
+BUCKET = "test-bucket"
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class EmptyBody:
+    def stream(self, **kwargs):
+        yield b""
+
+
+def test_sql_operation_labels():
+    assert sql_operation("  select 1") == "SELECT"
+    assert sql_operation("UPDATE users SET name = 'x'") == "UPDATE"
+    assert sql_operation("WITH rows AS (SELECT 1) SELECT * FROM rows") == "OTHER"
+    assert sql_operation("") == "OTHER"
+
+
+def test_redis_reads_counted_by_key_family():
+    connection = MagicMock()
+    client = RedisClient(connection=connection)
+    connection.get.side_effect = [client.codec.encode({"id": 1}), None, ConnectionError()]
+    before = {
+        result: sample("redis_operations_total", family="position", result=result)
+        for result in ("hit", "miss", "error")
+    }
+
+    assert client.get("position:1") == {"id": 1}
+    assert client.get("position:2") is None
+    assert client.get("position:3") is None
+
+    for result in ("hit", "miss", "error"):
+        after = sample("redis_operations_total", family="position", result=result)
+        assert after == before[result] + 1
+
+
+def test_s3_calls_timed_and_failures_counted():
+    s3_client = boto3.client(
+        "s3", region_name="us-east-1", aws_access_key_id="key", aws_secret_access_key="secret"
+    )
+    statuses = iter([204, 403])
+    # Answers in place of the network, so the call still goes through botocore's events
+    s3_client.meta.events.register(
+        "before-send.s3",
+        lambda request, **kwargs: AWSResponse(request.url, next(statuses), {}, EmptyBody()),
+    )
+    services = S3Services(s3_client=s3_client)
+    calls = sample("s3_request_duration_seconds_count", operation="DeleteObject")
+    errors = sample("s3_errors_total", operation="DeleteObject")
+
+    services.delete_object(BUCKET, "a/profile.png")
+    with pytest.raises(S3Exception):
+        services.delete_object(BUCKET, "a/profile.png")
+
+    assert sample("s3_request_duration_seconds_count", operation="DeleteObject") == calls + 2
+    assert sample("s3_errors_total", operation="DeleteObject") == errors + 1
@@ -0,0 +1,61 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.db.crud import CRUDBase
+from app.models.positions import Positions
+from app.utils.exceptions import ValidationException
+from app.utils.pagination import decode_cursor, encode_cursor, next_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2025, 8, 4, 10, 30, 15, 123456, tzinfo=timezone.utc)
+    id = uuid.uuid4()
+
+    cursor = encode_cursor(created_at, id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, id)
+    assert decode_cursor(encode_cursor(created_at.isoformat(), str(id))) == (created_at, id)
+    assert decode_cursor(None) is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        encode_cursor("yesterday", uuid.uuid4()),
+        encode_cursor(datetime.now(timezone.utc), "not-a-uuid"),
+        encode_cursor(datetime.now(timezone.utc), uuid.uuid4())[:-4],
+    ],
+)
+def test_invalid_cursor_rejected(cursor):
+    with pytest.raises(ValidationException) as exc_info:
+        decode_cursor(cursor)
+    assert exc_info.value.status_code == 422
+
+
+def test_next_cursor_only_for_full_pages():
+    rows = [{"created_at": datetime.now(timezone.utc), "id": uuid.uuid4()} for _ in range(2)]
+
+    assert next_cursor(rows, limit=3) is None
+    assert decode_cursor(next_cursor(rows, limit=2)) == (rows[1]["created_at"], rows[1]["id"])
+
+
+@pytest.mark.parametrize("sort_order", ["desc", "asc"])
+def test_seek_returns_rows_strictly_after_cursor_on_ties(db, positions, sort_order):
+    tied = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for position in positions:
+        position.created_at = tied
+    db.commit()
+    crud = CRUDBase(model=Positions)
+
+    ordered = crud._seek(db.query(Positions), "created_at", sort_order).all()
+    expected_ids = sorted((position.id for position in positions), reverse=sort_order == "desc")
+    assert [position.id for position in ordered] == expected_ids
+
+    # The id breaks the tie, so each row is returned exactly once across pages
+    for index, row in enumerate(ordered):
+        after = crud._seek(db.query(Positions), "created_at", sort_order, (tied, row.id)).all()
+        assert after == ordered[index + 1 :]
@@ -0,0 +1,144 @@
+import json
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from app.models.tracked_jobs import TrackedJobs
+from app.models.user import UserCareerforge
+from app.schemas.organization import Sector
+from app.schemas.user import Platform
+from app.services.positions import PositionService
+from app.services.sector_counts import SectorCountService
+from app.tests.conftest import create_user, save_to_db
+from app.utils.cache_utils import TwoTierCache
+from core.constants import constants
+
+
+@pytest.fixture(scope="function")
+def fake_redis(monkeypatch, fake_redis_client):
+    monkeypatch.setattr(
+        "app.services.positions.position_cache",
+        TwoTierCache(fake_redis_client, maxsize=1000, ttl=60, getsizeof=len),
+    )
+    return fake_redis_client
+
+
+@pytest.fixture(scope="function")
+def careerforge_users(db):
+    return [
+        create_user(db, UserCareerforge, f"candidate{i}@example.com", Platform.careerforge)
+        for i in range(2)
+    ]
+
+
+def test_format_positions_response(db, positions, careerforge_users):
+    position_service = PositionService()
+    response = position_service.format_positions_response(
+        positions=positions, db=db, include_stage=True, user_id=careerforge_users[0].id
+    )
+    assert [item["id"] for item in response] == [position.id for position in positions]
+    assert all(item["recruiter_email"] == "recruiter@example.com" for item in response)
+    assert all(item["stage"] == constants.BASE_JOB_STAGES for item in response)
+
+
+def test_careerforge_cache_is_shared_with_per_user_stages(
+    db, fake_redis, positions, careerforge_users
+):
+    position_service = PositionService()
+    first_user, second_user = careerforge_users
+    save_to_db(
+        db,
+        TrackedJobs(
+            user_id=first_user.id,
+            job_id=positions[0].id,
+            stage={**constants.BASE_JOB_STAGES, "saved": True},
+        ),
+    )
+
+    first = position_service.get_positions_for_careerforge(
+        db=db, user=first_user, platform=Platform.careerforge, filters={}, page=0, limit=20
+    )
+    second = position_service.get_positions_for_careerforge(
+        db=db, user=second_user, platform=Platform.careerforge, filters={}, page=0, limit=20
+    )
+
+    cached_pages = [value for value in fake_redis.store.values() if isinstance(value, list)]
+    assert len(cached_pages) == 1
+    assert all("stage" not in item for item in cached_pages[0])
+
+    first_stages = {str(item["id"]): item["stage"]["saved"] for item in first}
+    second_stages = {str(item["id"]): item["stage"]["saved"] for item in second}
+    assert first_stages[str(positions[0].id)] is True
+    assert not any(second_stages.values())
+
+
+def test_stream_matches_careerforge_page(db, fake_redis, positions, careerforge_users):
+    position_service = PositionService()
+    user = careerforge_users[0]
+
+    page = position_service.get_positions_for_careerforge(
+        db=db, user=user, platform=Platform.careerforge, filters={}, page=0, limit=20
+    )
+    streamed = json.loads(
+        b"".join(
+            position_service.stream_positions_for_careerforge(
+                db=db, user=user, filters={}, page=0, limit=20, chunk_size=2
+            )
+        )
+    )
+
+    assert streamed == jsonable_encoder(page)
+
+
+def test_sector_counts_are_maintained_incrementally(db, fake_redis, positions):
+    sector_counts = SectorCountService(fake_redis, reconcile_interval=600)
+
+    # Built from the database on the first read, then served from the hash
+    assert sector_counts.get_counts(db) == {"Clean Tech": 3}
+
+    # What create_position does after its commit; here without a matching row
+    sector_counts.increment(Sector.clean_tech)
+    assert sector_counts.get_counts(db) == {"Clean Tech": 4}
+
+    assert sector_counts.reconcile(db) == {"Clean Tech": -1}
+    assert sector_counts.get_counts(db) == {"Clean Tech": 3}
+
+
+def test_sector_count_increment_skips_missing_hash(db, fake_redis, positions):
+    sector_counts = SectorCountService(fake_redis, reconcile_interval=600)
+
+    sector_counts.increment(Sector.clean_tech)
+
+    assert sector_counts.get_counts(db) == {"Clean Tech": 3}
+
+
+def test_search_ranks_title_matches_first(db, fake_redis, positions, careerforge_users):
+    positions[0].title = "Solar Engineer"
+    positions[2].role_description = "Install solar panels on residential roofs"
+    db.commit()
+
+    results = PositionService().get_positions_for_careerforge(
+        db=db,
+        user=careerforge_users[0],
+        platform=Platform.careerforge,
+        filters={"q": "solar"},
+        page=0,
+        limit=20,
+    )
+
+    # The older title match outranks the newer description match; the third does not match
+    assert [str(item["id"]) for item in results] == [str(positions[0].id), str(positions[2].id)]
+
+
+@pytest.mark.parametrize("q", ["", "   "])
+def test_blank_search_does_not_filter(db, fake_redis, positions, careerforge_users, q):
+    results = PositionService().get_positions_for_careerforge(
+        db=db,
+        user=careerforge_users[0],
+        platform=Platform.careerforge,
+        filters={"q": q},
+        page=0,
+        limit=20,
+    )
+
+    assert len(results) == len(positions)
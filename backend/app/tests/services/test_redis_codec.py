@@ -0,0 +1,41 @@
+import json
+import uuid
+from datetime import datetime, timezone
+
+from app.utils.redis_codec import FORMAT_JSON, FORMAT_JSON_ZLIB, RedisCodec
+
+VALUE = [
+    {
+        "id": uuid.uuid4(),
+        "title": "Solar Engineer",
+        "created_at": datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+        "stage": None,
+    }
+]
+EXPECTED = [{**VALUE[0], "id": str(VALUE[0]["id"]), "created_at": "2024-05-01T12:30:00+00:00"}]
+
+
+def test_small_values_are_stored_uncompressed():
+    codec = RedisCodec(compress_threshold=1024)
+
+    encoded = codec.encode(VALUE)
+
+    assert encoded[0] == FORMAT_JSON
+    assert codec.decode(encoded) == EXPECTED
+
+
+def test_large_values_are_compressed():
+    codec = RedisCodec(compress_threshold=1024)
+    value = VALUE * 100
+
+    encoded = codec.encode(value)
+
+    assert encoded[0] == FORMAT_JSON_ZLIB
+    assert len(encoded) < len(json.dumps(EXPECTED * 100))
+    assert codec.decode(encoded) == EXPECTED * 100
+
+
+def test_legacy_json_text_is_still_readable():
+    codec = RedisCodec(compress_threshold=1024)
+
+    assert codec.decode(json.dumps(EXPECTED).encode()) == EXPECTED
@@ -0,0 +1,115 @@
+import time
+from itertools import count
+from unittest.mock import MagicMock
+
+from app.services.s3_services import S3Services
+from core.config import settings
+
+BUCKET = "test-bucket"
+
+
+def make_services():
+    s3_client = MagicMock()
+    signatures = count()
+    s3_client.generate_presigned_url.side_effect = lambda **kwargs: (
+        f"https://{BUCKET}.s3.amazonaws.com/{kwargs['Params']['Key']}?sig={next(signatures)}"
+    )
+    return S3Services(s3_client=s3_client), s3_client
+
+
+def test_presigned_download_url_is_reused():
+    services, s3_client = make_services()
+
+    first = services.generate_presigned_url(bucket_name=BUCKET, object_key="a/profile.png")
+    second = services.generate_presigned_url(bucket_name=BUCKET, object_key="a/profile.png")
+    other = services.generate_presigned_url(bucket_name=BUCKET, object_key="b/profile.png")
+
+    assert first == second
+    assert other != first
+    assert s3_client.generate_presigned_url.call_count == 2
+
+
+def test_presigned_download_url_not_cached_within_margin():
+    services, s3_client = make_services()
+
+    services.generate_presigned_url(bucket_name=BUCKET, object_key="a/profile.png", expiration=60)
+    services.generate_presigned_url(bucket_name=BUCKET, object_key="a/profile.png", expiration=60)
+
+    assert s3_client.generate_presigned_url.call_count == 2
+
+
+def test_overwriting_object_invalidates_presigned_url():
+    services, s3_client = make_services()
+
+    first = services.generate_presigned_url(bucket_name=BUCKET, object_key="a/profile.png")
+    services.upload_file_content(
+        bucket_name=BUCKET,
+        object_key="a/profile.png",
+        file_content=b"png",
+        content_type="image/png",
+    )
+    after_upload = services.generate_presigned_url(bucket_name=BUCKET, object_key="a/profile.png")
+    services.generate_presigned_url(
+        bucket_name=BUCKET, object_key="a/profile.png", operation="put_object"
+    )
+    after_upload_url = services.generate_presigned_url(
+        bucket_name=BUCKET, object_key="a/profile.png"
+    )
+
+    assert after_upload != first
+    assert after_upload_url != after_upload
+    assert s3_client.generate_presigned_url.call_count == 3
+
+
+def test_generate_presigned_urls_signs_each_key_once():
+    services, s3_client = make_services()
+
+    urls = services.generate_presigned_urls(
+        bucket_name=BUCKET, object_keys=["logo.png", None, "a/profile.png", "logo.png", ""]
+    )
+
+    assert set(urls) == {"logo.png", "a/profile.png"}
+    assert s3_client.generate_presigned_url.call_count == 2
+
+
+def test_presigned_url_cached_per_expiration():
+    services, s3_client = make_services()
+
+    hour = services.generate_presigned_url(bucket_name=BUCKET, object_key="logo.png")
+    day = services.generate_presigned_url(
+        bucket_name=BUCKET, object_key="logo.png", expiration=86400
+    )
+
+    assert day != hour
+    assert services.generate_presigned_url(bucket_name=BUCKET, object_key="logo.png") == hour
+    assert s3_client.generate_presigned_url.call_count == 2
+
+
+def test_presigned_url_reused_only_within_ttl(monkeypatch):
+    monkeypatch.setattr(settings, "PRESIGNED_URL_CACHE_TTL", 0.2)
+    services, s3_client = make_services()
+
+    first = services.generate_presigned_url(bucket_name=BUCKET, object_key="logo.png")
+    assert services.generate_presigned_url(bucket_name=BUCKET, object_key="logo.png") == first
+
+    time.sleep(0.25)
+    assert services.generate_presigned_url(bucket_name=BUCKET, object_key="logo.png") != first
+    assert s3_client.generate_presigned_url.call_count == 2
+
+
+def test_generate_presigned_urls_skips_keys_that_fail():
+    services, s3_client = make_services()
+    sign = s3_client.generate_presigned_url.side_effect
+
+    def sign_or_fail(**kwargs):
+        if kwargs["Params"]["Key"] == "broken.png":
+            raise RuntimeError("signing failed")
+        return sign(**kwargs)
+
+    s3_client.generate_presigned_url.side_effect = sign_or_fail
+
+    urls = services.generate_presigned_urls(
+        bucket_name=BUCKET, object_keys=["logo.png", "broken.png", "a/profile.png"]
+    )
+
+    assert set(urls) == {"logo.png", "a/profile.png"}
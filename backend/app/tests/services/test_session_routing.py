@@ -0,0 +1,88 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import sessionmaker
+
+from app.db import session as db_session
+from app.db.session import RoutingSession, get_db, get_read_db
+from app.models.milestones import Milestones
+from app.models.user import UserCareerforge
+from core.config import settings
+
+
+@pytest.fixture(scope="function")
+def routed_sessions(monkeypatch, db_engine, replica_engine, fake_redis_client):
+    monkeypatch.setattr(db_session, "redis_client", fake_redis_client)
+    monkeypatch.setattr(db_session, "replica_engines", [replica_engine])
+    monkeypatch.setattr(
+        db_session, "session_local", sessionmaker(class_=RoutingSession, primary=db_engine)
+    )
+    monkeypatch.setattr(
+        db_session,
+        "read_session_local",
+        sessionmaker(class_=RoutingSession, primary=db_engine, replicas=[replica_engine]),
+    )
+    return fake_redis_client
+
+
+def rename_user(db, user, first_name):
+    db.execute(
+        update(UserCareerforge).where(UserCareerforge.id == user.id).values(first_name=first_name)
+    )
+    db.commit()
+
+
+def test_reads_go_to_replica_until_the_session_writes(db, db_engine, replica_engine, test_user):
+    routed = RoutingSession(primary=db_engine, replicas=[replica_engine])
+    try:
+        # The replica instance is empty, so finding nothing proves where the read went
+        assert routed.get_bind() is replica_engine
+        assert routed.query(UserCareerforge).filter_by(email=test_user.email).first() is None
+
+        routed.add(
+            Milestones(user_id=test_user.id, name="Apply", type="job", tasks={}, is_completed=False)
+        )
+        routed.commit()
+
+        assert routed.wrote
+        assert routed.get_bind() is db_engine
+        assert routed.query(UserCareerforge).filter_by(email=test_user.email).first() is not None
+    finally:
+        routed.close()
+
+    assert db.query(Milestones).count() == 1
+
+
+def test_core_dml_goes_to_primary(db, db_engine, replica_engine, test_user):
+    routed = RoutingSession(primary=db_engine, replicas=[replica_engine])
+    try:
+        rename_user(routed, test_user, "Renamed")
+        assert routed.wrote
+    finally:
+        routed.close()
+
+    db.expire_all()
+    assert db.get(UserCareerforge, test_user.id).first_name == "Renamed"
+
+
+def test_read_db_pins_user_to_primary_after_write(
+    routed_sessions, db_engine, replica_engine, test_user
+):
+    writer = SimpleNamespace(state=SimpleNamespace(user=test_user.email, platform="careerforge"))
+    other = SimpleNamespace(state=SimpleNamespace(user="other@example.com", platform="careerforge"))
+
+    reads = get_read_db(writer)
+    assert next(reads).get_bind() is replica_engine
+    reads.close()
+
+    writes = get_db(writer)
+    rename_user(next(writes), test_user, "Renamed")
+    # Pinned on commit, before the route returns, not in the dependency teardown
+    assert list(routed_sessions.ttls.values()) == [settings.READ_YOUR_WRITES_WINDOW]
+    writes.close()
+
+    for request, expected in ((writer, db_engine), (other, replica_engine)):
+        reads = get_read_db(request)
+        assert next(reads).get_bind() is expected
+        reads.close()
@@ -0,0 +1,52 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.user import Platform
+from app.utils.responses import dumps
+from app.utils.security import TokenCache, create_access_token, verify_token
+
+
+def make_worker():
+    redis = MagicMock()
+    redis.add_expiring_member.return_value = True
+    redis.publish.return_value = 1
+    return TokenCache(redis, maxsize=100, ttl=60)
+
+
+def test_revocation_applies_in_other_workers_without_redis_reads(monkeypatch):
+    token = create_access_token(subject="test@example.com", platform=Platform.careerforge)
+    digest = TokenCache.digest(token)
+    worker, other = make_worker(), make_worker()
+    monkeypatch.setattr("app.utils.security.token_cache", other)
+    assert verify_token(token) == ("test@example.com", "careerforge")
+
+    worker.revoke(digest, time.time() + 60)
+    channel, message = worker.redis.publish.call_args.args
+    other._handle_message(message)
+
+    with pytest.raises(HTTPException) as exc_info:
+        verify_token(token)
+    assert exc_info.value.status_code == 401
+    # Verification, cached or not, never waited on Redis
+    assert other.redis.method_calls == []
+
+
+def test_resubscribing_worker_catches_up_on_missed_revocations():
+    worker = make_worker()
+    worker.redis.get_live_members.return_value = {"missed": time.time() + 60}
+
+    worker._on_subscribed(True)
+
+    assert worker.is_revoked("missed")
+
+
+def test_expired_revocations_are_dropped():
+    worker = make_worker()
+    worker._handle_message(dumps({"digest": "old", "exp": time.time() - 1}))
+    worker._handle_message(dumps({"digest": "new", "exp": time.time() + 60}))
+
+    assert not worker.is_revoked("old")
+    assert worker.is_revoked("new")
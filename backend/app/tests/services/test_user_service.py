@@ -3,6 +3,7 @@ from uuid import uuid4
 
 import pytest
 from fastapi import Request
+from sqlalchemy import event
 
 from app.schemas.user import (
     CreateExp,
@@ -19,6 +20,7 @@ from app.utils.exceptions import (
     InvalidUserException,
     ResourceNotFound,
 )
+from app.utils.user_cache import user_cache
 
 
 def test_get_user_by_id_success(db, test_user):
@@ -244,24 +246,50 @@ def test_update_password(db, test_user):
 
 def test_get_platform():
     mock_request = MagicMock(spec=Request)
-    mock_request.app.state.platform = "pathways"
+    mock_request.state.platform = "pathways"
     platform = get_platform(mock_request)
     assert platform == Platform.careerforge
 
 
 def test_get_active_user_pathways(db, test_user):
     mock_request = MagicMock(spec=Request)
-    mock_request.app.state.user = test_user.email
-    mock_request.app.state.platform = Platform.careerforge
+    mock_request.state.user = test_user.email
+    mock_request.state.platform = Platform.careerforge
     platform_user, provider = get_active_user(request=mock_request, db=db)
     assert platform_user.id == test_user.id
     assert provider == "self"
 
 
+def test_get_active_user_is_cached_until_updated(db, test_user):
+    mock_request = MagicMock(spec=Request)
+    mock_request.state.user = test_user.email
+    mock_request.state.platform = Platform.careerforge
+    get_active_user(request=mock_request, db=db)
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", record)
+    try:
+        platform_user, provider = get_active_user(request=mock_request, db=db)
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", record)
+    assert statements == []
+    assert platform_user.id == test_user.id
+    assert provider == "self"
+
+    UserService().update_user_data(
+        db=db, user=platform_user, update_data=UserUpdateRequest(first_name="Cached")
+    )
+    assert user_cache.get(db=db, email=test_user.email, platform=Platform.careerforge) is None
+
+
 def test_get_active_user_not_found(db):
     mock_request = MagicMock(spec=Request)
-    mock_request.app.state.user = "nonexistent@example.com"
-    mock_request.app.state.platform = Platform.careerforge
+    mock_request.state.user = "nonexistent@example.com"
+    mock_request.state.platform = Platform.careerforge
     with pytest.raises(ResourceNotFound):
         get_active_user(request=mock_request, db=db)
 
@@ -280,8 +308,8 @@ def test_get_active_user_base_user_only(db):
     user = user_service.create_user_in_db(db=db, user=user_data)
 
     mock_request = MagicMock(spec=Request)
-    mock_request.app.state.user = user.email
-    mock_request.app.state.platform = Platform.candid
+    mock_request.state.user = user.email
+    mock_request.state.platform = Platform.candid
 
     with pytest.raises(ResourceNotFound):
         get_active_user(request=mock_request, db=db)
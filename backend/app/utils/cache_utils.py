@@ -0,0 +1,321 @@
+import math
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Any, Callable, Optional
+
+import orjson
+from cachetools import TTLCache
+
+from app.utils.metrics import CACHE_EVENTS
+from app.utils.redis_utils import RedisClient, redis_client
+from app.utils.responses import dumps
+from core.config import settings
+from core.logger import logger
+
+CACHE_INVALIDATION_CHANNEL = "cache:invalidation"
+LOCK_POLL_INTERVAL = 0.05  # seconds between checks while another worker computes a key
+
+
+class _Flight:
+    """One in-progress computation that concurrent callers in this process wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class TwoTierCache:
+    """Per-process L1 cache in front of Redis (L2) for generation-versioned keys.
+
+    Callers build keys under a namespace (e.g. ``positions:careerforge``) that embed the
+    namespace's generation from ``get_generation``; ``invalidate`` bumps the generation in
+    Redis and publishes it on the invalidation channel. While the listener is subscribed,
+    each worker keeps the generations it has seen in memory and drops the namespace's L1
+    entries on every announcement, so an L1 hit costs no Redis round trip at all. Without a
+    live subscription generations are read from Redis on every call, exactly as before.
+
+    ``get_or_compute`` also protects expensive keys from stampedes: concurrent misses in a
+    worker share one computation, workers coordinate through a Redis lock so only one of
+    them computes, and a hit close to expiry is refreshed early by a single caller with
+    probability growing as expiry nears (XFetch, scaled by the last compute time).
+    """
+
+    def __init__(
+        self,
+        redis: RedisClient,
+        maxsize: int,
+        ttl: int,
+        getsizeof: Optional[Callable[[Any], int]] = None,
+        channel: str = CACHE_INVALIDATION_CHANNEL,
+        lock_ttl: int = 30,
+        early_refresh_beta: float = 1.0,
+        name: str = "default",
+    ):
+        self.redis = redis
+        self.name = name  # label of this cache's events in the metrics
+        self.channel = channel
+        self.lock_ttl = lock_ttl
+        self.early_refresh_beta = early_refresh_beta
+        self._local = TTLCache(maxsize=maxsize, ttl=ttl, getsizeof=getsizeof)
+        # Also bounded by the TTL, so a lost announcement is only trusted for that long
+        self._generations = TTLCache(maxsize=1024, ttl=ttl)
+        # Seconds the last computation of each key took, for early refresh
+        self._compute_times = TTLCache(maxsize=1024, ttl=3600)
+        self._flights: dict[str, _Flight] = {}
+        self._subscribed = False
+        self._epoch = 0
+        self._stats = Counter()
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._listener: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _generation_key(namespace: str) -> str:
+        return f"{namespace}:generation"
+
+    def get_generation(self, namespace: str) -> Optional[int]:
+        with self._lock:
+            if self._subscribed and namespace in self._generations:
+                return self._generations[namespace]
+            epoch = self._epoch
+
+        generation = self.redis.get_counter(self._generation_key(namespace))
+        if generation is not None:
+            with self._lock:
+                # Only trust the value if we were subscribed for the whole read, otherwise
+                # a bump announced in between could have been missed
+                if self._subscribed and self._epoch == epoch:
+                    self._generations[namespace] = max(
+                        generation, self._generations.get(namespace, generation)
+                    )
+        return generation
+
+    def invalidate(self, namespace: str) -> Optional[int]:
+        """Bump the namespace's generation and announce it to every worker"""
+        generation = self.redis.incr(self._generation_key(namespace))
+        if generation is None:
+            return None
+        self._apply_generation(namespace, generation)
+        message = dumps({"namespace": namespace, "generation": generation})
+        if self.redis.publish(self.channel, message) is None:
+            logger.error(f"Failed to announce cache generation {generation} for {namespace}")
+        return generation
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self._get_local(key)
+        if value is not None:
+            return value
+
+        value = self.redis.get(key)
+        self._count("l2_hits" if value is not None else "l2_misses")
+        if value is not None:
+            self._set_local(key, value)
+        return value
+
+    def get_or_compute(
+        self, key: str, compute: Callable[[], Any], expiry_seconds: Optional[int] = None
+    ) -> Any:
+        """Return the cached value for ``key``, computing and storing it at most once.
+
+        Callers in this worker that miss while a computation is running wait for it and
+        share its result (or its exception).
+        """
+        value = self._get_local(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self._increment("coalesced")
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = self._load(key, compute, expiry_seconds)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def _load(self, key: str, compute: Callable[[], Any], expiry_seconds: Optional[int]) -> Any:
+        value, ttl = self.redis.get_with_ttl(key)
+        self._count("l2_hits" if value is not None else "l2_misses")
+        if value is not None and not self._should_refresh_early(key, ttl):
+            self._set_local(key, value)
+            return value
+
+        lock_key, token = f"lock:{key}", uuid.uuid4().hex
+        deadline = time.monotonic() + self.lock_ttl
+        while not self.redis.acquire_lock(lock_key, token, self.lock_ttl):
+            if value is not None:
+                # Another worker is already refreshing it; the current value is still good
+                self._set_local(key, value)
+                return value
+            if time.monotonic() >= deadline:
+                # The holder is stuck or gone; compute without the lock rather than fail
+                token = None
+                break
+            time.sleep(LOCK_POLL_INTERVAL)
+            value = self.redis.get(key)
+            if value is not None:
+                self._count("lock_waits")
+                self._set_local(key, value)
+                return value
+
+        try:
+            if value is None and token is not None:
+                # The previous holder may have stored the value between our miss and the lock
+                stored = self.redis.get(key)
+                if stored is not None:
+                    self._count("lock_waits")
+                    self._set_local(key, stored)
+                    return stored
+            return self._compute(key, compute, expiry_seconds)
+        except Exception as e:
+            if value is None:
+                raise
+            logger.error(f"Early refresh of {key} failed, serving the current value: {e}")
+            self._set_local(key, value)
+            return value
+        finally:
+            if token is not None:
+                self.redis.release_lock(lock_key, token)
+
+    def _compute(self, key: str, compute: Callable[[], Any], expiry_seconds: Optional[int]) -> Any:
+        start = time.perf_counter()
+        value = compute()
+        with self._lock:
+            self._compute_times[key] = time.perf_counter() - start
+            self._increment("computes")
+        if value is not None:
+            self.set(key, value, expiry_seconds)
+        return value
+
+    def _should_refresh_early(self, key: str, ttl: Optional[float]) -> bool:
+        """XFetch: refresh when ttl <= delta * beta * -ln(U), U uniform in (0, 1]"""
+        if ttl is None or self.early_refresh_beta <= 0:
+            return False
+        with self._lock:
+            delta = self._compute_times.get(key)
+        if delta is None:
+            return False
+        return ttl <= -delta * self.early_refresh_beta * math.log(1.0 - random.random())
+
+    def _get_local(self, key: str) -> Optional[Any]:
+        with self._lock:
+            value = self._local.get(key)
+            self._increment("l1_hits" if value is not None else "l1_misses")
+        return value
+
+    def _increment(self, event: str) -> None:
+        """Count an event; the caller holds the lock"""
+        self._stats[event] += 1
+        CACHE_EVENTS.labels(self.name, event).inc()
+
+    def _count(self, event: str) -> None:
+        with self._lock:
+            self._increment(event)
+
+    def set(self, key: str, value: Any, expiry_seconds: Optional[int] = None) -> bool:
+        self._set_local(key, value)
+        return self.redis.set_with_expiry(key, value, expiry_seconds)
+
+    def _set_local(self, key: str, value: Any) -> None:
+        with self._lock:
+            try:
+                self._local[key] = value
+            except ValueError:
+                # Larger than the whole L1 budget; it is only served from Redis
+                pass
+
+    def _apply_generation(self, namespace: str, generation: int) -> None:
+        prefix = f"{namespace}:"
+        with self._lock:
+            if self._subscribed and generation > self._generations.get(namespace, -1):
+                self._generations[namespace] = generation
+            for key in [key for key in self._local if key.startswith(prefix)]:
+                self._local.pop(key, None)
+
+    def _handle_message(self, data: bytes) -> None:
+        try:
+            message = orjson.loads(data)
+            self._apply_generation(message["namespace"], int(message["generation"]))
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring malformed cache invalidation message {data!r}: {e}")
+
+    def _set_subscribed(self, subscribed: bool) -> None:
+        with self._lock:
+            self._subscribed = subscribed
+            self._epoch += 1
+            self._generations.clear()
+
+    def _listen(self) -> None:
+        self.redis.listen(self.channel, self._handle_message, self._set_subscribed, self._stopping)
+
+    def start_listener(self) -> None:
+        if self._listener is not None and self._listener.is_alive():
+            return
+        self._stopping.clear()
+        self._listener = threading.Thread(
+            target=self._listen, name="cache-invalidation-listener", daemon=True
+        )
+        self._listener.start()
+
+    def stop_listener(self) -> None:
+        self._stopping.set()
+        if self._listener is not None:
+            self._listener.join(timeout=5)
+            self._listener = None
+
+    def stats(self) -> dict:
+        """Hit/miss counters per tier since start (or the last clear)
+
+        ``coalesced`` counts callers that waited on another caller in this worker,
+        ``lock_waits`` misses served by another worker's computation.
+        """
+        with self._lock:
+            return {
+                "l1_hits": self._stats["l1_hits"],
+                "l1_misses": self._stats["l1_misses"],
+                "l2_hits": self._stats["l2_hits"],
+                "l2_misses": self._stats["l2_misses"],
+                "computes": self._stats["computes"],
+                "coalesced": self._stats["coalesced"],
+                "lock_waits": self._stats["lock_waits"],
+                "l1_size": self._local.currsize,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._local.clear()
+            self._generations.clear()
+            self._compute_times.clear()
+            self._stats.clear()
+
+
+# Sized in positions rather than pages, since one page can hold up to 5000 of them
+position_cache = TwoTierCache(
+    redis_client,
+    maxsize=settings.POSITION_L1_CACHE_MAX_POSITIONS,
+    ttl=settings.POSITION_L1_CACHE_TTL,
+    getsizeof=len,
+    lock_ttl=settings.POSITION_CACHE_LOCK_TTL,
+    early_refresh_beta=settings.POSITION_CACHE_EARLY_REFRESH_BETA,
+    name="positions",
+)
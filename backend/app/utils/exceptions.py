@@ -83,6 +83,15 @@ class ConflictException(BaseCustomException):
         super().__init__(message, status_code)
 
 
+class ServiceUnavailableException(BaseCustomException):
+    def __init__(
+        self,
+        message=error_messages.SERVICE_UNAVAILABLE,
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    ):
+        super().__init__(message, status_code)
+
+
 class CustomException(Exception):
     def __init__(self, error):
         self.error = error
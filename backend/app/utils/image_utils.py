@@ -1,33 +1,83 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
 import cv2
 import dlib
 import numpy as np
 from fastapi import UploadFile
 
+from app.utils.exceptions import ServiceUnavailableException
+from core.config import settings
+from core.logger import logger
+
 PROFILE_SIZE = (500, 500)
 PADDING_RATIO = 1.0  # 100% padding around the face
+# Longest side of the detection copies, tried in order until a face is found. dlib finds
+# faces down to ~80px, i.e. 10% of the frame at 800px and 5% at 1600px.
+DETECTION_SIDES = (800, 1600)
 
-detector = dlib.get_frontal_face_detector()
+# Loaded once per worker process by the pool initializer (or lazily when called inline)
+detector = None
 
 
-async def crop_image_smart_dlib(file: UploadFile) -> bytes:
+def init_detector() -> None:
+    global detector
+    if detector is None:
+        detector = dlib.get_frontal_face_detector()
+
+
+def detect_face(img: np.ndarray) -> Optional[tuple[int, int, int, int]]:
+    """Return the first face box (left, top, right, bottom) in full-resolution coordinates.
+
+    Detection runs on copies downscaled to each of DETECTION_SIDES in turn, so a large photo
+    never goes through the detector (or a grayscale conversion) at full resolution.
+    """
+    height, width = img.shape[:2]
+    for side in DETECTION_SIDES:
+        scale = min(1.0, side / max(height, width))
+        small = img
+        if scale < 1.0:
+            small = cv2.resize(
+                img,
+                (max(1, round(width * scale)), max(1, round(height * scale))),
+                interpolation=cv2.INTER_AREA,
+            )
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+        faces = detector(gray)
+        if faces:
+            face = faces[0]
+            return tuple(
+                round(value / scale)
+                for value in (face.left(), face.top(), face.right(), face.bottom())
+            )
+        if scale == 1.0:
+            break
+    return None
+
+
+def crop_image_bytes(contents: bytes) -> bytes:
+    """Detect the first face in the image and return a padded square crop as PNG bytes.
+
+    CPU bound; runs inside an ImageProcessingPool worker.
+    """
     try:
-        contents = await file.read()
+        init_detector()
         nparr = np.frombuffer(contents, np.uint8)
         img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
 
         if img is None:
             raise ValueError("Invalid image file")
 
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-        # Detect faces
-        faces = detector(gray)
-        if not faces:
+        face = detect_face(img)
+        if face is None:
             raise ValueError("No face detected in the image")
 
-        # Use the first detected face
-        face = faces[0]
-        left, top, right, bottom = face.left(), face.top(), face.right(), face.bottom()
+        left, top, right, bottom = face
 
         # Compute face center and size
         face_center_x = (left + right) // 2
@@ -46,7 +96,7 @@ async def crop_image_smart_dlib(file: UploadFile) -> bytes:
         crop_right = min(crop_left + crop_size, img.shape[1])
         crop_bottom = min(crop_top + crop_size, img.shape[0])
 
-        # Crop and resize
+        # Crop the original once and resize
         cropped = img[crop_top:crop_bottom, crop_left:crop_right]
         resized = cv2.resize(cropped, PROFILE_SIZE, interpolation=cv2.INTER_LANCZOS4)
 
@@ -56,3 +106,78 @@ async def crop_image_smart_dlib(file: UploadFile) -> bytes:
 
     except Exception as e:
         raise ValueError(f"Error processing image: {str(e)}")
+
+
+class ImageProcessingPool:
+    """Bounded process pool that keeps image decoding and face detection off the event loop.
+
+    At most ``max_pending`` jobs may be queued or running at once; beyond that callers get a
+    ServiceUnavailableException instead of waiting behind an unbounded backlog. A worker that
+    dies mid-job (e.g. killed for memory) fails the jobs in flight the same way, and the
+    next job starts a fresh pool.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process that already runs threads (uvicorn, redis) is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=init_detector,
+                )
+            return self._executor
+
+    async def run(self, fn, *args):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                logger.warning(f"Image processing pool saturated ({self._pending} jobs pending)")
+                raise ServiceUnavailableException()
+            self._pending += 1
+        executor = None
+        try:
+            executor = self._get_executor()
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            logger.error("Image processing worker died, replacing the pool")
+            self._discard(executor)
+            raise ServiceUnavailableException()
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _discard(self, executor: Optional[ProcessPoolExecutor]) -> None:
+        """Drop a broken executor, unless a concurrent caller already replaced it"""
+        with self._lock:
+            if executor is None or self._executor is not executor:
+                return
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+image_processing_pool = ImageProcessingPool(
+    max_workers=settings.IMAGE_PROCESSING_WORKERS,
+    max_pending=settings.IMAGE_PROCESSING_MAX_PENDING,
+)
+
+
+async def crop_image_smart_dlib(file: UploadFile) -> bytes:
+    contents = await file.read()
+    return await image_processing_pool.run(crop_image_bytes, contents)
@@ -0,0 +1,66 @@
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# With several workers, point PROMETHEUS_MULTIPROC_DIR at an empty directory shared by them
+# (wiped before each deployment starts). prometheus_client reads it at import time and
+# every worker then writes its samples there, so any worker can serve the aggregate.
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+DB_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+SQL_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE"})
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time until the response starts, by route template",
+    ["method", "route"],
+)
+HTTP_REQUESTS = Counter(
+    "http_requests", "Responses by route template and status code", ["method", "route", "status"]
+)
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "SQL statement execution time",
+    ["operation"],
+    buckets=DB_BUCKETS,
+)
+DB_STATEMENT_ERRORS = Counter("db_statement_errors", "Failed SQL statements", ["operation"])
+REDIS_OPERATIONS = Counter(
+    "redis_operations",
+    "Redis reads by hit/miss and failed calls by key family (the key up to its first colon)",
+    ["family", "result"],
+)
+CACHE_EVENTS = Counter(
+    "cache_events",
+    "TwoTierCache hits and misses per tier, computations and waits",
+    ["cache", "event"],
+)
+S3_REQUEST_DURATION = Histogram("s3_request_duration_seconds", "S3 API call latency", ["operation"])
+S3_ERRORS = Counter("s3_errors", "Failed S3 API calls", ["operation"])
+
+
+def sql_operation(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword if keyword in SQL_OPERATIONS else "OTHER"
+
+
+def key_family(key: str) -> str:
+    return key.split(":", 1)[0]
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """The exposition of this worker's metrics, or of all workers' in multiprocess mode"""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,38 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Optional, Union
+
+from app.utils.exceptions import ValidationException
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: Union[datetime, str], id: Union[uuid.UUID, str]) -> str:
+    """Encode the (created_at, id) keyset position of a row as an opaque string"""
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    payload = json.dumps([created_at, str(id)]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[tuple[datetime, uuid.UUID]]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), uuid.UUID(id)
+    except Exception:
+        raise ValidationException(message="Invalid pagination cursor")
+
+
+def next_cursor(rows: list[Any], limit: int) -> Optional[str]:
+    """Cursor for the page after `rows`, or None when this was the last page"""
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    if isinstance(last, dict):
+        return encode_cursor(last["created_at"], last["id"])
+    return encode_cursor(last.created_at, last.id)
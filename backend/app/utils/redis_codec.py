@@ -0,0 +1,34 @@
+import zlib
+from typing import Any
+
+import orjson
+
+from app.utils.responses import dumps
+
+# Leading format byte of every value written by RedisCodec. JSON text never starts with
+# these bytes, so values cached before the codec existed can still be told apart and read.
+FORMAT_JSON = 0x01
+FORMAT_JSON_ZLIB = 0x02
+
+
+class RedisCodec:
+    """Versioned binary encoding for cached values: orjson, zlib-compressed above a threshold"""
+
+    def __init__(self, compress_threshold: int, compress_level: int = 1):
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+
+    def encode(self, value: Any) -> bytes:
+        payload = dumps(value)
+        if self.compress_threshold and len(payload) >= self.compress_threshold:
+            return bytes((FORMAT_JSON_ZLIB,)) + zlib.compress(payload, self.compress_level)
+        return bytes((FORMAT_JSON,)) + payload
+
+    def decode(self, data: bytes) -> Any:
+        body = memoryview(data)[1:]
+        if data[0] == FORMAT_JSON:
+            return orjson.loads(body)
+        if data[0] == FORMAT_JSON_ZLIB:
+            return orjson.loads(zlib.decompress(body))
+        # Legacy plain JSON text
+        return orjson.loads(data)
@@ -1,44 +1,72 @@
-import json
-import uuid
-from datetime import datetime
-from typing import Any, Optional
+import threading
+import time
+from typing import Any, Callable, Optional
 
 import redis
 
+from app.utils.metrics import REDIS_OPERATIONS, key_family
+from app.utils.redis_codec import RedisCodec
 from core.config import settings
 from core.logger import logger
 
+LISTENER_MAX_BACKOFF = 30  # seconds between resubscribe attempts
+
+# Delete the lock only if it still holds our token, so an expired lock taken over by
+# another worker is never released by the previous holder
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Adjust a hash counter only while the hash exists, so a missing hash is rebuilt from the
+# source of truth instead of being recreated with a single field
+INCR_IF_EXISTS_SCRIPT = """
+if redis.call("exists", KEYS[1]) == 1 then
+    return redis.call("hincrby", KEYS[1], ARGV[1], ARGV[2])
+end
+return nil
+"""
+
 
 class RedisClient:
-    def __init__(self):
-        self.redis_client = redis.Redis(
+    def __init__(
+        self, codec: Optional[RedisCodec] = None, connection: Optional[redis.Redis] = None
+    ):
+        self.codec = codec or RedisCodec(
+            compress_threshold=settings.REDIS_COMPRESSION_THRESHOLD,
+            compress_level=settings.REDIS_COMPRESSION_LEVEL,
+        )
+        # Values are binary (see RedisCodec), so responses are not decoded to str
+        self.redis_client = connection or redis.Redis(
             host=settings.REDIS_HOST,
             port=settings.REDIS_PORT,
             password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
             ssl=settings.REDIS_SSL,
             db=0,
-            decode_responses=True,
+            decode_responses=False,
         )
+        self._release_lock_script = self.redis_client.register_script(RELEASE_LOCK_SCRIPT)
+        self._incr_if_exists_script = self.redis_client.register_script(INCR_IF_EXISTS_SCRIPT)
 
-    def _serialize(self, value: Any) -> str:
+    def _serialize(self, value: Any) -> bytes:
         """
-        Custom JSON serializer that handles datetime and UUID
+        Encode a value with the configured codec
         """
+        return self.codec.encode(value)
 
-        def default_serializer(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            if isinstance(obj, uuid.UUID):
-                return str(obj)
-            raise TypeError(f"Type {type(obj)} not serializable")
-
-        return json.dumps(value, default=default_serializer)
+    def _deserialize(self, value: bytes) -> Any:
+        """
+        Decode a value written by the codec (or legacy JSON text)
+        """
+        return self.codec.decode(value)
 
-    def _deserialize(self, value: str) -> Any:
+    def _record(self, key: str, result: str) -> None:
         """
-        Custom JSON deserializer
+        Count a hit, miss or error for the key's family
         """
-        return json.loads(value)
+        REDIS_OPERATIONS.labels(key_family(key), result).inc()
 
     def set_with_expiry(self, key: str, value: Any, expiry_seconds: Optional[int] = None) -> bool:
         """
@@ -52,6 +80,7 @@ class RedisClient:
             return self.redis_client.setex(name=key, time=expiry_seconds, value=serialized_value)
         except Exception as e:
             logger.error(f"Redis set error: {e}")
+            self._record(key, "error")
             return False
 
     def get(self, key: str) -> Optional[Any]:
@@ -60,11 +89,201 @@ class RedisClient:
         """
         try:
             value = self.redis_client.get(key)
+            self._record(key, "miss" if value is None else "hit")
             if value is None:
                 return None
             return self._deserialize(value)
         except Exception as e:
             logger.error(f"Redis get error: {e}")
+            self._record(key, "error")
+            return None
+
+    def get_with_ttl(self, key: str) -> tuple[Optional[Any], Optional[float]]:
+        """
+        Get a value and its remaining time to live in seconds, in one round trip
+        """
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.pttl(key)
+            value, pttl = pipe.execute()
+            self._record(key, "miss" if value is None else "hit")
+            if value is None:
+                return None, None
+            return self._deserialize(value), pttl / 1000 if pttl >= 0 else None
+        except Exception as e:
+            logger.error(f"Redis get with ttl error: {e}")
+            self._record(key, "error")
+            return None, None
+
+    def acquire_lock(self, key: str, token: str, ttl_seconds: int) -> bool:
+        """
+        Take a lock held by ``token`` until released or ``ttl_seconds`` pass.
+        Fails open: if Redis is unreachable the caller is told it holds the lock.
+        """
+        try:
+            return bool(self.redis_client.set(key, token, nx=True, ex=ttl_seconds))
+        except Exception as e:
+            logger.error(f"Redis acquire lock error: {e}")
+            self._record(key, "error")
+            return True
+
+    def release_lock(self, key: str, token: str) -> bool:
+        """
+        Release a lock, but only if it is still held by ``token``
+        """
+        try:
+            return bool(self._release_lock_script(keys=[key], args=[token]))
+        except Exception as e:
+            logger.error(f"Redis release lock error: {e}")
+            self._record(key, "error")
+            return False
+
+    def get_counter(self, key: str) -> Optional[int]:
+        """
+        Get an integer counter, initialising it once if it does not exist
+        """
+        try:
+            value = self.redis_client.get(key)
+            if value is None:
+                # Seed from the clock so a lost counter never reuses an old value
+                self.redis_client.set(key, time.time_ns() // 1_000_000, nx=True)
+                value = self.redis_client.get(key)
+            return int(value)
+        except Exception as e:
+            logger.error(f"Redis get counter error: {e}")
+            self._record(key, "error")
+            return None
+
+    def incr(self, key: str) -> Optional[int]:
+        """
+        Atomically increment a counter
+        """
+        try:
+            return self.redis_client.incr(key)
+        except Exception as e:
+            logger.error(f"Redis incr error: {e}")
+            self._record(key, "error")
+            return None
+
+    def publish(self, channel: str, message: bytes) -> Optional[int]:
+        """
+        Publish a message, returning the number of subscribers that received it
+        """
+        try:
+            return self.redis_client.publish(channel, message)
+        except Exception as e:
+            logger.error(f"Redis publish error: {e}")
+            self._record(channel, "error")
+            return None
+
+    def listen(
+        self,
+        channel: str,
+        on_message: Callable[[bytes], None],
+        on_subscribed: Callable[[bool], None],
+        stopping: threading.Event,
+    ) -> None:
+        """
+        Deliver messages published on ``channel`` until ``stopping`` is set, resubscribing
+        with backoff after errors. Messages published while unsubscribed are lost, so
+        ``on_subscribed`` is told whenever the subscription starts or ends.
+        """
+        backoff = 1
+        while not stopping.is_set():
+            pubsub = self.redis_client.pubsub()
+            try:
+                pubsub.subscribe(channel)
+                while not stopping.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is None:
+                        continue
+                    if message["type"] == "subscribe":
+                        on_subscribed(True)
+                        backoff = 1
+                    elif message["type"] == "message":
+                        on_message(message["data"])
+            except Exception as e:
+                logger.error(f"Redis listener error on {channel}: {e}")
+                self._record(channel, "error")
+            finally:
+                on_subscribed(False)
+                pubsub.close()
+            stopping.wait(backoff)
+            backoff = min(backoff * 2, LISTENER_MAX_BACKOFF)
+
+    def add_expiring_member(self, key: str, member: str, expires_at: float) -> bool:
+        """
+        Add a member to a sorted set scored by its expiry time, dropping expired members
+        """
+        try:
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.zadd(key, {member: expires_at})
+            pipe.zremrangebyscore(key, "-inf", time.time())
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis add expiring member error: {e}")
+            self._record(key, "error")
+            return False
+
+    def get_live_members(self, key: str) -> Optional[dict[str, float]]:
+        """
+        Get the unexpired members of a sorted set scored by expiry time, with their expiry
+        """
+        try:
+            members = self.redis_client.zrangebyscore(key, time.time(), "+inf", withscores=True)
+            self._record(key, "hit" if members else "miss")
+            return {member.decode(): expires_at for member, expires_at in members}
+        except Exception as e:
+            logger.error(f"Redis get live members error: {e}")
+            self._record(key, "error")
+            return None
+
+    def get_hash_counters(self, key: str) -> Optional[dict[str, int]]:
+        """
+        Get every field of a hash of integer counters, or None if it does not exist
+        """
+        try:
+            values = self.redis_client.hgetall(key)
+            self._record(key, "hit" if values else "miss")
+            if not values:
+                return None
+            return {field.decode(): int(value) for field, value in values.items()}
+        except Exception as e:
+            logger.error(f"Redis get hash counters error: {e}")
+            self._record(key, "error")
+            return None
+
+    def replace_hash_counters(
+        self, key: str, counters: dict[str, int], expiry_seconds: int
+    ) -> bool:
+        """
+        Atomically replace a hash of integer counters
+        """
+        try:
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.delete(key)
+            if counters:
+                pipe.hset(key, mapping=counters)
+                pipe.expire(key, expiry_seconds)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis replace hash counters error: {e}")
+            self._record(key, "error")
+            return False
+
+    def incr_hash_counter_if_exists(self, key: str, field: str, amount: int = 1) -> Optional[int]:
+        """
+        Increment a field of an existing hash; does nothing if the hash is missing
+        """
+        try:
+            value = self._incr_if_exists_script(keys=[key], args=[field, amount])
+            return int(value) if value is not None else None
+        except Exception as e:
+            logger.error(f"Redis incr hash counter error: {e}")
+            self._record(key, "error")
             return None
 
     def delete(self, key: str) -> bool:
@@ -75,6 +294,7 @@ class RedisClient:
             return bool(self.redis_client.delete(key))
         except Exception as e:
             logger.error(f"Redis delete error: {e}")
+            self._record(key, "error")
             return False
 
     def delete_pattern(self, pattern: str) -> bool:
@@ -88,6 +308,7 @@ class RedisClient:
             return True
         except Exception as e:
             logger.error(f"Redis delete pattern error: {e}")
+            self._record(pattern, "error")
             return False
 
 
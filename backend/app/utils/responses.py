@@ -0,0 +1,34 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def orjson_default(obj: Any) -> Any:
+    """Fallback for the types orjson does not serialise natively, matching jsonable_encoder.
+
+    UUID, datetime, date, enum and dataclass values are handled by orjson itself.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    if isinstance(obj, Decimal):
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=orjson_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson; content may hold UUIDs, datetimes and pydantic models
+    directly, so routes do not need a jsonable_encoder pass"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,14 +1,24 @@
+import hashlib
+import hmac
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Union
+from typing import Any, Optional, Union
 
-from fastapi import HTTPException
+import orjson
+from cachetools import LRUCache
+from fastapi import Header, HTTPException, status
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.db.crud import CRUDBase
 from app.models.user import BaseUser, UserCareerforge, UserTalenthub
 from app.schemas.user import Platform
+from app.utils.redis_utils import RedisClient, redis_client
+from app.utils.responses import dumps
 from core.config import settings
+from core.constants import error_messages
+from core.logger import logger
 
 base_user_crud = CRUDBase(model=BaseUser)
 careerforge_user_crud = CRUDBase(model=UserCareerforge)
@@ -42,16 +52,155 @@ def create_access_token(
 #     return encoded_jwt
 
 
-def verify_token(token: str) -> tuple[str, str]:
+TOKEN_REVOCATION_CHANNEL = "token:revocations"
+REVOKED_TOKENS_KEY = "revoked_tokens"
+
+
+class TokenCache:
+    """Bounded LRU of verified tokens keyed by their SHA-256 digest, plus the revoked digests.
+
+    Entries hold ``(email, platform, exp)`` and are served until the token expires or
+    ``TOKEN_CACHE_TTL`` elapses, whichever comes first.
+
+    Revocation checks never touch Redis. ``revoke`` records the digest in a Redis sorted set
+    and announces it; each worker's listener applies announcements as they arrive and
+    reloads the set whenever it (re)subscribes. While a worker is not subscribed it fails
+    open: a token revoked elsewhere in that window is accepted until the worker reconnects
+    or, for a cached token, until its entry goes stale.
+    """
+
+    def __init__(
+        self,
+        redis: RedisClient,
+        maxsize: int,
+        ttl: int,
+        channel: str = TOKEN_REVOCATION_CHANNEL,
+    ):
+        self.redis = redis
+        self.channel = channel
+        self._entries = LRUCache(maxsize=maxsize)
+        self._revoked: dict[str, float] = {}
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._listener: Optional[threading.Thread] = None
+
+    @staticmethod
+    def digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, digest: str) -> Optional[tuple[str, str]]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            email, platform, exp, fresh_until = entry
+            if now >= min(exp, fresh_until):
+                self._entries.pop(digest, None)
+                return None
+        return email, platform
+
+    def set(self, digest: str, email: str, platform: str, exp: float) -> None:
+        with self._lock:
+            self._entries[digest] = (email, platform, exp, time.time() + self._ttl)
+
+    def revoke(self, digest: str, exp: float) -> None:
+        """Revoke in this worker, then share the revocation with the others"""
+        self._apply_revocations({digest: exp})
+        if not self.redis.add_expiring_member(REVOKED_TOKENS_KEY, digest, exp):
+            logger.warning("Token revocation was not shared with other workers")
+            return
+        if self.redis.publish(self.channel, dumps({"digest": digest, "exp": exp})) is None:
+            logger.warning("Token revocation was not announced to other workers")
+
+    def is_revoked(self, digest: str) -> bool:
+        with self._lock:
+            return digest in self._revoked
+
+    def _apply_revocations(self, revoked: dict[str, float]) -> None:
+        now = time.time()
+        with self._lock:
+            for digest in revoked:
+                self._entries.pop(digest, None)
+            self._revoked = {d: e for d, e in self._revoked.items() if e > now}
+            self._revoked.update(revoked)
+
+    def _handle_message(self, data: bytes) -> None:
+        try:
+            message = orjson.loads(data)
+            self._apply_revocations({message["digest"]: float(message["exp"])})
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring malformed token revocation message {data!r}: {e}")
+
+    def _on_subscribed(self, subscribed: bool) -> None:
+        # Catch up on revocations announced while this worker was not listening
+        if subscribed:
+            revoked = self.redis.get_live_members(REVOKED_TOKENS_KEY)
+            if revoked:
+                self._apply_revocations(revoked)
+
+    def _listen(self) -> None:
+        self.redis.listen(self.channel, self._handle_message, self._on_subscribed, self._stopping)
+
+    def start_listener(self) -> None:
+        if self._listener is not None and self._listener.is_alive():
+            return
+        self._stopping.clear()
+        self._listener = threading.Thread(
+            target=self._listen, name="token-revocation-listener", daemon=True
+        )
+        self._listener.start()
+
+    def stop_listener(self) -> None:
+        self._stopping.set()
+        if self._listener is not None:
+            self._listener.join(timeout=5)
+            self._listener = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._revoked.clear()
+
+
+token_cache = TokenCache(
+    redis_client, maxsize=settings.TOKEN_CACHE_MAX_SIZE, ttl=settings.TOKEN_CACHE_TTL
+)
+
+
+def _decode_token(token: str) -> dict:
     try:
         payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        email: str = payload.get("sub")
-        platform: str = payload.get("platform")
-        if not email or not platform:
-            raise HTTPException(status_code=401, detail="Invalid token payload")
-        return email, platform
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
+    if not payload.get("sub") or not payload.get("platform"):
+        raise HTTPException(status_code=401, detail="Invalid token payload")
+    return payload
+
+
+def verify_token(token: str) -> tuple[str, str]:
+    digest = token_cache.digest(token)
+    cached = token_cache.get(digest)
+    if cached:
+        return cached
+
+    payload = _decode_token(token)
+    if token_cache.is_revoked(digest):
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+
+    email: str = payload["sub"]
+    platform: str = payload["platform"]
+    token_cache.set(digest, email, platform, payload.get("exp", float("inf")))
+    return email, platform
+
+
+def revoke_token(token: str) -> None:
+    payload = _decode_token(token)
+    digest = token_cache.digest(token)
+    exp = payload.get("exp", time.time() + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
+    token_cache.revoke(digest, exp)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -60,3 +209,27 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return password_context.hash(password)
+
+
+def verify_internal_token(
+    x_internal_token: Optional[str] = Header(default=None),
+    authorization: Optional[str] = Header(default=None),
+) -> None:
+    """Guards internal endpoints, which are served only while INTERNAL_METRICS_TOKEN is set.
+
+    The token is sent in X-Internal-Token, or as a bearer token for scrapers that can only
+    set Authorization.
+    """
+    if not settings.INTERNAL_METRICS_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=error_messages.RESOURCE_NOT_FOUND
+        )
+    token = x_internal_token
+    if token is None and authorization and authorization.startswith("Bearer "):
+        token = authorization.split(" ", 1)[1]
+    if not token or not hmac.compare_digest(
+        token.encode(), settings.INTERNAL_METRICS_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail=error_messages.PERMISSION_DENIED
+        )
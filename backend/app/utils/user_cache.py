@@ -0,0 +1,97 @@
+import copy
+import threading
+from typing import Optional, Union
+
+from cachetools import TTLCache
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.models.user import UserCareerforge, UserTalenthub
+from app.schemas.user import Platform
+from core.config import settings
+
+PLATFORM_USER_MODELS = {
+    Platform.careerforge.value: UserCareerforge,
+    Platform.talenthub.value: UserTalenthub,
+}
+
+
+class UserCache:
+    """Short-lived, per-process cache of resolved users keyed by (email, platform).
+
+    Entries hold a snapshot of the user's column values plus the provider, never a live
+    ORM instance, so nothing is shared between sessions. A hit is re-attached to the
+    caller's session with ``merge(load=False)`` which does not emit any SQL.
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(email: str, platform: str) -> tuple[str, str]:
+        return email, Platform(platform).value
+
+    def _detached(
+        self, email: str, platform: str
+    ) -> Optional[tuple[Union[UserCareerforge, UserTalenthub], str]]:
+        with self._lock:
+            entry = self._cache.get(self._key(email, platform))
+        if entry is None:
+            return None
+
+        model, values, provider = entry
+        user = model(**copy.deepcopy(values))
+        make_transient_to_detached(user)
+        return user, provider
+
+    def get(
+        self, db: Session, email: str, platform: str
+    ) -> Optional[tuple[Union[UserCareerforge, UserTalenthub], str]]:
+        cached = self._detached(email, platform)
+        if cached is None:
+            return None
+        user, provider = cached
+        return db.merge(user, load=False), provider
+
+    async def get_async(
+        self, db: AsyncSession, email: str, platform: str
+    ) -> Optional[tuple[Union[UserCareerforge, UserTalenthub], str]]:
+        cached = self._detached(email, platform)
+        if cached is None:
+            return None
+        user, provider = cached
+        return await db.merge(user, load=False), provider
+
+    def set(
+        self, email: str, platform: str, user: Union[UserCareerforge, UserTalenthub], provider: str
+    ) -> None:
+        model = type(user)
+        values = {attr.key: getattr(user, attr.key) for attr in inspect(model).column_attrs}
+        with self._lock:
+            self._cache[self._key(email, platform)] = (model, copy.deepcopy(values), provider)
+
+    def invalidate(self, email: str, platform: str) -> None:
+        with self._lock:
+            self._cache.pop(self._key(email, platform), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+user_cache = UserCache(maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL)
+
+
+def _invalidate_cached_user(mapper, connection, target) -> None:
+    for platform, model in PLATFORM_USER_MODELS.items():
+        if isinstance(target, model):
+            user_cache.invalidate(target.email, platform)
+
+
+# Any ORM write to a platform user (profile updates, password changes, profile pictures,
+# current job title) drops the cached entry in this process.
+for _model in PLATFORM_USER_MODELS.values():
+    event.listen(_model, "after_update", _invalidate_cached_user)
+    event.listen(_model, "after_delete", _invalidate_cached_user)
@@ -0,0 +1,108 @@
+"""Per-request overhead of ValidationMiddleware on public and authenticated routes.
+
+Compares the original per-request regex compilation with the tables compiled at startup.
+Runs in-process against a no-op downstream app, no database or network involved.
+
+Usage: python -m benchmarks.bench_auth_middleware --requests 20000
+"""
+
+import argparse
+import asyncio
+import re
+import statistics
+import time
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.middleware.auth import ValidationMiddleware
+from app.schemas.user import Platform
+from app.utils.security import create_access_token
+from benchmarks.common import percentile
+from core.constants import constants
+
+API_VERSION = constants.API_VERSION
+ROUTES = {
+    "public static": ("POST", f"{API_VERSION}/auth/login/self"),
+    "public uuid": ("GET", f"{API_VERSION}/positions/public/3fa85f64-5717-4562-b3fc-2c963f66afa6"),
+    "authenticated": ("GET", f"{API_VERSION}/positions/careerforge"),
+}
+
+
+class LegacyValidationMiddleware(ValidationMiddleware):
+    """The matcher as it was before the tables were compiled once"""
+
+    def check_api_accessibility(self, request):
+        api_path = request.url.path
+        method = request.method
+
+        if self._match_path_pattern(method, api_path, constants.PUBLIC_API_PATHS):
+            return False
+        if self._match_path_pattern(method, api_path, constants.OPENAPI_PATHS):
+            return False
+
+        return True
+
+    def _match_path_pattern(self, method, api_path, paths_to_check):
+        for path_method, path_pattern in paths_to_check:
+            if method != path_method:
+                continue
+            regex_pattern = re.escape(path_pattern)
+            regex_pattern = regex_pattern.replace(r"\{id:uuid\}", self.PARAM_PATTERNS["uuid"])
+            regex_pattern = f"^{regex_pattern}$"
+            try:
+                if re.match(regex_pattern, api_path):
+                    return True
+            except re.error:
+                continue
+        return False
+
+
+async def call_next(request):
+    return Response()
+
+
+def build_request(method: str, path: str, token: str) -> Request:
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "server": ("testserver", 80),
+        "scheme": "http",
+    }
+    return Request(scope)
+
+
+async def measure(middleware, method: str, path: str, token: str, requests: int) -> list[float]:
+    samples = []
+    for _ in range(requests):
+        request = build_request(method, path, token)
+        start = time.perf_counter()
+        await middleware(request, call_next)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+async def main(requests: int) -> None:
+    token = create_access_token(subject="bench@example.com", platform=Platform.careerforge)
+    print(f"{'route':<16}{'matcher':<10}{'median us':>12}{'p99 us':>10}")
+    for label, (method, path) in ROUTES.items():
+        for name, middleware in (
+            ("legacy", LegacyValidationMiddleware()),
+            ("compiled", ValidationMiddleware()),
+        ):
+            samples = await measure(middleware, method, path, token, requests)
+            print(
+                f"{label:<16}{name:<10}{statistics.median(samples):>12.2f}"
+                f"{percentile(samples, 99):>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
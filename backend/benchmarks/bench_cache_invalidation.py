@@ -0,0 +1,104 @@
+"""Redis latency seen by readers while recruiters invalidate the position cache.
+
+Compares the old KEYS + DEL invalidation with the generation counter INCR.
+
+Usage: BENCH_REDIS_DB=15 python -m benchmarks.bench_cache_invalidation --keys 200000
+"""
+
+import argparse
+import os
+import threading
+import time
+
+import redis
+
+from benchmarks.common import percentile
+from core.config import settings
+
+PLATFORM = "careerforge"
+
+
+def redis_connection():
+    return redis.Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        password=settings.REDIS_PASSWORD or None,
+        ssl=settings.REDIS_SSL,
+        db=int(os.getenv("BENCH_REDIS_DB", "15")),
+    )
+
+
+def fill_keyspace(conn, keys: int) -> None:
+    """Unrelated keys plus a slice of position pages, like a shared production Redis"""
+    pipe = conn.pipeline(transaction=False)
+    for i in range(keys):
+        prefix = f"positions:{PLATFORM}:v0" if i % 10 == 0 else "session"
+        pipe.set(f"{prefix}:page_{i}:limit_20", "x" * 64, ex=600)
+        if i % 5000 == 0:
+            pipe.execute()
+    pipe.execute()
+
+
+def invalidate_keys(conn) -> None:
+    keys = conn.keys(f"positions:{PLATFORM}:*")
+    if keys:
+        conn.delete(*keys)
+
+
+def invalidate_generation(conn) -> None:
+    conn.incr(f"positions:{PLATFORM}:generation")
+
+
+def run_mode(invalidate, keys: int, duration: float, post_interval: float) -> list[float]:
+    conn = redis_connection()
+    conn.flushdb()
+    fill_keyspace(conn, keys)
+
+    samples = []
+    stop = threading.Event()
+
+    def reader():
+        reader_conn = redis_connection()
+        while not stop.is_set():
+            start = time.perf_counter()
+            reader_conn.get("session:page_1:limit_20")
+            samples.append((time.perf_counter() - start) * 1000)
+
+    def recruiter():
+        writer_conn = redis_connection()
+        while not stop.is_set():
+            invalidate(writer_conn)
+            # Repopulate a page so KEYS always has work to do
+            writer_conn.set(f"positions:{PLATFORM}:v0:page_0:limit_20", "x", ex=600)
+            time.sleep(post_interval)
+
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    threads.append(threading.Thread(target=recruiter))
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    conn.flushdb()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=200000)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--post-interval", type=float, default=0.05)
+    args = parser.parse_args()
+
+    print(f"{'mode':>12} {'reads':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for mode, invalidate in (("keys+del", invalidate_keys), ("incr", invalidate_generation)):
+        samples = run_mode(invalidate, args.keys, args.duration, args.post_interval)
+        print(
+            f"{mode:>12} {len(samples):>8} {percentile(samples, 50):>8.2f} "
+            f"{percentile(samples, 99):>8.2f} {max(samples):>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Page computations and latency when a popular position page expires under load.
+
+N threads per simulated worker miss the same key at once. "unprotected" is the old
+get-then-set path, "protected" is TwoTierCache.get_or_compute. The page load is simulated
+with a sleep so only the coordination cost is measured. Runs against a real Redis; set
+BENCH_REDIS_DB to a scratch db.
+
+Usage: BENCH_REDIS_DB=15 python -m benchmarks.bench_cache_stampede --requests 500 --workers 4
+"""
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.bench_cache_invalidation import redis_connection
+from benchmarks.bench_two_tier_cache import make_cache
+from benchmarks.common import percentile
+
+KEY = "bench:positions:careerforge:v0:page_0:limit_20"
+
+
+def run(mode: str, requests: int, workers: int, compute_ms: int) -> tuple[int, list[float]]:
+    caches = [make_cache(maxsize=1000) for _ in range(workers)]
+    computes = []
+    start = threading.Barrier(requests)
+
+    def load_page():
+        computes.append(1)
+        time.sleep(compute_ms / 1000)
+        return [{"id": "bench"}]
+
+    def request(i):
+        cache = caches[i % workers]
+        start.wait()
+        began = time.perf_counter()
+        if mode == "protected":
+            cache.get_or_compute(KEY, load_page)
+        elif cache.get(KEY) is None:
+            cache.set(KEY, load_page())
+        return (time.perf_counter() - began) * 1000
+
+    with ThreadPoolExecutor(max_workers=requests) as pool:
+        latencies = list(pool.map(request, range(requests)))
+    return len(computes), latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--compute-ms", type=int, default=200)
+    args = parser.parse_args()
+
+    conn = redis_connection()
+    print(f"{'mode':<13}{'computes':>10}{'p50 ms':>9}{'p99 ms':>9}")
+    for mode in ("unprotected", "protected"):
+        conn.flushdb()
+        computes, latencies = run(mode, args.requests, args.workers, args.compute_ms)
+        print(
+            f"{mode:<13}{computes:>10}{percentile(latencies, 50):>9.1f}"
+            f"{percentile(latencies, 99):>9.1f}"
+        )
+    conn.flushdb()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Time and peak RSS of profile picture cropping, full-resolution vs downscaled detection.
+
+Each (size, mode) cell runs in a fresh process so peak RSS is not inherited from earlier
+cells. The default corpus is synthetic noise without a face (the detector runs every level and
+the crop is rejected); pass ``--image`` to rescale a real photo to each size instead.
+
+Usage: python -m benchmarks.bench_face_detection --image face.jpg --repeat 3
+"""
+
+import argparse
+import multiprocessing
+import resource
+import statistics
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from app.utils import image_utils
+from app.utils.image_utils import crop_image_bytes
+
+SIZES = [(640, 480), (1920, 1080), (4032, 3024), (6000, 4000)]
+
+
+def build_image(width: int, height: int, source: str = None) -> bytes:
+    if source:
+        img = cv2.resize(cv2.imread(source), (width, height), interpolation=cv2.INTER_CUBIC)
+    else:
+        rng = np.random.default_rng(7)
+        img = cv2.GaussianBlur(rng.integers(0, 256, (height, width, 3), dtype=np.uint8), (9, 9), 0)
+    return cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, 90])[1].tobytes()
+
+
+def run_cell(mode: str, contents: bytes, repeat: int, results) -> None:
+    if mode == "full":
+        # A single level larger than any image is the old full-resolution detection
+        image_utils.DETECTION_SIDES = (sys.maxsize,)
+    image_utils.init_detector()
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    samples = []
+    found = False
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            crop_image_bytes(contents)
+            found = True
+        except ValueError:
+            pass
+        samples.append((time.perf_counter() - start) * 1000)
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((statistics.median(samples), (peak_kb - baseline_kb) / 1024, found))
+
+
+def main(args) -> None:
+    ctx = multiprocessing.get_context("spawn")
+    print(f"{'size':<12}{'mode':<12}{'median ms':>11}{'peak RSS +MB':>14}{'face':>6}")
+    for width, height in SIZES:
+        contents = build_image(width, height, args.image)
+        for mode in ("full", "downscaled"):
+            results = ctx.Queue()
+            process = ctx.Process(target=run_cell, args=(mode, contents, args.repeat, results))
+            process.start()
+            median_ms, peak_mb, found = results.get()
+            process.join()
+            print(
+                f"{f'{width}x{height}':<12}{mode:<12}{median_ms:>11.1f}{peak_mb:>14.1f}"
+                f"{'yes' if found else 'no':>6}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--image", help="real photo to rescale to each corpus size")
+    parser.add_argument("--repeat", type=int, default=3)
+    main(parser.parse_args())
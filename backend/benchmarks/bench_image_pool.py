@@ -0,0 +1,149 @@
+"""Latency of an unrelated endpoint while a burst of profile pictures is processed.
+
+Serves a minimal app with uvicorn that exposes a cheap ``/ping`` route next to an upload
+route which either crops inline on the event loop (the old behaviour) or goes through the
+ImageProcessingPool. Synthetic images contain no face, so detection runs to completion and
+the upload answers 400; pass ``--image`` to use a real photo instead.
+
+Usage: python -m benchmarks.bench_image_pool --uploads 16 --width 4000 --height 3000
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+
+import cv2
+import httpx
+import numpy as np
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+from app.utils.exceptions import ServiceUnavailableException
+from app.utils.image_utils import ImageProcessingPool, crop_image_bytes
+from benchmarks.common import percentile
+from core.config import settings
+
+
+def synthetic_image(width: int, height: int) -> bytes:
+    rng = np.random.default_rng(7)
+    img = rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+    img = cv2.GaussianBlur(img, (9, 9), 0)
+    _, encoded = cv2.imencode(".jpg", img)
+    return encoded.tobytes()
+
+
+def build_app(mode: str, pool: ImageProcessingPool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.post("/upload")
+    async def upload(request: Request):
+        contents = await request.body()
+        try:
+            if mode == "inline":
+                processed = crop_image_bytes(contents)
+            else:
+                processed = await pool.run(crop_image_bytes, contents)
+        except ValueError:
+            return Response(status_code=400)
+        except ServiceUnavailableException as e:
+            return Response(status_code=e.status_code)
+        return Response(content=processed, media_type="image/png")
+
+    return app
+
+
+def serve(app: FastAPI, port: int) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(app, port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+async def run_burst(base_url: str, image: bytes, uploads: int, ping_interval: float) -> dict:
+    ping_samples = []
+    statuses = []
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=300) as client:
+
+        async def pinger():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/ping")
+                ping_samples.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(ping_interval)
+
+        async def uploader():
+            response = await client.post("/upload", content=image)
+            statuses.append(response.status_code)
+
+        ping_task = asyncio.create_task(pinger())
+        started = time.perf_counter()
+        await asyncio.gather(*(uploader() for _ in range(uploads)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await ping_task
+
+    return {
+        "burst_s": elapsed,
+        "ping_median_ms": statistics.median(ping_samples),
+        "ping_p99_ms": percentile(ping_samples, 99),
+        "rejected": statuses.count(503),
+    }
+
+
+def warm_up(pool: ImageProcessingPool) -> None:
+    """Start the workers and load the detector before measuring"""
+    try:
+        asyncio.run(pool.run(crop_image_bytes, synthetic_image(64, 64)))
+    except ValueError:
+        pass
+
+
+def main(args) -> None:
+    if args.image:
+        with open(args.image, "rb") as f:
+            image = f.read()
+    else:
+        image = synthetic_image(args.width, args.height)
+    print(f"image: {len(image) / 1e6:.1f} MB, burst of {args.uploads} uploads")
+
+    print(f"{'mode':<8}{'burst s':>9}{'ping median ms':>16}{'ping p99 ms':>13}{'503s':>6}")
+    for offset, mode in enumerate(("inline", "pool")):
+        pool = ImageProcessingPool(
+            max_workers=args.workers or settings.IMAGE_PROCESSING_WORKERS,
+            max_pending=args.max_pending or settings.IMAGE_PROCESSING_MAX_PENDING,
+        )
+        if mode == "pool":
+            warm_up(pool)
+        server = serve(build_app(mode, pool), args.port + offset)
+        try:
+            result = asyncio.run(
+                run_burst(f"http://127.0.0.1:{args.port + offset}", image, args.uploads, 0.01)
+            )
+        finally:
+            server.should_exit = True
+            pool.shutdown()
+        print(
+            f"{mode:<8}{result['burst_s']:>9.2f}{result['ping_median_ms']:>16.1f}"
+            f"{result['ping_p99_ms']:>13.1f}{result['rejected']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--uploads", type=int, default=16)
+    parser.add_argument("--width", type=int, default=4000)
+    parser.add_argument("--height", type=int, default=3000)
+    parser.add_argument("--image", help="path to a real photo to upload instead")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--max-pending", type=int)
+    parser.add_argument("--port", type=int, default=8765)
+    main(parser.parse_args())
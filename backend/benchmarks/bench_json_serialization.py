@@ -0,0 +1,119 @@
+"""Serialization time of a 5000-position careerforge payload.
+
+Compares jsonable_encoder + JSONResponse with ORJSONResponse for the HTTP body, and the old
+json.dumps cache serializer with orjson (bench_redis_codec covers the full Redis codec).
+Positions are built in memory with the real response builder, so no database or Redis is
+needed; importing benchmarks.common registers the models the mappers need.
+
+Usage: python -m benchmarks.bench_json_serialization --positions 5000
+"""
+
+import argparse
+import json
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.models.organization import Organizations
+from app.models.positions import Positions
+from app.models.user import UserTalenthub
+from app.services.positions import position_service
+from app.utils.responses import ORJSONResponse, dumps
+from benchmarks.common import timed_runs
+from core.constants import constants
+
+
+def build_payload(count: int) -> list[dict]:
+    now = datetime.now(timezone.utc)
+    organization = Organizations(
+        id=uuid.uuid4(),
+        name="Bench Organization",
+        logo_url="logos/1.png",
+        sector_focus="clean_tech",
+    )
+    recruiter = UserTalenthub(
+        first_name="Bench",
+        last_name="Recruiter",
+        current_job_title="Recruiter",
+        email="recruiter@bench.local",
+        profile_picture_url="recruiter/profile.png",
+    )
+    stages = {}
+    payload = []
+    for i in range(count):
+        position = Positions(
+            id=uuid.uuid4(),
+            title=f"Solar Engineer {i}",
+            job_category="software-engineering",
+            position_type="Full-Time",
+            level_of_experience="Mid",
+            role_description="Help us build climate infrastructure. " * 8,
+            workplace_type="Remote",
+            city="Austin",
+            country="USA",
+            minimum_pay=50000 + i,
+            maximum_pay=100000 + i,
+            closing_date=(date.today() + timedelta(days=30)).isoformat(),
+            required_files=["resume"],
+            primary_responsibilities=["Design", "Build", "Operate"],
+            required_qualifications=["Python", "SQL"],
+            created_at=now - timedelta(seconds=i),
+        )
+        if i % 3 == 0:
+            stages[str(position.id)] = {**constants.BASE_JOB_STAGES, "saved": True}
+        payload.append(
+            position_service._build_position_response(
+                position, organization, recruiter if i % 2 == 0 else None, stages
+            )
+        )
+    return payload
+
+
+def legacy_redis_serialize(value) -> str:
+    """RedisClient._serialize before orjson"""
+
+    def default_serializer(obj):
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        if isinstance(obj, uuid.UUID):
+            return str(obj)
+        raise TypeError(f"Type {type(obj)} not serializable")
+
+    return json.dumps(value, default=default_serializer)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--positions", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    payload = build_payload(args.positions)
+    serialized = legacy_redis_serialize(payload)
+    cached = json.loads(serialized)
+    cases = {
+        "response: jsonable_encoder + JSONResponse": lambda: JSONResponse(
+            content=jsonable_encoder(payload)
+        ).body,
+        "response: ORJSONResponse": lambda: ORJSONResponse(content=payload).body,
+        "cache hit: jsonable_encoder + JSONResponse": lambda: JSONResponse(
+            content=jsonable_encoder(cached)
+        ).body,
+        "cache hit: ORJSONResponse": lambda: ORJSONResponse(content=cached).body,
+        "redis serialize: json.dumps": lambda: legacy_redis_serialize(payload),
+        "redis serialize: orjson": lambda: dumps(payload),
+        "redis deserialize: json.loads": lambda: json.loads(serialized),
+        "redis deserialize: orjson": lambda: orjson.loads(serialized),
+    }
+
+    print(f"{'case':<46}{'median ms':>11}{'p99 ms':>9}")
+    for label, fn in cases.items():
+        result = timed_runs(fn, repeat=args.repeat)
+        print(f"{label:<46}{result['median_ms']:>11.1f}{result['p99_ms']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
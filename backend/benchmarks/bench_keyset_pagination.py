@@ -0,0 +1,107 @@
+"""OFFSET vs keyset pagination on a large synthetic positions table.
+
+Seeds N positions with generate_series, then reports server-side execution time
+(EXPLAIN ANALYZE) of fetching pages 0, 100 and 1000 both ways.
+
+Usage: BENCH_DATABASE_URL=postgresql://... python -m benchmarks.bench_keyset_pagination --rows 1000000
+"""
+
+import argparse
+
+from sqlalchemy import text
+
+from app.db.crud import CRUDBase
+from app.models.positions import Positions
+from benchmarks.common import (
+    bench_engine,
+    bench_session,
+    explain_analyze,
+    seed_organizations,
+    seed_talenthub_users,
+)
+
+PAGES = [0, 100, 1000]
+
+SEED_SQL = """
+INSERT INTO positions (
+    id, user_id, organization_id, title, job_category, position_type,
+    level_of_experience, city, country, show_recruiter, created_at
+)
+SELECT
+    gen_random_uuid(),
+    (CAST(:recruiters AS uuid[]))[1 + (n % :recruiter_count)],
+    (CAST(:organizations AS uuid[]))[1 + (n % :recruiter_count)],
+    'Position ' || n,
+    'software-engineering',
+    'Full-Time',
+    'Mid',
+    'Austin',
+    'USA',
+    false,
+    now() - (n || ' seconds')::interval
+FROM generate_series(1, :rows) AS n
+"""
+
+
+def explain_ms(db, query) -> float:
+    return explain_analyze(db, query)["Execution Time"]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    crud = CRUDBase(model=Positions)
+    engine = bench_engine()
+    with bench_session(engine) as db:
+        recruiter_ids = seed_talenthub_users(db, 100)
+        organization_ids = seed_organizations(db, recruiter_ids)
+        db.execute(
+            text(SEED_SQL),
+            {
+                "recruiters": [str(id) for id in recruiter_ids],
+                "organizations": [str(id) for id in organization_ids],
+                "recruiter_count": len(recruiter_ids),
+                "rows": args.rows,
+            },
+        )
+        # Matches the keyset index added by the positions index migration
+        db.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_positions_created_at_id "
+                "ON positions (created_at DESC, id DESC)"
+            )
+        )
+        db.commit()
+        db.execute(text("ANALYZE positions"))
+
+        print(f"{'page':>6} {'offset ms':>10} {'keyset ms':>10}")
+        for page in PAGES:
+            offset_query = (
+                db.query(Positions)
+                .order_by(Positions.created_at.desc())
+                .offset(page * args.limit)
+                .limit(args.limit)
+            )
+            after = None
+            if page:
+                # The cursor a client would hold after reading the previous page
+                after = (
+                    db.query(Positions.created_at, Positions.id)
+                    .order_by(Positions.created_at.desc(), Positions.id.desc())
+                    .offset(page * args.limit - 1)
+                    .first()
+                )
+            keyset_query = crud._seek(db.query(Positions), "created_at", "desc", after).limit(
+                args.limit
+            )
+            print(
+                f"{page:>6} {explain_ms(db, offset_query):>10.2f} "
+                f"{explain_ms(db, keyset_query):>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Per-request overhead of MetricsMiddleware on a matched route.
+
+Times a no-op downstream app with and without the middleware, in-process with no
+database or network involved, so the difference is the cost of the two metric updates.
+
+Usage: python -m benchmarks.bench_metrics_overhead --requests 20000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from app.middleware.metrics import MetricsMiddleware
+from benchmarks.common import percentile
+from core.constants import constants
+
+ROUTE = Route(f"{constants.API_VERSION}/milestones/{{id}}", endpoint=lambda request: None)
+
+
+async def call_next(request):
+    return Response()
+
+
+async def passthrough(request, call_next):
+    return await call_next(request)
+
+
+def build_request() -> Request:
+    path = f"{constants.API_VERSION}/milestones/3fa85f64-5717-4562-b3fc-2c963f66afa6"
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [],
+        "server": ("testserver", 80),
+        "scheme": "http",
+        "route": ROUTE,
+    }
+    return Request(scope)
+
+
+async def measure(middleware, requests: int) -> list[float]:
+    samples = []
+    for _ in range(requests):
+        request = build_request()
+        start = time.perf_counter()
+        await middleware(request, call_next)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+async def main(requests: int) -> None:
+    print(f"{'middleware':<12}{'median us':>12}{'p99 us':>10}")
+    for name, middleware in (("none", passthrough), ("metrics", MetricsMiddleware())):
+        samples = await measure(middleware, requests)
+        print(f"{name:<12}{statistics.median(samples):>12.2f}{percentile(samples, 99):>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,74 @@
+"""Connection pool checkouts: overhead of the instrumented pool and waits under saturation.
+
+N threads each run queries of --query-ms against one engine with the production pool size
+(32 + 20 overflow). Throughput is compared between the plain QueuePool and
+InstrumentedQueuePool, and the instrumented run reports the checkout waits, overflow use
+and timeouts that GET /internal/metrics exposes, for thread counts below and above
+pool_size + max_overflow.
+
+Usage: BENCH_DATABASE_URL=postgresql://... python -m benchmarks.bench_pool_checkout
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import exc, text
+from sqlalchemy.pool import QueuePool
+
+from app.db.pool_metrics import InstrumentedQueuePool, instrument_engine, pool_metrics
+from benchmarks.common import bench_engine
+
+POOL_OPTIONS = {"pool_size": 32, "max_overflow": 20, "pool_timeout": 5, "pool_pre_ping": True}
+
+
+def run(poolclass, threads: int, queries: int, query_ms: float):
+    engine = bench_engine(poolclass=poolclass, **POOL_OPTIONS)
+    metrics = instrument_engine("bench", engine) if poolclass is InstrumentedQueuePool else None
+    peak_overflow = 0
+
+    def query(_):
+        nonlocal peak_overflow
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT pg_sleep(:seconds)"), {"seconds": query_ms / 1000})
+                peak_overflow = max(peak_overflow, engine.pool.overflow())
+        except exc.TimeoutError:
+            pass
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(query, range(queries)))
+    elapsed = time.perf_counter() - start
+
+    stats = metrics.snapshot() if metrics else None
+    pool_metrics.pop("bench", None)
+    engine.dispose()
+    return queries / elapsed, stats, peak_overflow
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, nargs="+", default=[16, 52, 100, 200])
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument("--query-ms", type=float, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'threads':>8}{'plain q/s':>11}{'instr q/s':>11}{'wait p50':>10}{'wait p99':>10}"
+        f"{'max ovf':>9}{'timeouts':>10}"
+    )
+    for threads in args.threads:
+        plain, _, _ = run(QueuePool, threads, args.queries, args.query_ms)
+        instrumented, stats, peak_overflow = run(
+            InstrumentedQueuePool, threads, args.queries, args.query_ms
+        )
+        wait = stats["checkout_wait_ms"]
+        print(
+            f"{threads:>8}{plain:>11.0f}{instrumented:>11.0f}{wait['p50']:>10.2f}"
+            f"{wait['p99']:>10.2f}{max(peak_overflow, 0):>9}{stats['checkout_timeouts']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
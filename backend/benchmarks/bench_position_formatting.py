@@ -0,0 +1,76 @@
+"""Compare per-row and bulk formatting of position pages.
+
+Usage: BENCH_DATABASE_URL=postgresql://... python -m benchmarks.bench_position_formatting
+"""
+
+import argparse
+
+from sqlalchemy import select
+
+from app.models.positions import Positions
+from app.services.positions import position_service
+from benchmarks.common import (
+    QueryCounter,
+    bench_engine,
+    bench_session,
+    seed_careerforge_user,
+    seed_organizations,
+    seed_positions,
+    seed_talenthub_users,
+    seed_tracked_jobs,
+    timed_runs,
+)
+
+PAGE_SIZES = [10, 100, 1000, 5000]
+
+
+def format_per_row(db, positions, user_id):
+    return [
+        position_service.format_positions_response(
+            positions=[position], db=db, include_stage=True, user_id=user_id
+        )[0]
+        for position in positions
+    ]
+
+
+def format_bulk(db, positions, user_id):
+    return position_service.format_positions_response(
+        positions=positions, db=db, include_stage=True, user_id=user_id
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--organizations", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = bench_engine()
+    with bench_session(engine) as db:
+        recruiter_ids = seed_talenthub_users(db, args.organizations)
+        organization_ids = seed_organizations(db, recruiter_ids)
+        seed_positions(db, max(PAGE_SIZES), organization_ids, recruiter_ids)
+        user_id = seed_careerforge_user(db)
+
+        job_ids = db.scalars(select(Positions.id).order_by(Positions.created_at.desc())).all()
+        seed_tracked_jobs(db, user_id, job_ids[::3])
+        all_positions = db.scalars(
+            select(Positions).order_by(Positions.created_at.desc()).limit(max(PAGE_SIZES))
+        ).all()
+
+        print(f"{'page':>6} {'mode':>8} {'queries':>8} {'median ms':>10} {'p99 ms':>8}")
+        for page_size in PAGE_SIZES:
+            positions = all_positions[:page_size]
+            for mode, formatter in (("per-row", format_per_row), ("bulk", format_bulk)):
+                with QueryCounter(engine) as counter:
+                    formatter(db, positions, user_id)
+
+                timings = timed_runs(lambda: formatter(db, positions, user_id), repeat=args.repeat)
+                print(
+                    f"{page_size:>6} {mode:>8} {counter.count:>8} "
+                    f"{timings['median_ms']:>10.1f} {timings['p99_ms']:>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
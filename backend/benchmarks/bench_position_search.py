@@ -0,0 +1,89 @@
+"""EXPLAIN-backed comparison of LIKE substring filters and full-text search.
+
+Usage: BENCH_DATABASE_URL=postgresql://... python -m benchmarks.bench_position_search --rows 200000
+"""
+
+import argparse
+
+from sqlalchemy import func, text
+
+from app.models.positions import Positions
+from benchmarks.common import (
+    bench_engine,
+    bench_session,
+    explain_analyze,
+    seed_organizations,
+    seed_positions,
+    seed_talenthub_users,
+)
+
+
+def scan_nodes(plan: dict) -> list[str]:
+    nodes = []
+    if "Scan" in plan["Node Type"]:
+        nodes.append(f"{plan['Node Type']}({plan.get('Index Name', plan.get('Relation Name'))})")
+    for child in plan.get("Plans", []):
+        nodes.extend(scan_nodes(child))
+    return nodes
+
+
+def like_query(db, column: str, value: str, limit: int):
+    return (
+        db.query(Positions)
+        .filter(func.lower(getattr(Positions, column)).like(f"%{value.lower()}%"))
+        .order_by(Positions.created_at.desc())
+        .limit(limit)
+    )
+
+
+def search_query(db, value: str, limit: int):
+    ts_query = func.websearch_to_tsquery("english", value)
+    return (
+        db.query(Positions)
+        .filter(Positions.search_vector.op("@@")(ts_query))
+        .order_by(func.ts_rank_cd(Positions.search_vector, ts_query).desc())
+        .order_by(Positions.created_at.desc())
+        .limit(limit)
+    )
+
+
+def report(label: str, db, query) -> None:
+    plan = explain_analyze(db, query)
+    print(f"{label:<32} {plan['Execution Time']:>10.2f}  {', '.join(scan_nodes(plan['Plan']))}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = bench_engine()
+    with bench_session(engine) as db:
+        recruiter_ids = seed_talenthub_users(db, 100)
+        organization_ids = seed_organizations(db, recruiter_ids)
+        seed_positions(db, args.rows, organization_ids, recruiter_ids)
+        db.execute(text("ANALYZE positions"))
+
+        print(f"{'query':<32} {'exec ms':>10}  scans")
+        report("title LIKE (no index)", db, like_query(db, "title", "solar", args.limit))
+        report("city LIKE (no index)", db, like_query(db, "city", "aus", args.limit))
+        report("q full-text (GIN)", db, search_query(db, "solar engineer", args.limit))
+
+        # Same trigram indexes as the search index migration
+        db.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for column in ("title", "city"):
+            db.execute(
+                text(
+                    f"CREATE INDEX ix_positions_{column}_trgm ON positions "
+                    f"USING gin (lower({column}) gin_trgm_ops)"
+                )
+            )
+        db.commit()
+        db.execute(text("ANALYZE positions"))
+        report("title LIKE (trigram GIN)", db, like_query(db, "title", "solar", args.limit))
+        report("city LIKE (trigram GIN)", db, like_query(db, "city", "aus", args.limit))
+
+
+if __name__ == "__main__":
+    main()
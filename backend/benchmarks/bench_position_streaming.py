@@ -0,0 +1,97 @@
+"""Peak RSS and time-to-first-byte of a careerforge page, buffered vs streamed.
+
+The buffered mode is the cache-miss path of the route: load and format the whole page, add
+stages, run jsonable_encoder and render a JSONResponse. The streamed mode consumes
+stream_positions_for_careerforge. Each cell runs in a fresh process so peak RSS is its own.
+
+Usage: BENCH_DATABASE_URL=postgresql://... python -m benchmarks.bench_position_streaming
+"""
+
+import argparse
+import multiprocessing
+import resource
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import sessionmaker
+
+from app.models.user import UserCareerforge
+from app.services.positions import position_service
+from benchmarks.common import (
+    bench_engine,
+    bench_session,
+    seed_careerforge_user,
+    seed_organizations,
+    seed_positions,
+    seed_talenthub_users,
+)
+
+PAGE_SIZES = [500, 2000, 5000]
+
+
+def buffered(db, user, limit: int) -> tuple[float, int]:
+    page = position_service._load_position_page(db=db, filters={}, page=0, limit=limit)
+    page = position_service.apply_stage_overlay(db=db, positions=page, user_id=user.id)
+    body = JSONResponse(content=jsonable_encoder(page)).body
+    # Nothing reaches the client before the whole body is rendered
+    return time.perf_counter(), len(body)
+
+
+def streamed(db, user, limit: int) -> tuple[float, int]:
+    first_byte = None
+    size = 0
+    for part in position_service.stream_positions_for_careerforge(
+        db=db, user=user, filters={}, page=0, limit=limit
+    ):
+        if first_byte is None and len(part) > 1:
+            first_byte = time.perf_counter()
+        size += len(part)
+    return first_byte or time.perf_counter(), size
+
+
+def run_cell(mode: str, limit: int, user_id, results) -> None:
+    db = sessionmaker(bind=bench_engine())()
+    user = db.get(UserCareerforge, user_id)
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    first_byte, size = (buffered if mode == "buffered" else streamed)(db, user, limit)
+    total = time.perf_counter() - start
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    db.close()
+    results.put(((first_byte - start) * 1000, total * 1000, (peak_kb - baseline_kb) / 1024, size))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--organizations", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = bench_engine()
+    with bench_session(engine) as db:
+        recruiter_ids = seed_talenthub_users(db, args.organizations)
+        organization_ids = seed_organizations(db, recruiter_ids)
+        seed_positions(db, max(PAGE_SIZES), organization_ids, recruiter_ids)
+        user_id = seed_careerforge_user(db)
+
+        ctx = multiprocessing.get_context("spawn")
+        print(
+            f"{'limit':>6}  {'mode':<10}{'TTFB ms':>9}{'total ms':>10}{'peak RSS +MB':>14}{'KB':>8}"
+        )
+        for limit in PAGE_SIZES:
+            for mode in ("buffered", "streamed"):
+                results = ctx.Queue()
+                process = ctx.Process(target=run_cell, args=(mode, limit, user_id, results))
+                process.start()
+                ttfb_ms, total_ms, peak_mb, size = results.get()
+                process.join()
+                print(
+                    f"{limit:>6}  {mode:<10}{ttfb_ms:>9.1f}{total_ms:>10.1f}"
+                    f"{peak_mb:>14.1f}{size / 1024:>8.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Bytes stored, network time and decode time per cache hit for cached position pages.
+
+Compares the old JSON text values with RedisCodec uncompressed and zlib-compressed, for page
+sizes up to 5000 positions, against a real Redis (set BENCH_REDIS_DB to a scratch db).
+
+Usage: BENCH_REDIS_DB=15 python -m benchmarks.bench_redis_codec
+"""
+
+import json
+import statistics
+import time
+
+from app.utils.redis_codec import RedisCodec
+from benchmarks.bench_cache_invalidation import redis_connection
+from benchmarks.bench_json_serialization import build_payload, legacy_redis_serialize
+from benchmarks.common import percentile
+
+PAGE_SIZES = [100, 1000, 5000]
+REPEAT = 50
+
+
+class LegacyCodec:
+    def encode(self, value) -> bytes:
+        return legacy_redis_serialize(value).encode()
+
+    def decode(self, data: bytes):
+        return json.loads(data)
+
+
+CODECS = {
+    "json text": LegacyCodec(),
+    "orjson": RedisCodec(compress_threshold=0),
+    "orjson+zlib": RedisCodec(compress_threshold=1),
+}
+
+
+def main():
+    conn = redis_connection()
+    conn.flushdb()
+
+    print(
+        f"{'page':>6}  {'codec':<13}{'stored KB':>10}{'GET ms':>9}{'GET p99':>9}{'decode ms':>11}"
+    )
+    for size in PAGE_SIZES:
+        payload = build_payload(size)
+        for name, codec in CODECS.items():
+            key = f"bench:positions:{size}:{name}"
+            conn.set(key, codec.encode(payload))
+            stored = conn.memory_usage(key)
+
+            network, decode = [], []
+            for _ in range(REPEAT):
+                start = time.perf_counter()
+                data = conn.get(key)
+                fetched = time.perf_counter()
+                codec.decode(data)
+                network.append((fetched - start) * 1000)
+                decode.append((time.perf_counter() - fetched) * 1000)
+
+            print(
+                f"{size:>6}  {name:<13}{stored / 1024:>10.0f}{statistics.median(network):>9.2f}"
+                f"{percentile(network, 99):>9.2f}{statistics.median(decode):>11.2f}"
+            )
+    conn.flushdb()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Throughput of concurrent profile picture uploads and event loop lag while they run.
+
+Compares calling boto3 directly from coroutines (the old behaviour) with AsyncS3Services
+for a few connection pool sizes. Point it at a local stand-in (moto server, minio) rather
+than a real bucket:
+
+    moto_server -p 5000 &
+    AWS_S3_ENDPOINT_URL=http://localhost:5000 python -m benchmarks.bench_s3_uploads
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+import boto3
+from botocore.config import Config
+
+from app.services.s3_services import AsyncS3Services, S3Services
+from benchmarks.common import percentile
+from core.config import settings
+
+BUCKET = os.getenv("BENCH_S3_BUCKET", "bench-profile-pictures")
+
+
+def make_services(pool_size: int) -> S3Services:
+    client = boto3.client(
+        "s3",
+        endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+        config=Config(max_pool_connections=pool_size),
+    )
+    return S3Services(s3_client=client)
+
+
+async def measure_lag(stop: asyncio.Event, samples: list[float], interval: float = 0.005):
+    """How late the loop wakes a sleeping task, i.e. how long other requests would wait"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append((time.perf_counter() - start - interval) * 1000)
+
+
+async def run(mode: str, pool_size: int, uploads: int, concurrency: int, payload: bytes) -> dict:
+    services = make_services(pool_size)
+    async_services = AsyncS3Services(services, max_concurrency=pool_size)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def upload(i: int):
+        async with semaphore:
+            kwargs = dict(
+                bucket_name=BUCKET,
+                object_key=f"{i}/profile.png",
+                file_content=payload,
+                content_type="image/png",
+            )
+            if mode == "blocking":
+                services.upload_file_content(**kwargs)
+            else:
+                await async_services.upload_file_content(**kwargs)
+
+    lag = []
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(measure_lag(stop, lag))
+    started = time.perf_counter()
+    await asyncio.gather(*(upload(i) for i in range(uploads)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await lag_task
+    return {"uploads_s": uploads / elapsed, "lag_p99_ms": percentile(lag or [0.0], 99)}
+
+
+def main(args) -> None:
+    make_services(1).s3_client.create_bucket(Bucket=BUCKET)
+    payload = os.urandom(args.size_kb * 1024)
+
+    print(f"{'mode':<10}{'pool':>6}{'uploads/s':>11}{'loop lag p99 ms':>17}")
+    for mode, pool_size in [("blocking", 10)] + [("offloaded", size) for size in args.pools]:
+        result = asyncio.run(run(mode, pool_size, args.uploads, args.concurrency, payload))
+        print(f"{mode:<10}{pool_size:>6}{result['uploads_s']:>11.1f}{result['lag_p99_ms']:>17.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--uploads", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--size-kb", type=int, default=300)
+    parser.add_argument("--pools", type=int, nargs="*", default=[10, 25, 50])
+    main(parser.parse_args())
@@ -0,0 +1,65 @@
+"""Sector job counts: GROUP BY per request vs the incrementally maintained Redis hash.
+
+Usage: BENCH_DATABASE_URL=postgresql://... BENCH_REDIS_DB=15 \
+    python -m benchmarks.bench_sector_counts --positions 1000000
+"""
+
+import argparse
+
+from app.models.organization import Organizations
+from app.models.positions import Positions
+from app.services.sector_counts import SectorCountService
+from app.utils.redis_utils import RedisClient
+from benchmarks.bench_cache_invalidation import redis_connection
+from benchmarks.common import (
+    bench_engine,
+    bench_session,
+    seed_organizations,
+    seed_positions,
+    seed_talenthub_users,
+    timed_runs,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--organizations", type=int, default=2000)
+    parser.add_argument("--positions", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    conn = redis_connection()
+    conn.flushdb()
+    service = SectorCountService(RedisClient(connection=conn), reconcile_interval=600)
+
+    engine = bench_engine()
+    with bench_session(engine) as db:
+        recruiter_ids = seed_talenthub_users(db, args.organizations)
+        organization_ids = seed_organizations(db, recruiter_ids)
+        seed_positions(db, args.positions, organization_ids, recruiter_ids)
+
+        group_by = timed_runs(
+            lambda: service.positions_crud.get_sector_counts(
+                db=db, organization_model=Organizations, position_model=Positions
+            ),
+            repeat=args.repeat,
+        )
+        rebuild = timed_runs(lambda: service.rebuild(db), repeat=args.repeat)
+        service.rebuild(db)
+        hash_read = timed_runs(lambda: service.get_counts(db), repeat=args.repeat)
+        increment = timed_runs(lambda: service.increment("clean_tech"), repeat=args.repeat)
+        service.reconcile(db)
+
+    print(f"{'operation':<30}{'median ms':>11}{'p99 ms':>9}")
+    for label, result in (
+        ("GROUP BY per request", group_by),
+        ("hash read (per request)", hash_read),
+        ("increment (per create)", increment),
+        ("rebuild (per reconcile)", rebuild),
+    ):
+        print(f"{label:<30}{result['median_ms']:>11.2f}{result['p99_ms']:>9.2f}")
+    conn.flushdb()
+
+
+if __name__ == "__main__":
+    main()
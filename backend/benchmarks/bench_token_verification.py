@@ -0,0 +1,84 @@
+"""Middleware throughput with and without the verified-token cache.
+
+Replays authenticated requests from a pool of users through ValidationMiddleware, either
+as fast as possible or paced at fixed request rates, and reports achieved throughput and
+per-request latency. Revocations are checked in memory, so no Redis is needed.
+
+Usage: python -m benchmarks.bench_token_verification --users 1000 --rates 2000 5000 10000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from unittest import mock
+
+import app.middleware.auth as auth_middleware
+from app.middleware.auth import ValidationMiddleware
+from app.schemas.user import Platform
+from app.utils.security import _decode_token, create_access_token, token_cache
+from benchmarks.bench_auth_middleware import API_VERSION, build_request, call_next
+from benchmarks.common import percentile
+
+PATH = f"{API_VERSION}/positions/careerforge"
+
+
+def verify_without_cache(token: str) -> tuple[str, str]:
+    payload = _decode_token(token)
+    return payload["sub"], payload["platform"]
+
+
+async def replay(middleware, tokens: list[str], requests: int, rate: float = 0) -> dict:
+    samples = []
+    interval = 1 / rate if rate else 0
+    started = time.perf_counter()
+    for i in range(requests):
+        if interval:
+            # Pace against the schedule so a slow request does not lower the offered rate
+            delay = started + i * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        request = build_request("GET", PATH, tokens[i % len(tokens)])
+        start = time.perf_counter()
+        await middleware(request, call_next)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    elapsed = time.perf_counter() - started
+    return {
+        "rps": requests / elapsed,
+        "median_us": statistics.median(samples),
+        "p99_us": percentile(samples, 99),
+    }
+
+
+async def main(users: int, requests: int, rates: list[int]) -> None:
+    tokens = [
+        create_access_token(subject=f"bench-{i}@example.com", platform=Platform.careerforge)
+        for i in range(users)
+    ]
+    middleware = ValidationMiddleware()
+
+    print(f"{'mode':<10}{'offered rps':>12}{'achieved rps':>14}{'median us':>11}{'p99 us':>9}")
+    for rate in [0, *rates]:
+        for mode in ("decode", "cached"):
+            token_cache.clear()
+            if mode == "decode":
+                with mock.patch.object(auth_middleware, "verify_token", verify_without_cache):
+                    result = await replay(middleware, tokens, requests, rate)
+            else:
+                # Warm the cache once, as a long-lived worker would be
+                await replay(middleware, tokens, users)
+                result = await replay(middleware, tokens, requests, rate)
+            offered = str(rate) if rate else "max"
+            print(
+                f"{mode:<10}{offered:>12}{result['rps']:>14.0f}"
+                f"{result['median_us']:>11.1f}{result['p99_us']:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--rates", type=int, nargs="*", default=[2000, 5000, 10000])
+    args = parser.parse_args()
+    asyncio.run(main(args.users, args.requests, args.rates))
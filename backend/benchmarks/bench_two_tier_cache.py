@@ -0,0 +1,59 @@
+"""Cost of a careerforge cache hit served from Redis vs the in-process L1.
+
+Each hit includes the generation lookup and the key read, which is what
+get_positions_for_careerforge pays before the stage overlay. "redis" is the cache with the
+listener stopped (generation and page read from Redis every time), "l1" is a subscribed
+worker. Runs against a real Redis; set BENCH_REDIS_DB to a scratch db.
+
+Usage: BENCH_REDIS_DB=15 python -m benchmarks.bench_two_tier_cache
+"""
+
+import time
+
+from app.utils.cache_utils import TwoTierCache
+from app.utils.redis_utils import RedisClient
+from benchmarks.bench_cache_invalidation import redis_connection
+from benchmarks.bench_json_serialization import build_payload
+from benchmarks.common import timed_runs
+
+PAGE_SIZES = [20, 1000, 5000]
+NAMESPACE = "bench:positions:careerforge"
+REPEAT = 200
+
+
+def make_cache(maxsize: int) -> TwoTierCache:
+    client = RedisClient(connection=redis_connection())
+    return TwoTierCache(client, maxsize=maxsize, ttl=60, getsizeof=len)
+
+
+def hit(cache: TwoTierCache, size: int):
+    generation = cache.get_generation(NAMESPACE)
+    return cache.get(f"{NAMESPACE}:v{generation}:page_0:limit_{size}")
+
+
+def main():
+    conn = redis_connection()
+    conn.flushdb()
+
+    print(f"{'page':>6}  {'tier':<7}{'median ms':>11}{'p99 ms':>9}")
+    for size in PAGE_SIZES:
+        for tier in ("redis", "l1"):
+            # A zero-sized L1 keeps every hit on the Redis path
+            cache = make_cache(maxsize=0 if tier == "redis" else size)
+            if tier == "l1":
+                cache.start_listener()
+                while not cache._subscribed:
+                    time.sleep(0.01)
+            generation = cache.get_generation(NAMESPACE)
+            cache.redis.set_with_expiry(
+                f"{NAMESPACE}:v{generation}:page_0:limit_{size}", build_payload(size)
+            )
+
+            result = timed_runs(lambda: hit(cache, size), repeat=REPEAT)
+            cache.stop_listener()
+            print(f"{size:>6}  {tier:<7}{result['median_ms']:>11.3f}{result['p99_ms']:>9.3f}")
+    conn.flushdb()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+import json
+import os
+import statistics
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import psycopg2.extras
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base_class import Base
+
+# Imported so UserCareerforge relationship() targets resolve when the mappers configure
+from app.models import experience, milestones  # noqa: F401
+from app.models.organization import Organizations
+from app.models.positions import Positions
+from app.models.tracked_jobs import TrackedJobs
+from app.models.user import BaseUser, UserCareerforge, UserTalenthub
+from core.config import settings
+
+BENCH_DATABASE_URL = os.getenv("BENCH_DATABASE_URL", settings.SQLALCHEMY_DATABASE_URI)
+
+
+def bench_engine(**kwargs):
+    return create_engine(BENCH_DATABASE_URL, **kwargs)
+
+
+@contextmanager
+def bench_session(engine, keep: bool = False):
+    """Create the schema, yield a session and drop everything afterwards"""
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        yield db
+    finally:
+        db.close()
+        if not keep:
+            Base.metadata.drop_all(engine)
+
+
+class QueryCounter:
+    """Counts statements executed on an engine while active"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _before_cursor_execute(self, *args, **kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._before_cursor_execute)
+
+
+def explain_analyze(db, statement) -> dict:
+    """Run EXPLAIN ANALYZE for a Query/Select and return the JSON plan"""
+    psycopg2.extras.register_uuid()
+    if hasattr(statement, "statement"):
+        statement = statement.statement
+    compiled = statement.compile(dialect=db.bind.dialect)
+    plan = (
+        db.connection()
+        .exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {compiled}", compiled.params)
+        .scalar()
+    )
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def timed_runs(fn, repeat: int = 5) -> dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": statistics.median(samples),
+        "p99_ms": percentile(samples, 99),
+    }
+
+
+def seed_talenthub_users(db, count: int) -> list[uuid.UUID]:
+    base_rows = [
+        {
+            "id": uuid.uuid4(),
+            "provider": "self",
+            "provider_id": f"bench-{i}",
+            "platform": "talenthub",
+        }
+        for i in range(count)
+    ]
+    db.execute(insert(BaseUser), base_rows)
+    user_rows = [
+        {
+            "id": uuid.uuid4(),
+            "base_user_id": row["id"],
+            "email": f"recruiter-{i}-{row['id'].hex[:8]}@bench.local",
+            "password_hash": "bench",
+            "first_name": "Bench",
+            "last_name": f"Recruiter {i}",
+            "current_job_title": "Recruiter",
+        }
+        for i, row in enumerate(base_rows)
+    ]
+    db.execute(insert(UserTalenthub), user_rows)
+    db.commit()
+    return [row["id"] for row in user_rows]
+
+
+def seed_careerforge_user(db) -> uuid.UUID:
+    base_user_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+    db.execute(
+        insert(BaseUser),
+        [
+            {
+                "id": base_user_id,
+                "provider": "self",
+                "provider_id": "bench",
+                "platform": "careerforge",
+            }
+        ],
+    )
+    db.execute(
+        insert(UserCareerforge),
+        [
+            {
+                "id": user_id,
+                "base_user_id": base_user_id,
+                "email": f"candidate-{user_id.hex[:8]}@bench.local",
+                "password_hash": "bench",
+            }
+        ],
+    )
+    db.commit()
+    return user_id
+
+
+def seed_organizations(db, recruiter_ids: list[uuid.UUID]) -> list[uuid.UUID]:
+    sectors = ["clean_tech", "renewable_power", "eco_farming", "green_education"]
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "created_by": recruiter_id,
+            "name": f"Bench Organization {i}",
+            "type": "Company",
+            "size": "50-100",
+            "location": "Remote",
+            "sector_focus": sectors[i % len(sectors)],
+            "logo_url": f"logos/{i}.png",
+        }
+        for i, recruiter_id in enumerate(recruiter_ids)
+    ]
+    db.execute(insert(Organizations), rows)
+    db.commit()
+    return [row["id"] for row in rows]
+
+
+def seed_positions(
+    db,
+    count: int,
+    organization_ids: list[uuid.UUID],
+    recruiter_ids: list[uuid.UUID],
+    batch_size: int = 10000,
+) -> None:
+    """Insert synthetic positions spread across organizations, newest first"""
+    titles = ["Solar Engineer", "Data Analyst", "Policy Advocate", "Product Manager"]
+    cities = ["Austin", "Denver", "Portland", "Boston"]
+    now = datetime.now(timezone.utc)
+    for batch_start in range(0, count, batch_size):
+        rows = []
+        for i in range(batch_start, min(batch_start + batch_size, count)):
+            owner = i % len(organization_ids)
+            rows.append(
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": recruiter_ids[owner],
+                    "organization_id": organization_ids[owner],
+                    "title": f"{titles[i % len(titles)]} {i}",
+                    "job_category": "software-engineering",
+                    "position_type": "Full-Time",
+                    "level_of_experience": "Mid",
+                    "role_description": "Help us build climate infrastructure.",
+                    "workplace_type": "Remote",
+                    "city": cities[i % len(cities)],
+                    "country": "USA",
+                    "minimum_pay": 50000 + i % 50000,
+                    "maximum_pay": 100000 + i % 50000,
+                    "show_recruiter": i % 2 == 0,
+                    "created_at": now - timedelta(seconds=i),
+                }
+            )
+        db.execute(insert(Positions), rows)
+        db.commit()
+
+
+def seed_tracked_jobs(db, user_id: uuid.UUID, job_ids: list[uuid.UUID]) -> None:
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "user_id": user_id,
+            "job_id": job_id,
+            "stage": {"saved": True},
+            "is_favourite": False,
+        }
+        for job_id in job_ids
+    ]
+    if rows:
+        db.execute(insert(TrackedJobs), rows)
+        db.commit()
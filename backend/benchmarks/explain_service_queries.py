@@ -0,0 +1,168 @@
+"""Record EXPLAIN ANALYZE plans for the query shapes issued by the services.
+
+Runs against an existing, migrated database so the same data can be measured at
+two revisions:
+
+    python -m benchmarks.explain_service_queries --seed 200000 --output before.json
+    alembic upgrade head
+    python -m benchmarks.explain_service_queries --output after.json
+    python -m benchmarks.explain_service_queries --compare before.json after.json
+"""
+
+import argparse
+import json
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import sessionmaker
+
+from app.db.crud import CRUDBase
+from app.models.experience import Experiences
+from app.models.milestones import Milestones
+from app.models.organization import Organizations
+from app.models.positions import Positions
+from app.models.tracked_jobs import TrackedJobs
+from app.models.user import UserCareerforge, UserFiles
+from benchmarks.common import (
+    bench_engine,
+    explain_analyze,
+    seed_careerforge_user,
+    seed_organizations,
+    seed_positions,
+    seed_talenthub_users,
+    seed_tracked_jobs,
+)
+
+positions_crud = CRUDBase(model=Positions)
+
+
+def service_queries(db) -> dict:
+    """Query shapes from CRUDBase and the services, with parameters sampled from the data"""
+    organization_id = db.query(Organizations.id).limit(1).scalar()
+    user = db.query(UserCareerforge).limit(1).one()
+    page = db.query(Positions.id, Positions.organization_id).limit(20).all()
+    page_ids = [row.id for row in page]
+    page_organization_ids = list({row.organization_id for row in page})
+    after = (
+        db.query(Positions.created_at, Positions.id)
+        .order_by(Positions.created_at.desc(), Positions.id.desc())
+        .offset(2000)
+        .first()
+    )
+    listing = dict(organization_model=Organizations, limit=20, offset=0)
+
+    return {
+        "careerforge_listing": positions_crud.filtered_positions_query(db, **listing),
+        "careerforge_listing_deep_offset": positions_crud.filtered_positions_query(
+            db, **{**listing, "offset": 2000}
+        ),
+        "careerforge_listing_keyset": positions_crud.filtered_positions_query(
+            db, **listing, keyset=True, after=after
+        ),
+        "careerforge_job_category": positions_crud.filtered_positions_query(
+            db, filters={"job_category": ["software-engineering"]}, **listing
+        ),
+        "careerforge_city_like": positions_crud.filtered_positions_query(
+            db, filters={"city": "aus"}, **listing
+        ),
+        "careerforge_search": positions_crud.filtered_positions_query(
+            db, search="solar engineer", **listing
+        ),
+        "organization_name_like": db.query(Organizations).filter(
+            func.lower(Organizations.name).like("%organization 1%")
+        ),
+        "talenthub_listing": positions_crud._seek(
+            db.query(Positions).filter(Positions.organization_id == organization_id),
+            "created_at",
+            "desc",
+        ).limit(20),
+        "format_organizations": db.query(Organizations).filter(
+            Organizations.id.in_(page_organization_ids)
+        ),
+        "stage_overlay": db.query(TrackedJobs.job_id, TrackedJobs.stage).filter(
+            TrackedJobs.user_id == user.id, TrackedJobs.job_id.in_(page_ids)
+        ),
+        "sector_counts": db.query(Organizations.sector_focus, func.count(Positions.id))
+        .join(Positions, Organizations.id == Positions.organization_id)
+        .filter(Organizations.sector_focus.isnot(None))
+        .group_by(Organizations.sector_focus),
+        "user_milestones": db.query(Milestones)
+        .filter(Milestones.user_id == user.id)
+        .order_by(Milestones.created_at.asc()),
+        "user_experiences": db.query(Experiences).filter(Experiences.user_id == user.id),
+        "user_file_lookup": db.query(UserFiles).filter(
+            UserFiles.user_id == user.id, UserFiles.file_name == "resume.pdf"
+        ),
+        "active_user_lookup": db.query(UserCareerforge).filter(UserCareerforge.email == user.email),
+    }
+
+
+def scan_nodes(plan: dict) -> list[str]:
+    nodes = []
+    if "Scan" in plan["Node Type"]:
+        nodes.append(f"{plan['Node Type']}({plan.get('Index Name', plan.get('Relation Name'))})")
+    for child in plan.get("Plans", []):
+        nodes.extend(scan_nodes(child))
+    return nodes
+
+
+def record(db, output: str) -> None:
+    db.execute(text("ANALYZE"))
+    results = {}
+    for name, query in service_queries(db).items():
+        plan = explain_analyze(db, query)
+        results[name] = {
+            "execution_ms": plan["Execution Time"],
+            "scans": scan_nodes(plan["Plan"]),
+            "plan": plan,
+        }
+        print(f"{name:<34} {plan['Execution Time']:>10.2f}  {', '.join(results[name]['scans'])}")
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2, default=str)
+
+
+def compare(before_path: str, after_path: str) -> None:
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+    print(f"{'query':<34} {'before ms':>10} {'after ms':>10}  after scans")
+    for name in before:
+        if name not in after:
+            continue
+        print(
+            f"{name:<34} {before[name]['execution_ms']:>10.2f} "
+            f"{after[name]['execution_ms']:>10.2f}  {', '.join(after[name]['scans'])}"
+        )
+
+
+def seed(db, rows: int) -> None:
+    recruiter_ids = seed_talenthub_users(db, 500)
+    organization_ids = seed_organizations(db, recruiter_ids)
+    seed_positions(db, rows, organization_ids, recruiter_ids)
+    user_id = seed_careerforge_user(db)
+    job_ids = [row.id for row in db.query(Positions.id).limit(500)]
+    seed_tracked_jobs(db, user_id, job_ids)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", type=int, default=0, help="Insert this many synthetic positions")
+    parser.add_argument("--output", default="explain_plans.json")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    db = sessionmaker(bind=bench_engine())()
+    try:
+        if args.seed:
+            seed(db, args.seed)
+        record(db, args.output)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
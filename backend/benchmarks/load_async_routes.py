@@ -0,0 +1,170 @@
+"""Load test: a DB-bound read route served from a sync Session vs an AsyncSession.
+
+One uvicorn worker serves the public position read both ways against the bench database:
+GET /sync/{id} runs the previous handler (sync Session, anyio thread pool) and
+GET /async/{id} the new one (AsyncSession on the event loop). Both engines get the
+production pool (32 + 20 overflow). --db-latency-ms adds a pg_sleep per request to stand in
+for a slower query or a remote database. Each mode is then hit by --concurrency
+simultaneous connections.
+
+Usage: BENCH_DATABASE_URL=postgresql://... python -m benchmarks.load_async_routes \
+    --concurrency 500 --requests 10000
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.session import async_database_uri
+from app.services.positions import position_service
+from app.utils.responses import ORJSONResponse
+from benchmarks.common import (
+    BENCH_DATABASE_URL,
+    bench_engine,
+    bench_session,
+    percentile,
+    seed_organizations,
+    seed_positions,
+    seed_talenthub_users,
+)
+
+PORT = 8765
+# Read by the server process, which main() starts with --db-latency-ms in its environment
+DB_LATENCY_MS = float(os.getenv("BENCH_DB_LATENCY_MS", "20"))
+
+sync_session = sessionmaker(bind=bench_engine(pool_size=32, max_overflow=20))
+async_session = async_sessionmaker(
+    bind=create_async_engine(async_database_uri(BENCH_DATABASE_URL), pool_size=32, max_overflow=20),
+    expire_on_commit=False,
+)
+
+
+def get_sync_db():
+    db = sync_session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    async with async_session() as db:
+        yield db
+
+
+bench_app = FastAPI()
+
+
+@bench_app.get("/sync/{id}")
+def read_sync(id: str, db: Session = Depends(get_sync_db)):
+    db.execute(text("SELECT pg_sleep(:seconds)"), {"seconds": DB_LATENCY_MS / 1000})
+    position = position_service.get_single_position(db=db, position_id=id)
+    return ORJSONResponse(
+        position_service.format_position_response(position=position, db=db, include_stage=False)
+    )
+
+
+@bench_app.get("/async/{id}")
+async def read_async(id: str, db: AsyncSession = Depends(get_async_db)):
+    await db.execute(text("SELECT pg_sleep(:seconds)"), {"seconds": DB_LATENCY_MS / 1000})
+    position = await position_service.get_single_position_async(db=db, position_id=id)
+    response = await position_service.format_positions_response_async(positions=[position], db=db)
+    return ORJSONResponse(response[0])
+
+
+async def load(mode: str, position_ids: list, requests: int, concurrency: int) -> dict:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    latencies, errors = [], 0
+    queue = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(position_ids[i % len(position_ids)])
+
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{PORT}", limits=limits, timeout=120
+    ) as client:
+
+        async def connection():
+            nonlocal errors
+            while not queue.empty():
+                position_id = queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.get(f"/{mode}/{position_id}")
+                latencies.append((time.perf_counter() - start) * 1000)
+                errors += response.status_code != 200
+
+        start = time.perf_counter()
+        await asyncio.gather(*(connection() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "rps": requests / elapsed,
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        "errors": errors,
+    }
+
+
+def wait_for_server() -> None:
+    for _ in range(100):
+        try:
+            httpx.get(f"http://127.0.0.1:{PORT}/docs")
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise RuntimeError("bench server did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--db-latency-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    engine = bench_engine()
+    with bench_session(engine) as db:
+        recruiter_ids = seed_talenthub_users(db, 50)
+        organization_ids = seed_organizations(db, recruiter_ids)
+        seed_positions(db, 1000, organization_ids, recruiter_ids)
+        position_ids = [str(row[0]) for row in db.execute(text("SELECT id FROM positions"))]
+
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "benchmarks.load_async_routes:bench_app",
+                "--port",
+                str(PORT),
+                "--log-level",
+                "warning",
+                "--limit-concurrency",
+                str(args.concurrency * 2),
+            ],
+            env={**os.environ, "BENCH_DB_LATENCY_MS": str(args.db_latency_ms)},
+        )
+        try:
+            wait_for_server()
+            print(f"{'mode':<7}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'errors':>8}")
+            for mode in ("sync", "async"):
+                result = asyncio.run(load(mode, position_ids, args.requests, args.concurrency))
+                print(
+                    f"{mode:<7}{result['rps']:>9.0f}{result['p50']:>9.1f}"
+                    f"{result['p99']:>9.1f}{result['errors']:>8}"
+                )
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
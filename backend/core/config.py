@@ -30,8 +30,28 @@ class Settings(BaseSettings):
 
     # DB
     SQLALCHEMY_DATABASE_URI: Optional[str] = os.environ["SQLALCHEMY_DATABASE_URI"]
+    # Read replicas as a JSON list; read-only routes use them when set
+    SQLALCHEMY_REPLICA_URIS: list[str] = []
+    READ_YOUR_WRITES_WINDOW: int = 5  # seconds a user's reads stay on the primary after a write
+    # Per engine and per process: a sync and an async engine per database, so each worker
+    # holds up to 2 x (size + overflow) connections to the primary and to each replica
+    DB_POOL_SIZE: int = 32
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30  # seconds a checkout waits for a connection before failing
+    DB_POOL_RECYCLE: int = -1  # seconds before a connection is replaced, -1 = never
+    DB_POOL_PRE_PING: bool = True
+
+    # Internal endpoints (pool and cache metrics) are disabled until a token is set
+    INTERNAL_METRICS_TOKEN: Optional[str] = None
 
     AWS_S3_BUCKET: Optional[str] = os.environ["AWS_S3_BUCKET"]
+    AWS_S3_ENDPOINT_URL: Optional[str] = None  # e.g. a moto/minio stand-in for local runs
+    S3_MAX_POOL_CONNECTIONS: int = 50  # also caps concurrent S3 calls offloaded to threads
+    PRESIGNED_URL_CACHE_MAX_SIZE: int = 10000
+    PRESIGNED_URL_CACHE_MARGIN: int = 300  # stop handing out a cached URL this long before expiry
+    # Longest a cached URL is reused; also how long other workers may keep serving the URL
+    # of an object overwritten elsewhere, since invalidation is per process
+    PRESIGNED_URL_CACHE_TTL: int = 300
 
     # google
     GOOGLE_PROJECT_ID: Optional[str] = os.environ["GOOGLE_PROJECT_ID"]
@@ -47,6 +67,27 @@ class Settings(BaseSettings):
     REDIS_PASSWORD: str = ""  # Add password if needed
     REDIS_SSL: bool = False
     REDIS_CACHE_EXPIRY: int = 300  # 5 minutes default
+    REDIS_COMPRESSION_THRESHOLD: int = 16 * 1024  # bytes of JSON before zlib kicks in, 0 = off
+    REDIS_COMPRESSION_LEVEL: int = 1
+
+    # In-process L1 in front of Redis for position listings (per process)
+    POSITION_L1_CACHE_TTL: int = 30  # seconds
+    POSITION_L1_CACHE_MAX_POSITIONS: int = 20000  # summed over all cached pages
+    POSITION_CACHE_LOCK_TTL: int = 30  # seconds one worker may hold a page computation
+    POSITION_CACHE_EARLY_REFRESH_BETA: float = 1.0  # >1 refreshes earlier, 0 disables
+    SECTOR_COUNTS_RECONCILE_INTERVAL: int = 600  # seconds between rebuilds from the database
+
+    # Resolved-user cache (per process)
+    USER_CACHE_TTL: int = 30  # seconds
+    USER_CACHE_MAX_SIZE: int = 10000
+
+    # Verified JWT cache (per process)
+    TOKEN_CACHE_TTL: int = 60  # seconds
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+
+    # Profile picture processing pool (per process)
+    IMAGE_PROCESSING_WORKERS: int = 2
+    IMAGE_PROCESSING_MAX_PENDING: int = 8  # queued + running jobs before returning 503
 
 
 settings = Settings()
@@ -21,6 +21,9 @@ class Constants(BaseSettings):
         ["POST", f"{API_VERSION}/user/password-reset"],
         ["GET", f"{API_VERSION}/user/public/{{id:uuid}}"],
         ["GET", f"{API_VERSION}/positions/public/{{id:uuid}}"],
+        # Token-guarded by verify_internal_token instead of a JWT
+        ["GET", f"{API_VERSION}/internal/metrics"],
+        ["GET", "/metrics"],
     ]
 
     BASE_JOB_STAGES: dict = {
@@ -59,6 +62,7 @@ class ERROR_MESSAGES(BaseSettings):
     VALIDATION_ERROR: str = "Validation error"
     PERMISSION_DENIED: str = "Permission denied"
     CONFLICT_ERROR: str = "Conflict error"
+    SERVICE_UNAVAILABLE: str = "Service temporarily unavailable, please retry shortly"
 
     INVALID_USER_EXCEPTION: dict = {
         "EMAIL_NOT_FOUND": "Email not found",
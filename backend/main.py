@@ -6,8 +6,16 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.openapi.utils import get_openapi
 
+from app.api.internal import metrics_router
 from app.middleware.auth import ValidationMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.query_stats import QUERY_COUNT_HEADER, QUERY_TIME_HEADER, QueryStatsMiddleware
 from app.routes import router as api_router
+from app.services.sector_counts import sector_count_service
+from app.utils.cache_utils import position_cache
+from app.utils.image_utils import image_processing_pool
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.utils.security import token_cache
 from core.config import settings
 from core.constants import constants
 from core.logger import logger
@@ -60,10 +68,50 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
+
+@app.on_event("startup")
+def start_cache_invalidation_listener():
+    position_cache.start_listener()
+
+
+@app.on_event("startup")
+def start_token_revocation_listener():
+    token_cache.start_listener()
+
+
+@app.on_event("startup")
+def start_sector_count_reconciler():
+    sector_count_service.start_reconciler()
+
+
+@app.on_event("shutdown")
+def shutdown_image_processing_pool():
+    image_processing_pool.shutdown()
+
+
+@app.on_event("shutdown")
+def stop_cache_invalidation_listener():
+    position_cache.stop_listener()
+
+
+@app.on_event("shutdown")
+def stop_token_revocation_listener():
+    token_cache.stop_listener()
+
+
+@app.on_event("shutdown")
+def stop_sector_count_reconciler():
+    sector_count_service.stop_reconciler()
+
+
 app.include_router(api_router)
+app.include_router(metrics_router)
 
 validation_middleware = ValidationMiddleware()
 app.middleware("http")(validation_middleware)
+if environment != constants.APP_EXECUTION_ENV["PRODUCTION"]:
+    app.middleware("http")(QueryStatsMiddleware())
+app.middleware("http")(MetricsMiddleware())
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 app.add_middleware(
@@ -72,6 +120,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, QUERY_COUNT_HEADER, QUERY_TIME_HEADER],
 )
 
 if __name__ == "__main__":